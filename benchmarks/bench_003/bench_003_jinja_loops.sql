@@ -0,0 +1,28 @@
+{% set metrics = ["clicks", "views", "sessions", "purchases", "refunds", "signups", "logins", "shares"] %}
+{% set periods = range(1, 8) %}
+with daily as (
+    select
+        event_date,
+        user_id
+        {%- for metric in metrics %}
+        {%- for day in periods %}
+        , sum(case when event_type = '{{ metric }}' and day_offset = {{ day }} then 1 else 0 end) as {{ metric }}_day_{{ day }}
+        {%- endfor %}
+        {%- endfor %}
+    from events
+    group by event_date, user_id
+)
+
+select
+    event_date
+    {%- for metric in metrics %}
+    {%- for day in periods %}
+    {%- if day % 7 == 0 %}
+    , sum({{ metric }}_day_{{ day }}) as {{ metric }}_week_{{ day // 7 }}
+    {%- else %}
+    , max({{ metric }}_day_{{ day }}) as {{ metric }}_max_day_{{ day }}
+    {%- endif %}
+    {%- endfor %}
+    {%- endfor %}
+from daily
+group by event_date
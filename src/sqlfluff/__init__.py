@@ -1,15 +1,6 @@
 """Sqlfluff is a SQL linter for humans."""
 import sys
-import pytest
-
-# Expose the public API.
-from sqlfluff.api import lint, fix, parse, list_rules, list_dialects
-
-# Import metadata (using importlib_metadata backport for python versions <3.8)
-if sys.version_info >= (3, 8):
-    from importlib import metadata
-else:
-    import importlib_metadata as metadata
+from typing import Any
 
 __all__ = (
     "lint",
@@ -19,8 +10,36 @@ __all__ = (
     "list_dialects",
 )
 
-# Get the current version
-__version__ = metadata.version("sqlfluff")
+
+def _get_version() -> str:
+    # Import metadata (using importlib_metadata backport for python versions <3.8)
+    if sys.version_info >= (3, 8):
+        from importlib import metadata
+    else:
+        import importlib_metadata as metadata
+
+    return metadata.version("sqlfluff")
+
+
+def __getattr__(name: str) -> Any:
+    """Load the public API and version on first access.
+
+    NOTE: These are loaded lazily so that lightweight entry points (like
+    the client for `sqlfluff serve`) don't pay to import the whole of
+    sqlfluff when they start.
+    """
+    global __version__
+    if name == "__version__":
+        # Get the current version
+        __version__ = _get_version()
+        return __version__
+    if name in __all__:
+        # Expose the public API.
+        import sqlfluff.api
+
+        return getattr(sqlfluff.api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Check major python version
 if sys.version_info[0] < 3:
@@ -29,8 +48,14 @@ if sys.version_info[0] < 3:
 elif sys.version_info[1] < 7:
     raise Exception(
         "Sqlfluff %s only supports Python 3.7 and beyond. "
-        "Use an earlier version of sqlfluff or a later version of Python" % __version__
+        "Use an earlier version of sqlfluff or a later version of Python"
+        % _get_version()
     )
 
 # Register helper functions to support variable introspection on failure.
-pytest.register_assert_rewrite("sqlfluff.utils.testing")
+# NOTE: This only matters when running under pytest, and importing pytest
+# is a large share of our startup time, so we only do it if it's loaded.
+if "pytest" in sys.modules:
+    import pytest
+
+    pytest.register_assert_rewrite("sqlfluff.utils.testing")
@@ -0,0 +1,124 @@
+"""The thin client for a `sqlfluff serve` server.
+
+This is installed as the `sqlfluff-client` command. It sends a request
+to a running server over a unix domain socket and prints the result, so
+that it doesn't pay to start up the whole of sqlfluff for each file.
+
+NOTE: To keep startup fast, this only uses the standard library (and
+appdirs), rather than click and the rest of the CLI.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional
+
+import appdirs
+
+from sqlfluff.cli import EXIT_SUCCESS, EXIT_ERROR
+
+
+def default_socket_path() -> str:
+    """The default socket for the server, in the user cache directory."""
+    return os.path.join(appdirs.user_cache_dir("sqlfluff", "sqlfluff"), "server.sock")
+
+
+def send_request(request: Dict[str, Any], socket_path: Optional[str] = None) -> dict:
+    """Send a request to the server and return its response.
+
+    Requests and responses are each a single line of json.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall(json.dumps(request).encode("utf8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        buff = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            buff.append(chunk)
+    return json.loads(b"".join(buff).decode("utf8"))
+
+
+def format_records(records: List[dict]) -> str:
+    """Format the records of a lint result, as the lint command does."""
+    lines = []
+    for record in records:
+        lines.append(f"== [{record['filepath']}] FAIL")
+        for violation in record["violations"]:
+            lines.append(
+                "L:{:4d} | P:{:4d} | {} | {}".format(
+                    violation["line_no"],
+                    violation["line_pos"],
+                    violation["code"].rjust(4),
+                    violation["description"],
+                )
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Lint paths using a running `sqlfluff serve` server."""
+    parser = argparse.ArgumentParser(
+        prog="sqlfluff-client",
+        description=(
+            "Lint SQL files using a running `sqlfluff serve` server, which avoids "
+            "the startup cost of sqlfluff for each invocation."
+        ),
+    )
+    parser.add_argument("paths", nargs="*", help="The files or directories to lint.")
+    parser.add_argument("--socket", help="The socket the server is listening on.")
+    parser.add_argument("--dialect", help="The dialect of SQL to lint.")
+    parser.add_argument("--rules", help="A comma separated list of rules to check.")
+    parser.add_argument(
+        "--exclude-rules", help="A comma separated list of rules to exclude."
+    )
+    parser.add_argument(
+        "--format",
+        choices=("human", "json"),
+        default="human",
+        help="What format to return the lint result in.",
+    )
+    parser.add_argument(
+        "--stop", action="store_true", help="Stop the server rather than linting."
+    )
+    args = parser.parse_args(argv)
+
+    if args.stop:
+        request: Dict[str, Any] = {"command": "stop"}
+    else:
+        request = {
+            "command": "lint",
+            "paths": args.paths,
+            "cwd": os.getcwd(),
+            "dialect": args.dialect,
+            "rules": args.rules,
+            "exclude_rules": args.exclude_rules,
+        }
+    try:
+        response = send_request(request, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(
+            "No sqlfluff server is listening on "
+            f"{args.socket or default_socket_path()}. Start one with `sqlfluff serve`.",
+            file=sys.stderr,
+        )
+        return EXIT_ERROR
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return EXIT_ERROR
+    if args.stop:
+        return EXIT_SUCCESS
+    if args.format == "json":
+        print(json.dumps(response["records"]))
+    elif response["records"]:
+        print(format_records(response["records"]))
+    return response["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # pragma: no cover
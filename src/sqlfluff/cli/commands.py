@@ -7,7 +7,7 @@ import json
 import logging
 import time
 from logging import LogRecord
-from typing import Callable, Tuple, Optional, cast
+from typing import Callable, List, Sequence, Tuple, Optional, cast
 
 import yaml
 
@@ -28,9 +28,12 @@ from sqlfluff.cli.click_deprecated_option import (
     DeprecatedOptionsCommand,
 )
 from sqlfluff.cli.formatters import (
+    format_github_annotation_native,
     format_linting_result_header,
     OutputStreamFormatter,
+    RecordStreamFormatter,
 )
+from sqlfluff.cli.git import changed_line_ranges
 from sqlfluff.cli.helpers import get_package_version
 from sqlfluff.cli.outputstream import make_output_stream, OutputStream
 
@@ -45,10 +48,18 @@ from sqlfluff.core import (
     dialect_readout,
 )
 from sqlfluff.core.config import progress_bar_configuration
+from sqlfluff.core.dialects import warm_dialect_snapshots
 
 from sqlfluff.core.enums import FormatType, Color
 from sqlfluff.core.plugin.host import get_plugin_manager
 
+# The lint formats which can be written as each file is linted.
+_STREAMABLE_FORMATS = (
+    FormatType.human.value,
+    FormatType.json_lines.value,
+    FormatType.github_annotation_native.value,
+)
+
 
 class StreamHandlerTqdm(logging.StreamHandler):
     """Modified StreamHandler which takes care of writing within `tqdm` context.
@@ -183,6 +194,33 @@ def common_options(f: Callable) -> Callable:
     return f
 
 
+class TemplaterNames(Sequence):
+    """The names of the available templaters, loaded on first use.
+
+    Listing the templaters imports all of them (and jinja with them),
+    which we want to avoid on startup, so this is only evaluated when
+    click needs to validate the option or show help.
+    """
+
+    _names: Optional[List[str]] = None
+
+    def _load(self) -> List[str]:
+        if self._names is None:
+            self._names = [
+                templater.name
+                for templater in chain.from_iterable(
+                    get_plugin_manager().hook.get_templaters()
+                )
+            ]
+        return self._names
+
+    def __getitem__(self, idx):
+        return self._load()[idx]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
 def core_options(f: Callable) -> Callable:
     """Add core operation options to commands via a decorator.
 
@@ -211,14 +249,7 @@ def core_options(f: Callable) -> Callable:
         "--templater",
         default=None,
         help="The templater to use (default=jinja)",
-        type=click.Choice(
-            [
-                templater.name
-                for templater in chain.from_iterable(
-                    get_plugin_manager().hook.get_templaters()
-                )
-            ]
-        ),
+        type=click.Choice(TemplaterNames()),
     )(f)
     f = click.option(
         "-r",
@@ -311,6 +342,32 @@ def core_options(f: Callable) -> Callable:
     return f
 
 
+def cache_options(f: Callable) -> Callable:
+    """Add lint cache options to commands via a decorator.
+
+    These are applied to the `lint` and `fix` commands.
+    """
+    f = click.option(
+        "--cache/--no-cache",
+        default=None,
+        help=(
+            "Enable or disable the persistent lint result cache. When enabled, "
+            "files whose content, config and rules are unchanged since a previous "
+            "run reuse the results of that run rather than being linted again."
+        ),
+    )(f)
+    f = click.option(
+        "--cache-dir",
+        default=None,
+        type=click.Path(file_okay=False),
+        help=(
+            "The directory to store the lint result cache in. Setting this "
+            "implies --cache unless --no-cache is also set."
+        ),
+    )(f)
+    return f
+
+
 def get_config(
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
@@ -341,6 +398,9 @@ def get_config(
                 )
             )
             sys.exit(EXIT_ERROR)
+    # Specifying a cache directory implies that we want to use it.
+    if kwargs.get("cache_dir") and kwargs.get("cache") is None:
+        kwargs["cache"] = True
     from_root_kwargs = {}
     if "require_dialect" in kwargs:
         from_root_kwargs["require_dialect"] = kwargs.pop("require_dialect")
@@ -365,9 +425,17 @@ def get_config(
 
 
 def get_linter_and_formatter(
-    cfg: FluffConfig, output_stream: Optional[OutputStream] = None
+    cfg: FluffConfig,
+    output_stream: Optional[OutputStream] = None,
+    record_format: Optional[str] = None,
+    annotation_level: str = "notice",
 ) -> Tuple[Linter, OutputStreamFormatter]:
-    """Get a linter object given a config."""
+    """Get a linter object given a config.
+
+    If a `record_format` is given, the formatter writes records of
+    violations in that format as each file is linted, rather than
+    human readable output.
+    """
     try:
         # We're just making sure it exists at this stage.
         # It will be fetched properly in the linter.
@@ -377,12 +445,23 @@ def get_linter_and_formatter(
     except KeyError:  # pragma: no cover
         click.echo(f"Error: Unknown dialect '{cfg.get('dialect')}'")
         sys.exit(EXIT_ERROR)
-    formatter = OutputStreamFormatter(
-        output_stream=output_stream or make_output_stream(cfg),
-        nocolor=cfg.get("nocolor"),
-        verbosity=cfg.get("verbose"),
-        output_line_length=cfg.get("output_line_length"),
-    )
+    formatter: OutputStreamFormatter
+    if record_format:
+        formatter = RecordStreamFormatter(
+            output_stream=output_stream or make_output_stream(cfg),
+            nocolor=cfg.get("nocolor"),
+            record_format=record_format,
+            annotation_level=annotation_level,
+            verbosity=cfg.get("verbose"),
+            output_line_length=cfg.get("output_line_length"),
+        )
+    else:
+        formatter = OutputStreamFormatter(
+            output_stream=output_stream or make_output_stream(cfg),
+            nocolor=cfg.get("nocolor"),
+            verbosity=cfg.get("verbose"),
+            output_line_length=cfg.get("output_line_length"),
+        )
     return Linter(config=cfg, formatter=formatter), formatter
 
 
@@ -426,9 +505,23 @@ def rules(**kwargs) -> None:
 
 @cli.command()
 @common_options
-def dialects(**kwargs) -> None:
+@click.option(
+    "--warm",
+    is_flag=True,
+    help=(
+        "Expand each dialect and store a snapshot of it in the user cache "
+        "directory, so that later runs can load it rather than expanding "
+        "the dialect again. This speeds up startup, especially when linting "
+        "only a few files at a time."
+    ),
+)
+def dialects(warm: bool = False, **kwargs) -> None:
     """Show the current dialects available."""
     c = get_config(**kwargs, require_dialect=False)
+    if warm:
+        for snapshot_path in warm_dialect_snapshots():
+            click.echo(f"Stored dialect snapshot: {snapshot_path}")
+        return
     _, formatter = get_linter_and_formatter(c)
     click.echo(formatter.format_dialects(dialect_readout), color=c.get("color"))
 
@@ -447,6 +540,7 @@ def dump_file_payload(filename: Optional[str], payload: str):
 @cli.command(cls=DeprecatedOptionsCommand)
 @common_options
 @core_options
+@cache_options
 @click.option(
     "-f",
     "--format",
@@ -514,6 +608,34 @@ def dump_file_payload(filename: Optional[str], payload: str):
         "future releases without warning."
     ),
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    help=(
+        "Write the violations of each file as soon as it has been linted, keeping "
+        "only running totals rather than the results of every file. This keeps "
+        "memory use flat when linting very large projects. Only supported with "
+        "the human, json-lines and github-annotation-native formats."
+    ),
+)
+@click.option(
+    "--changed-since",
+    default=None,
+    metavar="REF",
+    help=(
+        "Only lint the files (within PATHS) which have changed since the merge "
+        "base of the git REF (e.g. a branch) and HEAD, including uncommitted "
+        "changes and untracked files."
+    ),
+)
+@click.option(
+    "--changed-lines-only",
+    is_flag=True,
+    help=(
+        "With --changed-since, only report linting violations on the lines "
+        "which have changed."
+    ),
+)
 @click.argument("paths", nargs=-1, type=click.Path(allow_dash=True))
 def lint(
     paths: Tuple[str],
@@ -529,6 +651,9 @@ def lint(
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
     persist_timing: Optional[str] = None,
+    stream: bool = False,
+    changed_since: Optional[str] = None,
+    changed_lines_only: bool = False,
     **kwargs,
 ) -> None:
     """Lint SQL files via passing a list of files or using stdin.
@@ -554,8 +679,52 @@ def lint(
     )
     non_human_output = (format != FormatType.human.value) or (write_output is not None)
     file_output = None
-    output_stream = make_output_stream(config, format, write_output)
-    lnt, formatter = get_linter_and_formatter(config, output_stream)
+    if format == FormatType.github_annotation.value and annotation_level == "error":
+        annotation_level = "failure"
+    elif (
+        format == FormatType.github_annotation_native.value
+        and annotation_level == "failure"
+    ):
+        annotation_level = "error"
+    record_format = None
+    if stream:
+        if format not in _STREAMABLE_FORMATS or persist_timing:
+            click.echo(
+                OutputStreamFormatter.colorize_helper(
+                    OutputStreamFormatter.should_produce_plain_output(
+                        config.get("nocolor")
+                    ),
+                    "Error: --stream is only supported with the "
+                    f"{', '.join(_STREAMABLE_FORMATS)} formats, and not with "
+                    "--persist-timing.",
+                    color=Color.red,
+                )
+            )
+            sys.exit(EXIT_ERROR)
+        if format != FormatType.human.value:
+            record_format = format
+    if changed_lines_only and not changed_since:
+        click.echo(
+            OutputStreamFormatter.colorize_helper(
+                OutputStreamFormatter.should_produce_plain_output(
+                    config.get("nocolor")
+                ),
+                "Error: --changed-lines-only requires --changed-since.",
+                color=Color.red,
+            )
+        )
+        sys.exit(EXIT_ERROR)
+    if record_format:
+        # Records are written to the output as each file is linted.
+        output_stream = make_output_stream(config, None, write_output)
+    else:
+        output_stream = make_output_stream(config, format, write_output)
+    lnt, formatter = get_linter_and_formatter(
+        config,
+        output_stream,
+        record_format=record_format,
+        annotation_level=annotation_level,
+    )
 
     verbose = config.get("verbose")
     progress_bar_configuration.disable_progress_bar = disable_progress_bar
@@ -579,25 +748,35 @@ def lint(
         if ("-",) == paths:
             result = lnt.lint_string_wrapped(sys.stdin.read(), fname="stdin")
         else:
+            changed_lines = (
+                changed_line_ranges(changed_since) if changed_since else None
+            )
             result = lnt.lint_paths(
                 paths,
                 ignore_non_existent_files=False,
                 ignore_files=not disregard_sqlfluffignores,
                 processes=processes,
+                # Timing records include the size of each tree.
+                retain_trees=bool(persist_timing),
+                retain_files=not stream,
+                only_files=changed_lines,
+                line_ranges=changed_lines if changed_lines_only else None,
             )
 
     # Output the final stats
     if verbose >= 1:
         click.echo(formatter.format_linting_stats(result, verbose=verbose))
 
-    if format == FormatType.json.value:
+    if stream:
+        # The violations have already been written.
+        pass
+    elif format == FormatType.json.value:
         file_output = json.dumps(result.as_records())
+    elif format == FormatType.json_lines.value:
+        file_output = "\n".join(json.dumps(record) for record in result.as_records())
     elif format == FormatType.yaml.value:
         file_output = yaml.dump(result.as_records(), sort_keys=False)
     elif format == FormatType.github_annotation.value:
-        if annotation_level == "error":
-            annotation_level = "failure"
-
         github_result = []
         for record in result.as_records():
             filepath = record["filepath"]
@@ -619,24 +798,11 @@ def lint(
                 )
         file_output = json.dumps(github_result)
     elif format == FormatType.github_annotation_native.value:
-        if annotation_level == "failure":
-            annotation_level = "error"
-
         github_result_native = []
         for record in result.as_records():
-            filepath = record["filepath"]
-            for violation in record["violations"]:
-                # NOTE: The output format is designed for GitHub action:
-                # https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-a-notice-message
-                line = f"::{annotation_level} "
-                line += "title=SQLFluff,"
-                line += f"file={filepath},"
-                line += f"line={violation['line_no']},"
-                line += f"col={violation['line_pos']}"
-                line += "::"
-                line += f"{violation['code']}: {violation['description']}"
-
-                github_result_native.append(line)
+            github_result_native += format_github_annotation_native(
+                record, annotation_level
+            )
 
         file_output = "\n".join(github_result_native)
 
@@ -654,6 +820,23 @@ def lint(
         for step in timing_summary:
             click.echo(f"=== {step} ===")
             click.echo(formatter.cli_table(timing_summary[step].items()))
+        parse_statistics = result.parse_statistics_summary()
+        if parse_statistics:
+            click.echo("=== parse statistics ===")
+            click.echo(formatter.cli_table(parse_statistics.items()))
+        worker_utilisation = result.worker_utilisation()
+        if worker_utilisation:
+            click.echo("=== worker utilisation ===")
+            click.echo(
+                formatter.cli_table(
+                    (
+                        (worker, f"{utilisation:.1%}")
+                        for worker, utilisation in worker_utilisation.items()
+                    ),
+                    col_width=30,
+                    max_label_width=20,
+                )
+            )
 
     if not nofail:
         if not non_human_output:
@@ -683,6 +866,7 @@ def do_fixes(lnt, result, formatter=None, **kwargs):
 @cli.command()
 @common_options
 @core_options
+@cache_options
 @click.option(
     "-f",
     "--force",
@@ -732,6 +916,16 @@ def do_fixes(lnt, result, formatter=None, **kwargs):
     is_flag=True,
     help="Show lint violations",
 )
+@click.option(
+    "--changed-since",
+    default=None,
+    metavar="REF",
+    help=(
+        "Only fix the files (within PATHS) which have changed since the merge "
+        "base of the git REF (e.g. a branch) and HEAD, including uncommitted "
+        "changes and untracked files."
+    ),
+)
 @click.argument("paths", nargs=-1, type=click.Path(allow_dash=True))
 def fix(
     force: bool,
@@ -744,6 +938,7 @@ def fix(
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
     show_lint_violations: bool = False,
+    changed_since: Optional[str] = None,
     **kwargs,
 ) -> None:
     """Fix SQL files.
@@ -829,6 +1024,7 @@ def fix(
             fix=True,
             ignore_non_existent_files=False,
             processes=processes,
+            only_files=changed_line_ranges(changed_since) if changed_since else None,
         )
 
     if not fix_even_unparsable:
@@ -905,6 +1101,23 @@ def fix(
         for step in timing_summary:
             click.echo(f"=== {step} ===")
             click.echo(formatter.cli_table(timing_summary[step].items()))
+        parse_statistics = result.parse_statistics_summary()
+        if parse_statistics:
+            click.echo("=== parse statistics ===")
+            click.echo(formatter.cli_table(parse_statistics.items()))
+        worker_utilisation = result.worker_utilisation()
+        if worker_utilisation:
+            click.echo("=== worker utilisation ===")
+            click.echo(
+                formatter.cli_table(
+                    (
+                        (worker, f"{utilisation:.1%}")
+                        for worker, utilisation in worker_utilisation.items()
+                    ),
+                    col_width=30,
+                    max_label_width=20,
+                )
+            )
 
     if show_lint_violations:
         click.echo("==== lint for unfixable violations ====")
@@ -1168,6 +1381,58 @@ def render(
         sys.exit(EXIT_SUCCESS)
 
 
+@cli.command()
+@common_options
+@core_options
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help=(
+        "The unix domain socket to listen on. Defaults to a socket in the user "
+        "cache directory, which is where `sqlfluff-client` looks for it."
+    ),
+)
+def serve(
+    socket_path: Optional[str] = None,
+    extra_config_path: Optional[str] = None,
+    ignore_local_config: bool = False,
+    logger: Optional[logging.Logger] = None,
+    **kwargs,
+) -> None:
+    """Run a persistent lint server for use with `sqlfluff-client`.
+
+    The server keeps dialects, rules and config files loaded between
+    requests, which makes linting a few files at a time (e.g. from an
+    editor or a pre-commit hook) much faster. Config files are reloaded
+    when they change. Stop the server with `sqlfluff-client --stop`.
+    """
+    # Import here, so that other commands don't pay for it.
+    from sqlfluff.cli.server import LintServer
+
+    c = get_config(
+        extra_config_path, ignore_local_config, require_dialect=False, **kwargs
+    )
+    _, formatter = get_linter_and_formatter(c)
+    set_logging_level(
+        verbosity=c.get("verbose"),
+        formatter=formatter,
+        logger=logger,
+        stderr_output=True,
+    )
+    # Options given here apply to every request.
+    overrides = {k: kwargs[k] for k in kwargs if kwargs[k] is not None}
+    with PathAndUserErrorHandler(formatter):
+        server = LintServer(
+            socket_path=socket_path,
+            extra_config_path=extra_config_path,
+            ignore_local_config=ignore_local_config,
+            overrides=overrides,
+        )
+        click.echo(f"Listening on {server.socket_path}", err=True)
+        server.serve_forever()
+
+
 # This "__main__" handler allows invoking SQLFluff using "python -m", which
 # simplifies the use of cProfile, e.g.:
 # python -m cProfile -s cumtime -m sqlfluff.cli.commands lint slow_file.sql
@@ -1,7 +1,8 @@
 """Defines the formatters for the CLI."""
 from io import StringIO
+import json
 import sys
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import click
 from colorama import Style
@@ -17,7 +18,7 @@ from sqlfluff.cli.helpers import (
 from sqlfluff.cli.outputstream import OutputStream
 
 from sqlfluff.core import SQLBaseError, FluffConfig, Linter, TimingSummary
-from sqlfluff.core.enums import Color
+from sqlfluff.core.enums import Color, FormatType
 from sqlfluff.core.linter import LintedFile, LintingResult, ParsedString
 
 
@@ -50,6 +51,23 @@ def format_linting_result_header():
     return text_buffer.getvalue()
 
 
+def format_github_annotation_native(record: dict, annotation_level: str) -> List[str]:
+    """Format the violations of a lint record as native GitHub annotations."""
+    lines = []
+    for violation in record["violations"]:
+        # NOTE: The output format is designed for GitHub action:
+        # https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-a-notice-message
+        line = f"::{annotation_level} "
+        line += "title=SQLFluff,"
+        line += f"file={record['filepath']},"
+        line += f"line={violation['line_no']},"
+        line += f"col={violation['line_pos']}"
+        line += "::"
+        line += f"{violation['code']}: {violation['description']}"
+        lines.append(line)
+    return lines
+
+
 class OutputStreamFormatter:
     """Formatter which writes to an OutputStream.
 
@@ -564,9 +582,12 @@ class OutputStreamFormatter:
         """Used by human formatting during the parse."""
         violations_count = 0
         timing = TimingSummary()
+        parse_statistics: Dict[str, int] = {}
 
         for parsed_string in parsed_strings:
             timing.add(parsed_string.time_dict)
+            for key, val in parsed_string.parse_statistics.items():
+                parse_statistics[key] = parse_statistics.get(key, 0) + val
 
             if parsed_string.tree:
                 output_stream.write(parsed_string.tree.stringify(code_only=code_only))
@@ -595,9 +616,59 @@ class OutputStreamFormatter:
             for step in timing_summary:
                 output_stream.write(f"=== {step} ===")
                 output_stream.write(self.cli_table(timing_summary[step].items()))
+            if parse_statistics:
+                output_stream.write("=== parse statistics ===")
+                output_stream.write(self.cli_table(parse_statistics.items()))
 
         return violations_count
 
     def completion_message(self) -> None:
         """Prints message when SQLFluff is finished."""
         click.echo("All Finished" f"{'' if self.plain_output else ' 📜 🎉'}!")
+
+
+class RecordStreamFormatter(OutputStreamFormatter):
+    """Formatter which writes the violations of each file as records.
+
+    This is used to stream machine readable output while linting, so
+    the human readable output is discarded. Records are written in
+    either the json-lines or github-annotation-native format.
+    """
+
+    def __init__(
+        self,
+        output_stream: OutputStream,
+        nocolor: bool,
+        record_format: str,
+        annotation_level: str = "notice",
+        verbosity: int = 0,
+        filter_empty: bool = True,
+        output_line_length: int = 80,
+    ):
+        super().__init__(
+            output_stream,
+            nocolor,
+            verbosity=verbosity,
+            filter_empty=filter_empty,
+            output_line_length=output_line_length,
+        )
+        self.record_format = record_format
+        self.annotation_level = annotation_level
+
+    def _dispatch(self, s: str) -> None:
+        """Discard any human readable output."""
+        pass
+
+    def dispatch_file_violations(
+        self, fname: str, linted_file: LintedFile, only_fixable: bool
+    ) -> None:
+        """Write a record of any violations found in a file."""
+        violations = linted_file.get_violations(fixable=True if only_fixable else None)
+        if not violations:
+            return
+        record = LintingResult.as_record(fname, violations)
+        if self.record_format == FormatType.json_lines.value:
+            self._output_stream.write(json.dumps(record))
+        else:
+            for line in format_github_annotation_native(record, self.annotation_level):
+                self._output_stream.write(line)
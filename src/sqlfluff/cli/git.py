@@ -0,0 +1,89 @@
+"""Find the files (and lines) changed in a git repository.
+
+This backs the `--changed-since` option of `sqlfluff lint` and
+`sqlfluff fix`, so that CI jobs can lint only what a branch changes.
+"""
+
+import os
+import re
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from sqlfluff.core import SQLFluffUserError
+
+# Matches the new line range of a hunk header in a diff with no
+# context, e.g. `@@ -10,2 +11,3 @@`. The count is omitted when it's one.
+_hunk_header = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def _run_git(args: List[str], cwd: Optional[str] = None) -> str:
+    """Run a git command, returning its output."""
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+    except FileNotFoundError:  # pragma: no cover
+        raise SQLFluffUserError("--changed-since requires git, which wasn't found.")
+    if proc.returncode:
+        raise SQLFluffUserError(
+            f"Unable to find changed files, `git {' '.join(args)}` failed: "
+            f"{proc.stderr.strip()}"
+        )
+    return proc.stdout
+
+
+def changed_line_ranges(ref: str) -> Dict[str, Optional[List[Tuple[int, int]]]]:
+    """Find the files changed since the merge base of `ref` and HEAD.
+
+    This includes uncommitted changes and untracked files, but not
+    deleted files.
+
+    Returns:
+        A dict of the absolute path of each changed file, to the ranges
+        of its lines which were added or changed (as inclusive start
+        and end line numbers). Untracked files are entirely new, so
+        have None rather than a list of ranges.
+    """
+    root = _run_git(["rev-parse", "--show-toplevel"]).strip()
+    base = _run_git(["merge-base", ref, "HEAD"], cwd=root).strip()
+    changed: Dict[str, Optional[List[Tuple[int, int]]]] = {}
+    ranges: List[Tuple[int, int]] = []
+    diff = _run_git(
+        [
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--no-color",
+            "--no-ext-diff",
+            "--diff-filter=d",
+            "-U0",
+            base,
+        ],
+        cwd=root,
+    )
+    in_header = False
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            in_header = True
+        elif in_header and line.startswith("+++ b/"):
+            # NB: Git adds a trailing tab to paths which contain spaces.
+            fname = line[6:].rstrip("\t")
+            ranges = changed.setdefault(os.path.normpath(os.path.join(root, fname)), [])
+            continue
+        match = _hunk_header.match(line)
+        if match:
+            in_header = False
+            start = int(match.group(1))
+            count = int(match.group(2) or 1)
+            # Hunks which only delete lines don't add any.
+            if count:
+                ranges.append((start, start + count - 1))
+    untracked = _run_git(["ls-files", "--others", "--exclude-standard", "-z"], cwd=root)
+    for fname in untracked.split("\0"):
+        if fname:
+            changed[os.path.normpath(os.path.join(root, fname))] = None
+    return changed
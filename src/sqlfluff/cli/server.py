@@ -0,0 +1,159 @@
+"""A persistent lint server, for use by editors and pre-commit hooks.
+
+Started with `sqlfluff serve`, this keeps a warm linter in memory
+(expanded dialects, the rule registry and loaded config files) and
+answers requests from `sqlfluff-client` over a unix domain socket. This
+avoids paying the startup cost of sqlfluff on every invocation, which
+dominates the time taken to lint a single small file.
+
+Each connection carries a single request and a single response, each a
+line of json. Requests are handled one at a time, because each one
+changes into the working directory of the client.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from typing import Any, Dict, List, Optional
+
+from sqlfluff.cli import EXIT_SUCCESS, EXIT_FAIL
+from sqlfluff.cli.client import default_socket_path
+from sqlfluff.core import FluffConfig, Linter, SQLFluffUserError
+from sqlfluff.core.dialects import cache_expanded_dialects
+from sqlfluff.core.plugin.host import get_plugin_manager
+from sqlfluff.core.rules import BaseRule, get_ruleset
+
+# Instantiate the server logger
+server_logger = logging.getLogger("sqlfluff.server")
+
+
+class _ServerLinter(Linter):
+    """A linter which shares a single rule registry between requests."""
+
+    # Requests are handled in the server process.
+    allow_process_parallelism = False
+
+    def __init__(self, *args, ruleset, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._ruleset = ruleset
+
+    def get_ruleset(self, config: Optional[FluffConfig] = None) -> List[BaseRule]:
+        """Get hold of a set of rules, from the shared registry."""
+        return self._ruleset.get_rulelist(config=config or self.config)
+
+
+class LintServer:
+    """A warm linter, which lints paths on request.
+
+    Args:
+        socket_path (:obj:`str`, optional): The unix domain socket to listen
+            on. Defaults to a socket in the user cache directory.
+        extra_config_path (:obj:`str`, optional): As for
+            :meth:`FluffConfig.from_root`.
+        ignore_local_config (:obj:`bool`): As for :meth:`FluffConfig.from_root`.
+        overrides (:obj:`dict`, optional): Config overrides, which apply to
+            every request unless the request sets them itself.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        extra_config_path: Optional[str] = None,
+        ignore_local_config: bool = False,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+            raise SQLFluffUserError(
+                "`sqlfluff serve` requires unix domain sockets, which aren't "
+                "available on this platform."
+            )
+        self.socket_path = socket_path or default_socket_path()
+        self.extra_config_path = extra_config_path
+        self.ignore_local_config = ignore_local_config
+        self.overrides = overrides or {}
+        # Keep the things which are slow to set up, for use by every request.
+        cache_expanded_dialects()
+        self.plugin_manager = get_plugin_manager()
+        self.ruleset = get_ruleset()
+        self._server: Optional[socketserver.UnixStreamServer] = None
+
+    def lint(
+        self,
+        paths: List[str],
+        cwd: Optional[str] = None,
+        dialect: Optional[str] = None,
+        rules: Optional[str] = None,
+        exclude_rules: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Lint paths, as the client working in `cwd` would."""
+        overrides = dict(self.overrides)
+        for key, value in (
+            ("dialect", dialect),
+            ("rules", rules),
+            ("exclude_rules", exclude_rules),
+        ):
+            if value is not None:
+                overrides[key] = value
+        if cwd:
+            os.chdir(cwd)
+        config = FluffConfig.from_root(
+            extra_config_path=self.extra_config_path,
+            ignore_local_config=self.ignore_local_config,
+            overrides=overrides,
+            plugin_manager=self.plugin_manager,
+        )
+        linter = _ServerLinter(config=config, ruleset=self.ruleset)
+        result = linter.lint_paths(tuple(paths), processes=1)
+        return {
+            "records": result.as_records(),
+            "exit_code": EXIT_FAIL if result.num_violations() else EXIT_SUCCESS,
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single request, returning the response."""
+        command = request.get("command")
+        if command == "ping":
+            return {"status": "ok"}
+        elif command == "stop":
+            # NOTE: Shutdown blocks until the serve loop exits, so it can't
+            # be called from the thread handling this request.
+            if self._server:
+                threading.Thread(target=self._server.shutdown).start()
+            return {"status": "stopping"}
+        elif command == "lint":
+            return self.lint(
+                paths=request.get("paths") or [],
+                cwd=request.get("cwd"),
+                dialect=request.get("dialect"),
+                rules=request.get("rules"),
+                exclude_rules=request.get("exclude_rules"),
+            )
+        return {"error": f"Unknown command: {command!r}"}
+
+    def serve_forever(self) -> None:
+        """Listen on the socket and handle requests until stopped."""
+        lint_server = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                try:
+                    request = json.loads(self.rfile.readline().decode("utf8"))
+                    response = lint_server.handle(request)
+                except (SQLFluffUserError, ValueError, KeyError) as err:
+                    response = {"error": str(err)}
+                self.wfile.write(json.dumps(response).encode("utf8") + b"\n")
+
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        # Clear up any socket left behind by a server which didn't stop cleanly.
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        with socketserver.UnixStreamServer(self.socket_path, _Handler) as server:
+            self._server = server
+            try:
+                server.serve_forever()
+            finally:
+                self._server = None
+                os.remove(self.socket_path)
@@ -4,6 +4,7 @@ import logging
 import os
 import os.path
 import configparser
+from copy import copy, deepcopy
 from dataclasses import dataclass
 
 import pluggy
@@ -28,6 +29,7 @@ can still cache appropriately
 """
 
 ConfigElemType = Tuple[Tuple[str, ...], Any]
+ConfigStampType = Tuple[Tuple[str, Optional[int]], ...]
 
 
 @dataclass
@@ -207,9 +209,25 @@ class ConfigLoader:
 
     """
 
+    # The potential filenames we would look for at each path.
+    # NB: later in this list overwrites earlier
+    config_filenames = (
+        "setup.cfg",
+        "tox.ini",
+        "pep8.ini",
+        ".sqlfluff",
+        "pyproject.toml",
+    )
+
     def __init__(self) -> None:
-        # TODO: check that this cache implementation is actually useful
-        self._config_cache: dict = {}
+        # Loaded config, and the stamps of the files it was loaded from,
+        # by the path it was loaded from.
+        self._config_cache: Dict[str, Tuple[ConfigStampType, dict]] = {}
+        # Child configs, and the stamps of every file they depend on, by
+        # the directory and the settings passed on from their parent.
+        self._child_config_cache: Dict[
+            tuple, Tuple[ConfigStampType, "FluffConfig"]
+        ] = {}
 
     @classmethod
     def get_global(cls) -> "ConfigLoader":
@@ -450,37 +468,52 @@ class ConfigLoader:
         elems = self._validate_configs(elems, file_path)
         return self._incorporate_vals(configs or {}, elems)
 
-    def load_config_at_path(self, path: str) -> dict:
-        """Load config from a given path."""
-        # First check the cache
-        if str(path) in self._config_cache:
-            return self._config_cache[str(path)]
-
-        # The potential filenames we would look for at this path.
-        # NB: later in this list overwrites earlier
-        filename_options = [
-            "setup.cfg",
-            "tox.ini",
-            "pep8.ini",
-            ".sqlfluff",
-            "pyproject.toml",
-        ]
+    @classmethod
+    def config_file_stamps(cls, paths: Iterable[str]) -> ConfigStampType:
+        """Get the modification times of the config files at some paths.
 
-        configs: dict = {}
+        Paths are either directories (in which case any of the config
+        files may exist in them) or a config file. Missing files are
+        included, so that new config files are noticed.
+        """
+        stamps = []
+        for path in paths:
+            candidates = (
+                [os.path.join(path, fname) for fname in cls.config_filenames]
+                if os.path.isdir(path)
+                else [path]
+            )
+            for candidate in candidates:
+                try:
+                    stamps.append((candidate, os.stat(candidate).st_mtime_ns))
+                except OSError:
+                    stamps.append((candidate, None))
+        return tuple(stamps)
 
+    def load_config_at_path(self, path: str) -> dict:
+        """Load config from a given path."""
         if os.path.isdir(path):
             p = path
         else:
             p = os.path.dirname(path)
 
+        # First check the cache, which is only valid if none of the
+        # config files have changed since they were loaded.
+        stamps = self.config_file_stamps([os.path.expanduser(p)])
+        cached = self._config_cache.get(str(path))
+        if cached and cached[0] == stamps:
+            return cached[1]
+
+        configs: dict = {}
+
         d = os.listdir(os.path.expanduser(p))
         # iterate this way round to make sure things overwrite is the right direction
-        for fname in filename_options:
+        for fname in self.config_filenames:
             if fname in d:
                 configs = self.load_config_file(p, fname, configs=configs)
 
         # Store in the cache
-        self._config_cache[str(path)] = configs
+        self._config_cache[str(path)] = (stamps, configs)
         return configs
 
     def load_extra_config(self, extra_config_path: str) -> dict:
@@ -491,8 +524,10 @@ class ConfigLoader:
             )
 
         # First check the cache
-        if str(extra_config_path) in self._config_cache:
-            return self._config_cache[str(extra_config_path)]
+        stamps = self.config_file_stamps([extra_config_path])
+        cached = self._config_cache.get(str(extra_config_path))
+        if cached and cached[0] == stamps:
+            return cached[1]
 
         configs: dict = {}
         if extra_config_path.endswith("pyproject.toml"):
@@ -502,7 +537,7 @@ class ConfigLoader:
         configs = self._incorporate_vals(configs, elems)
 
         # Store in the cache
-        self._config_cache[str(extra_config_path)] = configs
+        self._config_cache[str(extra_config_path)] = (stamps, configs)
         return configs
 
     @staticmethod
@@ -564,9 +599,23 @@ class ConfigLoader:
             user_appdir_config, user_config, *config_stack, extra_config
         )
 
+    def iter_config_paths_up_to_path(
+        self,
+        path: str,
+        extra_config_path: Optional[str] = None,
+        ignore_local_config: bool = False,
+    ) -> Iterator[str]:
+        """Iterate the paths which `load_config_up_to_path` may load config from."""
+        if not ignore_local_config:
+            yield self._get_user_config_dir_path()
+            yield os.path.expanduser("~")
+            yield from self.iter_config_locations_up_to_path(path)
+        if extra_config_path:
+            yield extra_config_path
+
     @classmethod
     def find_ignore_config_files(
-        cls, path, working_path=Path.cwd(), ignore_file_name=".sqlfluffignore"
+        cls, path, working_path=None, ignore_file_name=".sqlfluffignore"
     ):
         """Finds sqlfluff ignore files from both the path and its parent paths."""
         return set(
@@ -582,14 +631,18 @@ class ConfigLoader:
         )
 
     @staticmethod
-    def iter_config_locations_up_to_path(path, working_path=Path.cwd()):
+    def iter_config_locations_up_to_path(path, working_path=None):
         """Finds config locations from both the path and its parent paths.
 
         The lowest priority is the user appdir, then home dir, then increasingly
         the configs closest to the file being directly linted.
+
+        The working path defaults to the current working directory at the
+        time of the call (rather than at import), so that long running
+        processes which change directory find the right configs.
         """
         given_path = Path(path).absolute()
-        working_path = Path(working_path).absolute()
+        working_path = Path(working_path or Path.cwd()).absolute()
 
         # If we've been passed a file and not a directory,
         # then go straight to the directory.
@@ -728,12 +781,14 @@ class FluffConfig:
         del state["_plugin_manager"]
         return state
 
-    def __setstate__(self, state):  # pragma: no cover
+    def __setstate__(self, state):
         # Restore instance attributes
         self.__dict__.update(state)
-        # NB: We don't reinstate the plugin manager, but this should only
-        # be happening between processes where the plugin manager should
-        # probably be fresh in any case.
+        # NB: We don't reinstate the original plugin manager, but this should
+        # only be happening between processes where the plugin manager should
+        # probably be fresh in any case. A fresh one is still needed to make
+        # child configs (e.g. when loading files in a worker process).
+        self._plugin_manager = get_plugin_manager()
         # NOTE: This means that registering user plugins directly will only
         # work if those plugins are used in the main process (i.e. templaters).
         # User registered linting rules either must be "installed" and therefore
@@ -825,6 +880,13 @@ class FluffConfig:
 
     def get_templater(self, templater_name="jinja", **kwargs):
         """Fetch a templater by name."""
+        # NB: Import here to avoid a circular import.
+        from sqlfluff.core.templaters import core_templater_names, load_core_templater
+
+        # Load core templaters directly, so that we only import the one
+        # we're using. Any others are provided by plugins.
+        if templater_name in core_templater_names():
+            return load_core_templater(templater_name)(**kwargs)
         templater_lookup = {
             templater.name: templater
             for templater in chain.from_iterable(
@@ -848,14 +910,56 @@ class FluffConfig:
             )
 
     def make_child_from_path(self, path: str) -> "FluffConfig":
-        """Make a child config at a path but pass on overrides and extra_config_path."""
-        return self.from_path(
+        """Make a child config at a path but pass on overrides and extra_config_path.
+
+        Child configs are cached by directory, so the files in a directory
+        share one config (until any of the config files it was loaded from
+        change). Use :meth:`copy` before changing a child config.
+        """
+        loader = ConfigLoader.get_global()
+        key = (
+            os.path.abspath(path if os.path.isdir(path) else os.path.dirname(path)),
+            # Which config files are found depends on the working directory.
+            os.getcwd(),
+            self._extra_config_path,
+            self._ignore_local_config,
+            repr(self._overrides),
+        )
+        stamps = loader.config_file_stamps(
+            loader.iter_config_paths_up_to_path(
+                path,
+                extra_config_path=self._extra_config_path,
+                ignore_local_config=self._ignore_local_config,
+            )
+        )
+        cached = loader._child_config_cache.get(key)
+        if cached and cached[0] == stamps:
+            return cached[1]
+        child = self.from_path(
             path,
             extra_config_path=self._extra_config_path,
             ignore_local_config=self._ignore_local_config,
             overrides=self._overrides,
             plugin_manager=self._plugin_manager,
         )
+        loader._child_config_cache[key] = (stamps, child)
+        return child
+
+    def copy(self) -> "FluffConfig":
+        """Return a copy of this config, which can be changed independently.
+
+        The dialect and templater objects are shared rather than copied.
+        """
+        config_copy = copy(self)
+        core = self._configs["core"]
+        # Pre-populate the memo so that deepcopy leaves these objects alone.
+        memo = {
+            id(core[key]): core[key]
+            for key in ("dialect_obj", "templater_obj")
+            if key in core
+        }
+        config_copy._configs = deepcopy(self._configs, memo)
+        return config_copy
 
     def diff_to(self, other: "FluffConfig") -> dict:
         """Compare this config to another.
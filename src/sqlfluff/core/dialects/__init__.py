@@ -9,16 +9,34 @@ dialects.
 
 Within .dialects, each dialect is free to depend on other dialects as
 required. Any dependent dialects will be loaded as needed.
+
+Expanding a dialect is relatively slow, so expanded dialects can also be
+stored as snapshots in the user cache directory (see
+`warm_dialect_snapshots`). If a snapshot exists for the current version
+of sqlfluff, `dialect_selector` will load that rather than expanding
+the dialect again.
 """
 
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
 from importlib import import_module
-from typing import Iterator, NamedTuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import appdirs
 
 # Eventually it would be a good to dynamically discover dialects
 # from any module beginning with "dialect_" within this folder.
 from sqlfluff.core.dialects.base import Dialect
 from sqlfluff.core.errors import SQLFluffUserError
 
+# Instantiate the dialect logger
+dialect_logger = logging.getLogger("sqlfluff.dialects")
+
 _dialect_lookup = {
     "ansi": ("dialect_ansi", "ansi_dialect"),
     "athena": ("dialect_athena", "athena_dialect"),
@@ -83,9 +101,137 @@ def dialect_readout() -> Iterator[DialectTuple]:
         )
 
 
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    """A fingerprint of the source which defines and expands dialects.
+
+    This covers the location, size and modification time of each module
+    in the dialects and parser packages, so that editing a dialect (e.g.
+    in a development install), or installing the same version elsewhere,
+    means that existing snapshots are no longer used.
+    """
+    import sqlfluff
+
+    package_dir = os.path.dirname(os.path.abspath(sqlfluff.__file__))
+    hasher = hashlib.sha256()
+    for sub_dir in (
+        "dialects",
+        os.path.join("core", "dialects"),
+        os.path.join("core", "parser"),
+    ):
+        for dirpath, dirnames, filenames in os.walk(os.path.join(package_dir, sub_dir)):
+            dirnames.sort()
+            for fname in sorted(filenames):
+                if not fname.endswith(".py"):
+                    continue
+                fpath = os.path.join(dirpath, fname)
+                stat = os.stat(fpath)
+                hasher.update(f"{fpath}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return hasher.hexdigest()[:16]
+
+
+def dialect_snapshot_dir() -> str:
+    """The directory which holds dialect snapshots for this version.
+
+    Snapshots are pickled, and reference the segment classes of each
+    dialect by name, so they're only valid for the same version of
+    sqlfluff and python, and the same dialect source, which created them.
+    """
+    # NB: Import here to avoid a circular import.
+    from sqlfluff import __version__
+
+    return os.path.join(
+        appdirs.user_cache_dir("sqlfluff", "sqlfluff"),
+        "dialects",
+        f"{__version__}-py{sys.version_info[0]}.{sys.version_info[1]}-"
+        f"{_source_fingerprint()}",
+    )
+
+
+def _snapshot_path(label: str, snapshot_dir: Optional[str] = None) -> str:
+    return os.path.join(snapshot_dir or dialect_snapshot_dir(), f"{label}.pickle")
+
+
+def load_dialect_snapshot(
+    label: str, snapshot_dir: Optional[str] = None
+) -> Optional[Dialect]:
+    """Load an expanded dialect from its snapshot, if there is one."""
+    if label not in _dialect_lookup:
+        return None
+    snapshot_path = _snapshot_path(label, snapshot_dir)
+    try:
+        with open(snapshot_path, "rb") as snapshot_file:
+            dialect = pickle.load(snapshot_file)
+    except FileNotFoundError:
+        return None
+    except Exception as err:  # pragma: no cover
+        # Anything could go wrong unpickling a stale or corrupt snapshot,
+        # in which case we just expand the dialect as normal.
+        dialect_logger.info(
+            "Ignoring unreadable dialect snapshot %s: %r", snapshot_path, err
+        )
+        return None
+    if not isinstance(dialect, Dialect) or not dialect.expanded:  # pragma: no cover
+        return None
+    return dialect
+
+
+def warm_dialect_snapshots(
+    labels: Optional[Iterable[str]] = None, snapshot_dir: Optional[str] = None
+) -> List[str]:
+    """Expand dialects and store snapshots of them for later use.
+
+    Args:
+        labels (iterable of :obj:`str`, optional): The dialects to store.
+            Defaults to all available dialects.
+        snapshot_dir (:obj:`str`, optional): Where to store them. Defaults
+            to :func:`dialect_snapshot_dir`.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The paths of the stored snapshots.
+    """
+    snapshot_dir = snapshot_dir or dialect_snapshot_dir()
+    os.makedirs(snapshot_dir, exist_ok=True)
+    paths = []
+    for label in sorted(labels or _dialect_lookup):
+        dialect = load_raw_dialect(label).expand()
+        snapshot_path = _snapshot_path(label, snapshot_dir)
+        # Write to a temporary file and then move it into place so that
+        # concurrent runs never read a partially written snapshot.
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=snapshot_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            pickle.dump(dialect, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp.name, snapshot_path)
+        paths.append(snapshot_path)
+    return paths
+
+
+# Expanded dialects kept in memory, if enabled by `cache_expanded_dialects`.
+_expanded_dialect_cache: Optional[Dict[str, Dialect]] = None
+
+
+def cache_expanded_dialects(enabled: bool = True) -> None:
+    """Keep expanded dialects in memory for the life of this process.
+
+    This is for long running processes (e.g. `sqlfluff serve`), which
+    would otherwise expand (or load) a dialect for every config they
+    create. Expanded dialects aren't modified once they're expanded, so
+    they can safely be shared.
+    """
+    global _expanded_dialect_cache
+    _expanded_dialect_cache = {} if enabled else None
+
+
 def dialect_selector(s: str) -> Dialect:
     """Return a dialect given its name."""
-    dialect = load_raw_dialect(s)
-    # Expand any callable references at this point.
-    # NOTE: The result of .expand() is a new class.
-    return dialect.expand()
+    if _expanded_dialect_cache is not None and s in _expanded_dialect_cache:
+        return _expanded_dialect_cache[s]
+    dialect = load_dialect_snapshot(s)
+    if dialect is None:
+        # Expand any callable references at this point.
+        # NOTE: The result of .expand() is a new class.
+        dialect = load_raw_dialect(s).expand()
+    if _expanded_dialect_cache is not None:
+        _expanded_dialect_cache[s] = dialect
+    return dialect
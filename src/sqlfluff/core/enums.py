@@ -9,6 +9,7 @@ class FormatType(Enum):
 
     human = "human"
     json = "json"
+    json_lines = "json-lines"
     yaml = "yaml"
     github_annotation = "github-annotation"
     github_annotation_native = "github-annotation-native"
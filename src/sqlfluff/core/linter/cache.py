@@ -0,0 +1,273 @@
+"""Defines the LintCache class.
+
+This persists the results of linting individual files between runs so that
+unchanged files (with unchanged config and rules) can skip templating,
+lexing, parsing and linting entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional, Type
+
+import appdirs
+
+from sqlfluff.core.config import FluffConfig
+from sqlfluff.core.errors import (
+    SQLBaseError,
+    SQLLexError,
+    SQLLintError,
+    SQLParseError,
+    SQLTemplaterError,
+)
+from sqlfluff.core.rules import BaseRule
+
+from sqlfluff.core.linter.common import NoQaDirective, RuleTuple
+from sqlfluff.core.linter.linted_file import LintedFile
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+# Bump this if the format of stored entries changes, so that
+# entries written by older versions are never read back.
+CACHE_FORMAT_VERSION = 1
+
+# Config values which only affect how results are displayed
+# or how the run is orchestrated, and not the results themselves.
+_OUTPUT_ONLY_CONFIG_KEYS = frozenset(
+    (
+        "verbose",
+        "nocolor",
+        "color",
+        "output_line_length",
+        "processes",
+        "cache",
+        "cache_dir",
+        "cache_max_entries",
+    )
+)
+
+_ERROR_TYPES: Dict[str, Type[SQLBaseError]] = {
+    "base": SQLBaseError,
+    "templating": SQLTemplaterError,
+    "lexing": SQLLexError,
+    "parsing": SQLParseError,
+    "linting": SQLLintError,
+}
+
+
+class LintCache:
+    """A persistent on-disk cache of linting results.
+
+    Each entry is a small json file holding the violations and noqa
+    directives for one file. Entries are keyed by a hash of the raw
+    file, the effective config, the selected rules and the sqlfluff
+    version, so any change in any of those results in a cache miss
+    rather than a stale result.
+
+    The modification time of each entry is refreshed whenever it is
+    read, and :meth:`prune` uses that to evict the least recently used
+    entries once the cache grows beyond `max_entries`.
+
+    NOTE: The key does not include files which are pulled in by the
+    templater (e.g. jinja macros or dbt models), so caching should
+    only be enabled where those are stable or included in the config.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = 0) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        # NB: Import here to avoid a circular import.
+        from sqlfluff import __version__
+        from sqlfluff.core.plugin.host import get_plugin_manager
+
+        self._version = __version__
+        # Plugins can be upgraded without changing their rule codes, so
+        # include the version of each installed plugin distribution.
+        self._plugin_versions = ",".join(
+            sorted(
+                {
+                    f"{dist.project_name}=={dist.version}"
+                    for _, dist in get_plugin_manager().list_plugin_distinfo()
+                }
+            )
+        )
+
+    @classmethod
+    def from_config(cls, config: FluffConfig) -> Optional["LintCache"]:
+        """Create a cache from config, or return None if caching is disabled."""
+        if not config.get("cache"):
+            return None
+        cache_dir = config.get("cache_dir") or os.path.join(
+            appdirs.user_cache_dir("sqlfluff", "sqlfluff"), "lint"
+        )
+        return cls(cache_dir, max_entries=config.get("cache_max_entries", default=0))
+
+    def make_key(
+        self, raw_str: str, config: FluffConfig, rule_set: List[BaseRule]
+    ) -> str:
+        """Generate the key for a file, given its config and rule set.
+
+        Rules are identified by their code and the module and class which
+        implement them, alongside the versions of installed plugins.
+        """
+        hasher = hashlib.sha256()
+        for part in (
+            str(CACHE_FORMAT_VERSION),
+            self._version,
+            self._plugin_versions,
+            repr(
+                [
+                    (indent, key, val)
+                    for indent, key, val in config.iter_vals()
+                    if key not in _OUTPUT_ONLY_CONFIG_KEYS
+                ]
+            ),
+            ",".join(
+                f"{rule.code}:{type(rule).__module__}.{type(rule).__qualname__}"
+                for rule in rule_set
+            ),
+            raw_str,
+        ):
+            hasher.update(part.encode("utf8", errors="backslashreplace"))
+            # Separate the parts so they can't run into each other.
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        # Shard entries by the first two characters to keep
+        # directories at a manageable size.
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    @staticmethod
+    def _serialise_violation(violation: SQLBaseError) -> dict:
+        return {
+            "type": violation._identifier,
+            "code": violation.rule_code(),
+            "description": violation.desc(),
+            "line_no": violation.line_no,
+            "line_pos": violation.line_pos,
+            "ignore": violation.ignore,
+            "warning": violation.warning,
+            "fatal": violation.fatal,
+            "fixable": violation.fixable,
+        }
+
+    @staticmethod
+    def _deserialise_violation(record: dict) -> SQLBaseError:
+        kwargs = dict(
+            line_no=record["line_no"],
+            line_pos=record["line_pos"],
+            ignore=record["ignore"],
+            warning=record["warning"],
+            fatal=record["fatal"],
+        )
+        error_type = _ERROR_TYPES.get(record["type"], SQLBaseError)
+        if error_type is SQLLintError:
+            # We no longer have the rule itself, but a RuleTuple provides
+            # the code and description which the rest of the linter needs.
+            return SQLLintError(
+                description=record["description"],
+                rule=RuleTuple(record["code"], record["description"]),
+                **kwargs,
+            )
+        violation = error_type(record["description"], **kwargs)
+        violation._code = record["code"]
+        return violation
+
+    def load(self, key: str, fname: str, fix: bool = False) -> Optional[LintedFile]:
+        """Fetch a LintedFile from the cache, returning None on a miss.
+
+        Cached results don't hold the parse tree or any fixes, so when
+        fixing we only use entries which have nothing to fix.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, encoding="utf8") as entry_file:
+                entry = json.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):  # pragma: no cover
+            linter_logger.info("Ignoring unreadable cache entry %s", entry_path)
+            return None
+
+        if fix and any(record["fixable"] for record in entry["violations"]):
+            return None
+
+        # Mark this entry as recently used.
+        try:
+            os.utime(entry_path)
+        except OSError:  # pragma: no cover
+            pass
+
+        linter_logger.info("Using cached lint result for %s", fname)
+        return LintedFile(
+            fname,
+            [self._deserialise_violation(record) for record in entry["violations"]],
+            {},
+            None,
+            ignore_mask=[NoQaDirective(*directive) for directive in entry["ignore"]],
+            templated_file=None,  # type: ignore
+            encoding=entry["encoding"],
+        )
+
+    def store(self, key: str, linted_file: LintedFile) -> None:
+        """Write the result of linting a file to the cache."""
+        # Fatal errors halt the run, so should always be re-raised.
+        if any(v.fatal for v in linted_file.violations):  # pragma: no cover
+            return
+        entry = {
+            "violations": [
+                self._serialise_violation(v) for v in linted_file.violations
+            ],
+            "ignore": [list(directive) for directive in linted_file.ignore_mask],
+            "encoding": linted_file.encoding,
+        }
+        entry_path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # Write to a temporary file and then move it into place so that
+            # concurrent runs never read a partially written entry.
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf8",
+                dir=os.path.dirname(entry_path),
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                json.dump(entry, tmp)
+            os.replace(tmp.name, entry_path)
+        except OSError as err:  # pragma: no cover
+            linter_logger.warning("Unable to write to lint cache: %s", err)
+
+    def prune(self) -> int:
+        """Evict least recently used entries beyond `max_entries`.
+
+        Returns:
+            The number of entries removed.
+        """
+        if not self.max_entries or not os.path.isdir(self.cache_dir):
+            return 0
+        entries = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for fname in filenames:
+                if fname.endswith(".json"):
+                    fpath = os.path.join(dirpath, fname)
+                    try:
+                        entries.append((os.path.getmtime(fpath), fpath))
+                    except OSError:  # pragma: no cover
+                        continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        # Oldest first.
+        entries.sort()
+        for _, fpath in entries[:excess]:
+            try:
+                os.remove(fpath)
+            except OSError:  # pragma: no cover
+                pass
+        linter_logger.info("Pruned %s entries from the lint cache.", excess)
+        return excess
@@ -58,6 +58,8 @@ class ParsedString(NamedTuple):
             took in the process.
         `templated_file` is a :obj:`TemplatedFile` containing the details
             of the templated file.
+        `parse_statistics` is a :obj:`dict` containing counters from the
+            parser, e.g. how often the match memo was hit.
     """
 
     tree: Optional[BaseSegment]
@@ -67,3 +69,4 @@ class ParsedString(NamedTuple):
     config: FluffConfig
     fname: str
     source_str: str
+    parse_statistics: Dict[str, int] = {}
@@ -19,6 +19,7 @@ from sqlfluff.core.errors import (
     CheckTuple,
 )
 from sqlfluff.core.parser.segments.base import BaseSegment
+from sqlfluff.core.timing import TimingSummary
 
 from sqlfluff.core.linter.linted_file import LintedFile
 
@@ -30,13 +31,30 @@ class LintedDir:
     a common root.
     """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, retain_files: bool = True) -> None:
         self.files: List[LintedFile] = []
         self.path: str = path
+        # If files aren't retained, only running totals are kept for
+        # the stats and summaries, so memory use doesn't grow with the
+        # number of files. Anything else needs the files themselves.
+        self.retain_files = retain_files
+        self._stats: Dict[str, int] = dict(files=0, clean=0, unclean=0, violations=0)
+        self._timing = TimingSummary()
+        self._parse_statistics: Dict[str, int] = {}
 
     def add(self, file: LintedFile) -> None:
         """Add a file to this path."""
-        self.files.append(file)
+        if self.retain_files:
+            self.files.append(file)
+            return
+        is_clean = file.is_clean()
+        self._stats["files"] += 1
+        self._stats["clean"] += is_clean
+        self._stats["unclean"] += not is_clean
+        self._stats["violations"] += file.num_violations()
+        self._timing.add(file.time_dict)
+        for key, val in file.parse_statistics.items():
+            self._parse_statistics[key] = self._parse_statistics.get(key, 0) + val
 
     @overload
     def check_tuples(
@@ -83,6 +101,8 @@ class LintedDir:
 
     def num_violations(self, **kwargs) -> int:
         """Count the number of violations in the path."""
+        if not self.retain_files and not kwargs:
+            return self._stats["violations"]
         return sum(file.num_violations(**kwargs) for file in self.files)
 
     def get_violations(self, **kwargs) -> list:
@@ -98,6 +118,8 @@ class LintedDir:
 
     def stats(self) -> Dict[str, int]:
         """Return a dict containing linting stats about this path."""
+        if not self.retain_files:
+            return dict(self._stats)
         return dict(
             files=len(self.files),
             clean=sum(file.is_clean() for file in self.files),
@@ -105,6 +127,25 @@ class LintedDir:
             violations=sum(file.num_violations() for file in self.files),
         )
 
+    def timing_summary(self) -> TimingSummary:
+        """Return the timings of the files in this path."""
+        if not self.retain_files:
+            return self._timing
+        timing = TimingSummary()
+        for file in self.files:
+            timing.add(file.time_dict)
+        return timing
+
+    def parse_statistics_summary(self) -> Dict[str, int]:
+        """Return the parser counters, summed across the files in this path."""
+        if not self.retain_files:
+            return dict(self._parse_statistics)
+        totals: Dict[str, int] = {}
+        for file in self.files:
+            for key, val in file.parse_statistics.items():
+                totals[key] = totals.get(key, 0) + val
+        return totals
+
     def persist_changes(
         self, formatter: Any = None, fixed_file_suffix: str = "", **kwargs
     ) -> Dict[str, Union[bool, str]]:
@@ -5,6 +5,7 @@ contains all of the routines to apply fixes to that file
 post linting.
 """
 
+import copy
 import os
 import logging
 import shutil
@@ -12,6 +13,7 @@ import stat
 import tempfile
 from typing import (
     Any,
+    Dict,
     Iterable,
     List,
     NamedTuple,
@@ -33,7 +35,7 @@ from sqlfluff.core.templaters import TemplatedFile, RawFileSlice
 # Classes needed only for type checking
 from sqlfluff.core.parser.segments import BaseSegment, FixPatch
 
-from sqlfluff.core.linter.common import NoQaDirective
+from sqlfluff.core.linter.common import NoQaDirective, RuleTuple
 
 # Instantiate the linter logger
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
@@ -49,6 +51,45 @@ class LintedFile(NamedTuple):
     ignore_mask: List[NoQaDirective]
     templated_file: TemplatedFile
     encoding: str
+    parse_statistics: Dict[str, int] = {}
+    # The patches to fix the file, for when the tree has been dropped.
+    source_patches: Optional[List[FixPatch]] = None
+
+    def compact(self, fix: bool = False) -> "LintedFile":
+        """Return a copy of this file which is cheap to pass between processes.
+
+        The parse tree is dropped, along with the references to it (and to
+        the rules) held by each violation. When fixing, the patches to fix
+        the file are generated first so that :meth:`fix_string` still works,
+        and the violations keep their fixes, which show whether each one is
+        fixable. Otherwise the templated file is dropped too.
+        """
+        violations = [self._compact_violation(v, fix) for v in self.violations]
+        if not fix:
+            return self._replace(violations=violations, tree=None, templated_file=None)
+        source_patches = self.source_patches
+        if self.tree and self.templated_file:
+            source_patches = self._generate_source_patches(
+                self.tree, self.templated_file
+            )
+        return self._replace(
+            violations=violations, tree=None, source_patches=source_patches
+        )
+
+    @staticmethod
+    def _compact_violation(violation: SQLBaseError, fix: bool) -> SQLBaseError:
+        """Copy a violation without references to segments or rules."""
+        compacted = copy.copy(violation)
+        if getattr(compacted, "segment", None):
+            compacted.segment = None  # type: ignore
+        if isinstance(compacted, SQLLintError):
+            if not isinstance(compacted.rule, RuleTuple):
+                compacted.rule = RuleTuple(
+                    compacted.rule.code, compacted.rule.description
+                )
+            if not fix:
+                compacted.fixes = []
+        return compacted
 
     def check_tuples(self, raise_on_non_linting_violations=True) -> List[CheckTuple]:
         """Make a list of check_tuples.
@@ -275,8 +316,9 @@ class LintedFile(NamedTuple):
         Lexer from portions of strings after templating.
         """
         linter_logger.debug("Original Tree: %r", self.templated_file.templated_str)
-        assert self.tree
-        linter_logger.debug("Fixed Tree: %r", self.tree.raw)
+        if self.source_patches is None:
+            assert self.tree
+            linter_logger.debug("Fixed Tree: %r", self.tree.raw)
 
         # The sliced file is contiguous in the TEMPLATED space.
         # NB: It has gaps and repeats in the source space.
@@ -300,9 +342,13 @@ class LintedFile(NamedTuple):
         # the right order for the source file without any duplicates.
         # TODO: Requires a mechanism for generating patches for source only
         # fixes.
-        filtered_source_patches = self._generate_source_patches(
-            self.tree, self.templated_file
-        )
+        # If the tree was dropped, the patches were generated beforehand.
+        if self.source_patches is not None:
+            filtered_source_patches = self.source_patches
+        else:
+            filtered_source_patches = self._generate_source_patches(
+                self.tree, self.templated_file
+            )
 
         # Any Template tags in the source file are off limits, unless
         # we're explicitly fixing the source file.
@@ -1,12 +1,19 @@
 """Defines the linter class."""
 
 import fnmatch
+import json
 import os
+from collections import defaultdict, deque
+from copy import copy
 import time
 import logging
+import multiprocessing
+import threading
 from typing import (
     Any,
-    Iterable,
+    Collection,
+    Deque,
+    Dict,
     Iterator,
     List,
     Optional,
@@ -29,10 +36,11 @@ from sqlfluff.core.errors import (
     SQLFluffSkipFile,
     SQLFluffUserError,
 )
-from sqlfluff.core.parser import Lexer, Parser, RegexLexer
+from sqlfluff.core.parser import Lexer, Parser, PositionMarker, RegexLexer
 from sqlfluff.core.file_helpers import get_encoding
 from sqlfluff.core.templaters import TemplatedFile
 from sqlfluff.core.rules import get_ruleset
+from sqlfluff.core.rules.base import crawl_rules
 from sqlfluff.core.rules.doc_decorators import is_fix_compatible
 from sqlfluff.core.config import FluffConfig, ConfigLoader, progress_bar_configuration
 
@@ -48,16 +56,20 @@ from sqlfluff.core.linter.common import (
     NoQaDirective,
     RenderedFile,
 )
+from sqlfluff.core.linter.cache import LintCache
 from sqlfluff.core.linter.linted_file import LintedFile
 from sqlfluff.core.linter.linted_dir import LintedDir
 from sqlfluff.core.linter.linting_result import LintingResult
 
 
-WalkableType = Iterable[Tuple[str, Optional[List[str]], List[str]]]
-
 # Instantiate the linter logger
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
 
+# Rule sets, by the user rules and the config used to make them. Rules
+# may keep state on themselves while they're being evaluated, so each
+# thread (and so each worker process) keeps its own instances.
+_ruleset_cache = threading.local()
+
 
 class Linter:
     """The interface class to interact with the linter."""
@@ -92,15 +104,43 @@ class Linter:
         self.formatter = formatter
         # Store references to user rule classes
         self.user_rules = user_rules or []
+        # Set up the persistent lint result cache (if enabled)
+        self.cache = LintCache.from_config(self.config)
+        # Compiled .sqlfluffignore specs, by the path of the ignore file.
+        self._ignore_spec_cache: Dict[str, Tuple[int, pathspec.PathSpec, bool]] = {}
+
+    @staticmethod
+    def _ruleset_fingerprint(config: FluffConfig) -> str:
+        """A fingerprint of the config which selects and configures rules."""
+        return json.dumps(
+            [
+                config.get("rule_allowlist"),
+                config.get("rule_denylist"),
+                config.get_section("rules"),
+            ],
+            sort_keys=True,
+            default=repr,
+        )
 
     def get_ruleset(self, config: Optional[FluffConfig] = None) -> List[BaseRule]:
-        """Get hold of a set of rules."""
-        rs = get_ruleset()
-        # Register any user rules
-        for rule in self.user_rules:
-            rs.register(rule)
+        """Get hold of a set of rules.
+
+        Most files share the same rule config, so rule sets are reused
+        for any config with the same fingerprint.
+        """
         cfg = config or self.config
-        return rs.get_rulelist(config=cfg)
+        key = (tuple(self.user_rules), self._ruleset_fingerprint(cfg))
+        if not hasattr(_ruleset_cache, "rule_sets"):
+            _ruleset_cache.rule_sets = {}
+        rule_list = _ruleset_cache.rule_sets.get(key)
+        if rule_list is None:
+            rs = get_ruleset()
+            # Register any user rules
+            for rule in self.user_rules:
+                rs.register(rule)
+            rule_list = rs.get_rulelist(config=cfg)
+            _ruleset_cache.rule_sets[key] = rule_list
+        return list(rule_list)
 
     def rule_tuples(self) -> List[RuleTuple]:
         """A simple pass through to access the rule tuples of the rule set."""
@@ -132,8 +172,11 @@ class Linter:
                 )
         with open(fname, encoding=encoding, errors="backslashreplace") as target_file:
             raw_file = target_file.read()
-        # Scan the raw file for config commands.
-        file_config.process_raw_file_for_config(raw_file)
+        # Scan the raw file for config commands. Child configs are shared
+        # by the files in a directory, so copy it before changing it.
+        if "-- sqlfluff" in raw_file:
+            file_config = file_config.copy()
+            file_config.process_raw_file_for_config(raw_file)
         # Return the raw file and config
         return raw_file, file_config, encoding
 
@@ -215,6 +258,7 @@ class Linter:
         config: FluffConfig,
         recurse: bool = True,
         fname: Optional[str] = None,
+        parse_statistics: Optional[Dict[str, int]] = None,
     ) -> Tuple[Optional[BaseSegment], List[SQLParseError]]:
         parser = Parser(config=config)
         violations = []
@@ -224,6 +268,7 @@ class Linter:
                 tokens,
                 recurse=recurse,
                 fname=fname,
+                parse_statistics=parse_statistics,
             )
         except SQLParseError as err:
             linter_logger.info("PARSING FAILED! : %s", err)
@@ -235,25 +280,131 @@ class Linter:
             linter_logger.info("\n" + parsed.stringify())
             # We may succeed parsing, but still have unparsable segments. Extract them
             # here.
-            for unparsable in parsed.iter_unparsables():
-                # No exception has been raised explicitly, but we still create one here
-                # so that we can use the common interface
-                violations.append(
-                    SQLParseError(
-                        "Line {0[0]}, Position {0[1]}: Found unparsable section: "
-                        "{1!r}".format(
-                            unparsable.pos_marker.working_loc,
-                            unparsable.raw
-                            if len(unparsable.raw) < 40
-                            else unparsable.raw[:40] + "...",
-                        ),
-                        segment=unparsable,
-                    )
-                )
-                linter_logger.info("Found unparsable segment...")
-                linter_logger.info(unparsable.stringify())
+            violations += Linter._unparsable_violations(parsed)
         return parsed, violations
 
+    @staticmethod
+    def _get_parse_processes(config: FluffConfig) -> int:
+        """Get the number of processes to parse the statements of a file with.
+
+        As with the `processes` config value, zero or negative values are
+        relative to the number of cpus. Statements are only parsed in
+        parallel from the main process, because the processes used to lint
+        several files at once can't start processes of their own.
+        """
+        processes = config.get("parse_processes", default=1)
+        if processes <= 0:
+            processes = max(multiprocessing.cpu_count() + processes, 1)
+        if multiprocessing.current_process().daemon:
+            return 1
+        return processes
+
+    @classmethod
+    def _parse_tokens_in_parallel(
+        cls,
+        tokens: Sequence[BaseSegment],
+        config: FluffConfig,
+        processes: int,
+        recurse: bool = True,
+        fname: Optional[str] = None,
+        parse_statistics: Optional[Dict[str, int]] = None,
+    ) -> Optional[BaseSegment]:
+        """Parse the statements of a file in a process pool.
+
+        The tokens are split into chunks of whole statements, at statement
+        delimiters outside any brackets, and each chunk is parsed in its own
+        process. The results are joined back together into a single file
+        segment, positioned using the original tokens.
+
+        Returns None if the file can't be split cleanly, in which case it
+        should be parsed as normal. That's the case if it has templated
+        blocks (which may span statements), is too short to split, or if
+        any chunk can't be parsed on its own.
+        """
+        # Meta segments other than the end of file come from templated blocks.
+        if any(token.is_meta for token in tokens[:-1]):
+            return None
+
+        # Find where we could split the file.
+        split_points = []
+        bracket_depth = 0
+        for idx, token in enumerate(tokens):
+            if token.raw == "(":
+                bracket_depth += 1
+            elif token.raw == ")":
+                bracket_depth -= 1
+            elif token.raw == ";" and bracket_depth == 0:
+                split_points.append(idx + 1)
+
+        # Divide it into a few chunks per process, to balance the load.
+        target_size = len(tokens) // (processes * 4) or 1
+        chunks = []
+        chunk_start = 0
+        for split_point in split_points:
+            if split_point - chunk_start >= target_size:
+                chunks.append(tokens[chunk_start:split_point])
+                chunk_start = split_point
+        if chunk_start < len(tokens):
+            chunks.append(tokens[chunk_start:])
+        if len(chunks) < 2:
+            return None
+
+        linter_logger.info(
+            "Parsing %s chunks of statements with %s processes.",
+            len(chunks),
+            processes,
+        )
+        # to avoid circular import
+        from sqlfluff.core.linter.runner import parse_statements_in_parallel
+
+        results = parse_statements_in_parallel(
+            chunks, config, processes, recurse=recurse, fname=fname
+        )
+        if any(segments is None for segments, _ in results):
+            linter_logger.info("Unable to parse statements separately.")
+            return None
+
+        if parse_statistics is not None:
+            for _, chunk_statistics in results:
+                for key, value in chunk_statistics.items():
+                    parse_statistics[key] = parse_statistics.get(key, 0) + value
+        # The parsed segments are copies from other processes, so position them
+        # using the original tokens.
+        raw_iter = iter([token for token in tokens if not token.is_meta])
+        return config.get("dialect_obj").get_root_segment()(
+            segments=BaseSegment._position_segments(
+                tuple(
+                    cls._reposition_reused(segment, raw_iter)
+                    for segments, _ in results
+                    for segment in cast(Tuple[BaseSegment, ...], segments)
+                )
+            ),
+            fname=fname,
+        )
+
+    @staticmethod
+    def _unparsable_violations(parsed: BaseSegment) -> List[SQLParseError]:
+        """Create a violation for each unparsable section of a parsed tree."""
+        violations = []
+        for unparsable in parsed.iter_unparsables():
+            # No exception has been raised explicitly, but we still create one here
+            # so that we can use the common interface
+            violations.append(
+                SQLParseError(
+                    "Line {0[0]}, Position {0[1]}: Found unparsable section: "
+                    "{1!r}".format(
+                        unparsable.pos_marker.working_loc,
+                        unparsable.raw
+                        if len(unparsable.raw) < 40
+                        else unparsable.raw[:40] + "...",
+                    ),
+                    segment=unparsable,
+                )
+            )
+            linter_logger.info("Found unparsable segment...")
+            linter_logger.info(unparsable.stringify())
+        return violations
+
     @staticmethod
     def parse_noqa(
         comment: str,
@@ -386,16 +537,28 @@ class Linter:
         t1 = time.monotonic()
         linter_logger.info("PARSING (%s)", rendered.fname)
 
-        if tokens:
+        # Counters for the match memo, which are reported under --bench.
+        parse_statistics = {"parse memo hits": 0, "parse memo misses": 0}
+        parsed: Optional[BaseSegment] = None
+        parse_processes = cls._get_parse_processes(rendered.config)
+        if tokens and parse_processes > 1:
+            parsed = cls._parse_tokens_in_parallel(
+                tokens,
+                rendered.config,
+                parse_processes,
+                recurse=recurse,
+                fname=rendered.fname,
+                parse_statistics=parse_statistics,
+            )
+        if tokens and not parsed:
             parsed, pvs = cls._parse_tokens(
                 tokens,
                 rendered.config,
                 recurse=recurse,
                 fname=rendered.fname,
+                parse_statistics=parse_statistics,
             )
             violations += pvs
-        else:
-            parsed = None
 
         time_dict = {
             **rendered.time_dict,
@@ -410,6 +573,180 @@ class Linter:
             rendered.config,
             rendered.fname,
             rendered.source_str,
+            parse_statistics,
+        )
+
+    @staticmethod
+    def _reposition_reused(
+        segment: BaseSegment, new_raws: Iterator[BaseSegment]
+    ) -> BaseSegment:
+        """Copy a segment from a previous parse, with positions from a new lex.
+
+        The raw segments of `segment` are matched up in order with those
+        in `new_raws`, which must have the same content. Meta segments
+        are positioned relative to their neighbours, as in the parser.
+        """
+        new_seg = copy(segment)
+        if segment.is_raw():
+            new_seg.pos_marker = None if segment.is_meta else next(new_raws).pos_marker
+            return new_seg
+        children = BaseSegment._position_segments(
+            tuple(
+                Linter._reposition_reused(child, new_raws) for child in segment.segments
+            )
+        )
+        new_seg.segments = children
+        new_seg.pos_marker = PositionMarker.from_child_markers(
+            *(child.pos_marker for child in children)
+        )
+        return new_seg
+
+    @classmethod
+    def reparse_rendered(
+        cls,
+        previous: ParsedString,
+        rendered: RenderedFile,
+        recurse: bool = True,
+    ) -> ParsedString:
+        """Parse a rendered file, reusing statements from a previous parse.
+
+        Top level statements which are unchanged since `previous` (and
+        which are separated from any changes by a statement delimiter)
+        are reused rather than parsed again. Only the statements between
+        them are parsed, which makes small edits to large files much
+        quicker to reparse. The result is the same as from
+        :meth:`parse_rendered`.
+
+        Statements are only reused if neither version of the file has any
+        templated sections, otherwise this falls back to a full parse.
+        """
+        if not (
+            previous.tree
+            and previous.templated_file
+            and rendered.templated_file
+            and previous.templated_file.templated_str
+            == previous.templated_file.source_str
+            and rendered.templated_file.templated_str
+            == rendered.templated_file.source_str
+        ):
+            return cls.parse_rendered(rendered, recurse=recurse)
+
+        t0 = time.monotonic()
+        violations = cast(List[SQLBaseError], rendered.templater_violations)
+        tokens, lvs, config = cls._lex_templated_file(
+            rendered.templated_file, rendered.config
+        )
+        violations += lvs
+        if not tokens:  # pragma: no cover
+            return cls.parse_rendered(rendered, recurse=recurse)
+
+        t1 = time.monotonic()
+        linter_logger.info("REPARSING (%s)", rendered.fname)
+
+        # Find how many raw segments are unchanged at each end of the file.
+        old_raws = [seg for seg in previous.tree.raw_segments if not seg.is_meta]
+        new_raws = [seg for seg in tokens if not seg.is_meta]
+        max_common = min(len(old_raws), len(new_raws))
+        common_prefix = 0
+        while (
+            common_prefix < max_common
+            and old_raws[common_prefix].raw == new_raws[common_prefix].raw
+        ):
+            common_prefix += 1
+        common_suffix = 0
+        while (
+            common_suffix < max_common - common_prefix
+            and old_raws[-1 - common_suffix].raw == new_raws[-1 - common_suffix].raw
+        ):
+            common_suffix += 1
+
+        # Reuse whole top level segments, up to (and from) the last (and
+        # first) statement delimiter which is unchanged.
+        children = previous.tree.segments
+        raw_counts = [
+            sum(not seg.is_meta for seg in child.raw_segments) for child in children
+        ]
+        prefix_children = 0
+        prefix_raws = 0
+        raw_idx = 0
+        for idx, child in enumerate(children):
+            raw_idx += raw_counts[idx]
+            if raw_idx > common_prefix:
+                break
+            if child.is_type("statement_terminator"):
+                prefix_children = idx + 1
+                prefix_raws = raw_idx
+        suffix_children = 0
+        suffix_raws = 0
+        raw_idx = 0
+        for idx in range(len(children) - 1, prefix_children - 1, -1):
+            raw_idx += raw_counts[idx]
+            if raw_idx > common_suffix:
+                break
+            if children[idx].is_type("statement_terminator"):
+                suffix_children = len(children) - idx
+                suffix_raws = raw_idx
+
+        # Parse whatever's left in between.
+        # NOTE: The final meta segment (end of file) is always in the suffix, if
+        # there is one.
+        middle_tokens = tokens[
+            prefix_raws : len(tokens) - suffix_raws - (1 if suffix_children else 0)
+        ]
+        parse_statistics = {"parse memo hits": 0, "parse memo misses": 0}
+        middle: Tuple[BaseSegment, ...] = ()
+        if middle_tokens:
+            middle_tree, pvs = cls._parse_tokens(
+                middle_tokens,
+                config,
+                recurse=recurse,
+                fname=rendered.fname,
+                parse_statistics=parse_statistics,
+            )
+            if pvs or not middle_tree:
+                # If we can't parse the changed section on its own, that may be
+                # because of how we've divided up the file, so parse all of it.
+                linter_logger.info("Unable to reparse section. Parsing whole file.")
+                return cls.parse_rendered(rendered, recurse=recurse)
+            middle = middle_tree.segments
+
+        linter_logger.info(
+            "Reusing %s of %s top level segments.",
+            prefix_children + suffix_children,
+            len(children),
+        )
+        prefix_iter = iter(new_raws[:prefix_raws])
+        suffix_iter = iter(new_raws[len(new_raws) - suffix_raws :])
+        parsed = type(previous.tree)(
+            segments=BaseSegment._position_segments(
+                tuple(
+                    cls._reposition_reused(child, prefix_iter)
+                    for child in children[:prefix_children]
+                )
+                + middle
+                + tuple(
+                    cls._reposition_reused(child, suffix_iter)
+                    for child in children[len(children) - suffix_children :]
+                )
+            ),
+            fname=rendered.fname,
+        )
+        violations += cls._unparsable_violations(parsed)
+
+        time_dict = {
+            **rendered.time_dict,
+            "lexing": t1 - t0,
+            "parsing": time.monotonic() - t1,
+        }
+        return ParsedString(
+            parsed,
+            violations,
+            time_dict,
+            rendered.templated_file,
+            rendered.config,
+            rendered.fname,
+            rendered.source_str,
+            parse_statistics,
         )
 
     @classmethod
@@ -494,8 +831,11 @@ class Linter:
         initial_linting_errors = []
         # A placeholder for the fixes we had on the previous loop
         last_fixes = None
-        # Keep a set of previous versions to catch infinite loops.
-        previous_versions: Set[Tuple[str, Tuple[SourceFix, ...]]] = {(tree.raw, ())}
+        # Keep a set of previous versions to catch infinite loops. We keep
+        # the (rolling) hash of each version, rather than the whole raw.
+        previous_versions: Set[Tuple[Tuple[int, int], Tuple[SourceFix, ...]]] = {
+            (tree.raw_hash, ())
+        }
 
         # If we are fixing then we want to loop up to the runaway_limit, otherwise just
         # once for linting.
@@ -548,6 +888,7 @@ class Linter:
                     # In order to compute initial_linting_errors correctly, need
                     # to run all rules on the first loop of the main phase.
                     rules_this_phase = rule_set
+
                 progress_bar_crawler = tqdm(
                     rules_this_phase,
                     desc="lint by rules",
@@ -555,6 +896,28 @@ class Linter:
                     disable=progress_bar_configuration.disable_progress_bar,
                 )
 
+                if not fix:
+                    # When we're only linting, the tree doesn't change between
+                    # rules, so walk it once for all of them rather than once
+                    # for each rule. The progress bar then tracks the collection
+                    # of each rule's results.
+                    rule_results = crawl_rules(
+                        rules_this_phase,
+                        tree,
+                        dialect=config.get("dialect_obj"),
+                        fix=fix,
+                        templated_file=templated_file,
+                        ignore_mask=ignore_buff,
+                        fname=fname,
+                        config=config,
+                    )
+                    for crawler, (linting_errors, _) in zip(
+                        progress_bar_crawler, rule_results
+                    ):
+                        progress_bar_crawler.set_description(f"rule {crawler.code}")
+                        initial_linting_errors += linting_errors
+                    continue
+
                 for crawler in progress_bar_crawler:
                     # Performance: After first loop pass, skip rules that don't
                     # do fixes. Any results returned won't be seen by the user
@@ -617,10 +980,10 @@ class Linter:
                                 config.get("dialect_obj"), crawler.code, anchor_info
                             )
                             # Check for infinite loops. We use a combination of the
-                            # fixed templated file and the list of source fixes to
-                            # apply.
+                            # hash of the fixed templated file and the list of
+                            # source fixes to apply.
                             loop_check_tuple = (
-                                new_tree.raw,
+                                new_tree.raw_hash,
                                 tuple(new_tree.source_fixes),
                             )
                             if loop_check_tuple not in previous_versions:
@@ -743,6 +1106,7 @@ class Linter:
             ignore_mask=ignore_buff,
             templated_file=parsed.templated_file,
             encoding=encoding,
+            parse_statistics=parsed.parse_statistics,
         )
 
         # This is the main command line output from linting.
@@ -873,6 +1237,25 @@ class Linter:
 
         return self.parse_rendered(rendered, recurse=recurse)
 
+    def reparse_string(
+        self,
+        previous: ParsedString,
+        in_str: str,
+        recurse: bool = True,
+        encoding: str = "utf-8",
+    ) -> ParsedString:
+        """Parse an edited version of a previously parsed string.
+
+        This is intended for editors, which reparse the same file after
+        each small edit. Unchanged statements are reused from `previous`
+        (see :meth:`reparse_rendered`), and the config and file name of
+        `previous` are used again.
+        """
+        config = previous.config
+        config.process_raw_file_for_config(in_str)
+        rendered = self.render_string(in_str, previous.fname, config, encoding)
+        return self.reparse_rendered(previous, rendered, recurse=recurse)
+
     def fix(
         self,
         tree: BaseSegment,
@@ -948,29 +1331,39 @@ class Linter:
             encoding=encoding,
         )
 
-    def paths_from_path(
+    def _load_ignore_spec(self, fpath: str) -> Tuple[pathspec.PathSpec, bool]:
+        """Load an ignore file, reusing the compiled spec until the file changes.
+
+        Also returns whether the spec can prune whole directories, which
+        isn't the case if any of its patterns re-include files.
+        """
+        key = os.path.abspath(fpath)
+        stamp = os.stat(fpath).st_mtime_ns
+        cached = self._ignore_spec_cache.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2]
+        with open(fpath) as fh:
+            spec = pathspec.PathSpec.from_lines("gitwildmatch", fh)
+        can_prune = all(pattern.include is not False for pattern in spec.patterns)
+        self._ignore_spec_cache[key] = (stamp, spec, can_prune)
+        return spec, can_prune
+
+    def iter_paths_from_path(
         self,
         path: str,
         ignore_file_name: str = ".sqlfluffignore",
         ignore_non_existent_files: bool = False,
         ignore_files: bool = True,
-        working_path: str = os.getcwd(),
-    ) -> List[str]:
-        """Return a set of sql file paths from a potentially more ambiguous path string.
-
-        Here we also deal with the .sqlfluffignore file if present.
-
-        When a path to a file to be linted is explicitly passed
-        we look for ignore files in all directories that are parents of the file,
-        up to the current directory.
-
-        If the current directory is not a parent of the file we only
-        look for an ignore file in the direct parent of the file.
+        working_path: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Iterate the sql file paths in a path, in the order they're found.
 
+        See :meth:`paths_from_path` for how .sqlfluffignore files apply.
+        Directories which are ignored entirely aren't walked at all.
         """
         if not os.path.exists(path):
             if ignore_non_existent_files:
-                return []
+                return
             else:
                 raise SQLFluffUserError(
                     f"Specified path does not exist. Check it/they exist(s): {path}."
@@ -979,106 +1372,129 @@ class Linter:
         # Files referred to exactly are also ignored if
         # matched, but we warn the users when that happens
         is_exact_file = os.path.isfile(path)
+        root_dir = os.path.dirname(path) if is_exact_file else path
+        sql_file_exts = tuple(
+            self.config.get("sql_file_exts", default=".sql").lower().split(",")
+        )
+        # NB: Paths are only normalised when checking ignore files.
+        normalise = os.path.normpath if ignore_files else str
+
+        # The ignore specs which apply to the directory being walked, each
+        # as (directory, spec, path from that directory, can prune).
+        root_specs: List[Tuple[str, pathspec.PathSpec, str, bool]] = []
+        if ignore_files:
+            real_root_dir = os.path.realpath(root_dir or ".")
+            for ignore_file_path in sorted(
+                ConfigLoader.find_ignore_config_files(
+                    path=path,
+                    working_path=working_path,
+                    ignore_file_name=ignore_file_name,
+                )
+            ):
+                ignore_base = os.path.dirname(ignore_file_path)
+                spec, can_prune = self._load_ignore_spec(ignore_file_path)
+                rel_path = os.path.relpath(real_root_dir, ignore_base)
+                prefix = "" if rel_path == "." else rel_path.replace(os.sep, "/") + "/"
+                root_specs.append((ignore_base, spec, prefix, can_prune))
 
-        path_walk: WalkableType
         if is_exact_file:
-            # When the exact file to lint is passed, we
-            # fill path_walk with an input that follows
-            # the structure of `os.walk`:
-            #   (root, directories, files)
-            dirpath = os.path.dirname(path)
-            files = [os.path.basename(path)]
-            path_walk = [(dirpath, None, files)]
-        else:
-            path_walk = list(os.walk(path))
+            fname = os.path.basename(path)
+            if not fname.lower().endswith(sql_file_exts):
+                return
+            for ignore_base, spec, prefix, _ in root_specs:
+                if spec.match_file(prefix + fname):
+                    linter_logger.warning(
+                        "Exact file path %s was given but "
+                        "it was ignored by a %s pattern in %s, "
+                        "re-run with `--disregard-sqlfluffignores` to "
+                        "skip %s"
+                        % (
+                            path,
+                            ignore_file_name,
+                            ignore_base,
+                            ignore_file_name,
+                        )
+                    )
+                    return
+            yield normalise(path)
+            return
+
+        # Walk the directory depth first, using a stack rather than recursion.
+        stack = [(path, root_specs)]
+        while stack:
+            dirpath, specs = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:  # pragma: no cover
+                # As with os.walk, skip directories we can't read.
+                continue
+            # Ignore files in the path itself were found already.
+            if ignore_files and dirpath != path:
+                for entry in entries:
+                    if entry.name == ignore_file_name and entry.is_file():
+                        spec, can_prune = self._load_ignore_spec(entry.path)
+                        specs = specs + [(dirpath, spec, "", can_prune)]
+                        break
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    # As with os.walk, don't follow links to directories.
+                    if entry.is_symlink():
+                        continue
+                    dir_name = entry.name + "/"
+                    if any(
+                        can_prune and spec.match_file(prefix + dir_name)
+                        for _, spec, prefix, can_prune in specs
+                    ):
+                        continue
+                    subdirs.append(
+                        (
+                            entry.path,
+                            [
+                                (base, spec, prefix + dir_name, can_prune)
+                                for base, spec, prefix, can_prune in specs
+                            ],
+                        )
+                    )
+                elif entry.name.lower().endswith(sql_file_exts) and not any(
+                    spec.match_file(prefix + entry.name) for _, spec, prefix, _ in specs
+                ):
+                    yield normalise(entry.path)
+            # Reversed, so that subdirectories are walked in order.
+            stack.extend(reversed(subdirs))
 
-        ignore_file_paths = ConfigLoader.find_ignore_config_files(
-            path=path, working_path=working_path, ignore_file_name=ignore_file_name
-        )
-        # Add paths that could contain "ignore files"
-        # to the path_walk list
-        path_walk_ignore_file = [
-            (
-                os.path.dirname(ignore_file_path),
-                None,
-                # Only one possible file, since we only
-                # have one "ignore file name"
-                [os.path.basename(ignore_file_path)],
-            )
-            for ignore_file_path in ignore_file_paths
-        ]
-        path_walk += path_walk_ignore_file
-
-        # If it's a directory then expand the path!
-        buffer = []
-        ignores = {}
-        for dirpath, _, filenames in path_walk:
-            for fname in filenames:
-                fpath = os.path.join(dirpath, fname)
-                # Handle potential .sqlfluffignore files
-                if ignore_files and fname == ignore_file_name:
-                    with open(fpath) as fh:
-                        spec = pathspec.PathSpec.from_lines("gitwildmatch", fh)
-                        ignores[dirpath] = spec
-                    # We don't need to process the ignore file any further
-                    continue
+    def paths_from_path(
+        self,
+        path: str,
+        ignore_file_name: str = ".sqlfluffignore",
+        ignore_non_existent_files: bool = False,
+        ignore_files: bool = True,
+        working_path: Optional[str] = None,
+    ) -> List[str]:
+        """Return a set of sql file paths from a potentially more ambiguous path string.
 
-                # We won't purge files *here* because there's an edge case
-                # that the ignore file is processed after the sql file.
+        Here we also deal with the .sqlfluffignore file if present.
 
-                # Scan for remaining files
-                for ext in (
-                    self.config.get("sql_file_exts", default=".sql").lower().split(",")
-                ):
-                    # is it a sql file?
-                    if fname.lower().endswith(ext):
-                        buffer.append(fpath)
-
-        if not ignore_files:
-            return sorted(buffer)
-
-        # Check the buffer for ignore items and normalise the rest.
-        # It's a set, so we can do natural deduplication.
-        filtered_buffer = set()
-
-        for fpath in buffer:
-            abs_fpath = os.path.abspath(fpath)
-            for ignore_base, ignore_spec in ignores.items():
-                abs_ignore_base = os.path.abspath(ignore_base)
-                if abs_fpath.startswith(
-                    abs_ignore_base + os.sep
-                ) and ignore_spec.match_file(
-                    os.path.relpath(abs_fpath, abs_ignore_base)
-                ):
-                    # This file is ignored, skip it.
-                    if is_exact_file:
-                        linter_logger.warning(
-                            "Exact file path %s was given but "
-                            "it was ignored by a %s pattern in %s, "
-                            "re-run with `--disregard-sqlfluffignores` to "
-                            "skip %s"
-                            % (
-                                path,
-                                ignore_file_name,
-                                ignore_base,
-                                ignore_file_name,
-                            )
-                        )
-                    break
-            else:
-                npath = os.path.normpath(fpath)
-                # For debugging, log if we already have the file.
-                if npath in filtered_buffer:
-                    linter_logger.debug(  # pragma: no cover
-                        "Developer Warning: Path crawler attempted to "
-                        "requeue the same file twice. %s is already in "
-                        "filtered buffer.",
-                        npath,
-                    )
-                filtered_buffer.add(npath)
+        When a path to a file to be linted is explicitly passed
+        we look for ignore files in all directories that are parents of the file,
+        up to the current directory.
+
+        If the current directory is not a parent of the file we only
+        look for an ignore file in the direct parent of the file.
 
-        # Return a sorted list
-        return sorted(filtered_buffer)
+        """
+        return sorted(
+            set(
+                self.iter_paths_from_path(
+                    path,
+                    ignore_file_name=ignore_file_name,
+                    ignore_non_existent_files=ignore_non_existent_files,
+                    ignore_files=ignore_files,
+                    working_path=working_path,
+                )
+            )
+        )
 
     def lint_string_wrapped(
         self,
@@ -1101,18 +1517,80 @@ class Linter:
         ignore_non_existent_files: bool = False,
         ignore_files: bool = True,
         processes: Optional[int] = None,
+        retain_trees: bool = False,
+        retain_files: bool = True,
     ) -> LintedDir:
-        """Lint a path."""
-        linted_path = LintedDir(path)
-        if self.formatter:
-            self.formatter.dispatch_path(path)
-        fnames = list(
-            self.paths_from_path(
+        """Lint a path.
+
+        When linting in parallel, the parse tree of each file is only
+        returned if `retain_trees` is set. If `retain_files` is not set,
+        each file is released once linted (and dispatched to the formatter)
+        and the LintedDir only keeps running totals.
+        """
+        linted_dirs, _ = self._lint_dirs(
+            (path,),
+            fix=fix,
+            ignore_non_existent_files=ignore_non_existent_files,
+            ignore_files=ignore_files,
+            processes=processes,
+            retain_trees=retain_trees,
+            retain_files=retain_files,
+        )
+        return linted_dirs[0]
+
+    def _lint_dirs(
+        self,
+        paths: Tuple[str, ...],
+        fix: bool = False,
+        ignore_non_existent_files: bool = False,
+        ignore_files: bool = True,
+        processes: Optional[int] = None,
+        retain_trees: bool = False,
+        retain_files: bool = True,
+        only_files: Optional[Collection[str]] = None,
+        line_ranges: Optional[Dict[str, Optional[List[Tuple[int, int]]]]] = None,
+    ) -> Tuple[List[LintedDir], Dict[str, float]]:
+        """Lint the files in each of a sequence of paths, with a single runner.
+
+        The files from all the paths are linted together (so in parallel
+        mode, all by the same pool of processes) and the results are then
+        grouped by the path they were found in.
+
+        Returns the LintedDirs, along with the time each parallel
+        worker spent linting.
+        """
+        paths_count = len(paths)
+        progress_bar_paths = tqdm(
+            total=paths_count,
+            desc="path",
+            leave=False,
+            disable=paths_count <= 1 or progress_bar_configuration.disable_progress_bar,
+        )
+        linted_dirs = []
+        fnames = []
+        if only_files is not None:
+            only_files = {os.path.realpath(fname) for fname in only_files}
+        # The LintedDirs waiting for each file. A file could be found in
+        # more than one path, in which case it's linted once for each.
+        dirs_by_fname: Dict[str, Deque[LintedDir]] = defaultdict(deque)
+        for path in paths:
+            progress_bar_paths.set_description(f"path {path}")
+            linted_dir = LintedDir(path, retain_files=retain_files)
+            linted_dirs.append(linted_dir)
+            if self.formatter:
+                self.formatter.dispatch_path(path)
+            # Iterate through files recursively in the specified directory (if it's
+            # a directory) or read the file directly if it's not.
+            for fname in self.paths_from_path(
                 path,
                 ignore_non_existent_files=ignore_non_existent_files,
                 ignore_files=ignore_files,
-            )
-        )
+            ):
+                if only_files is not None and os.path.realpath(fname) not in only_files:
+                    continue
+                fnames.append(fname)
+                dirs_by_fname[fname].append(linted_dir)
+            progress_bar_paths.update(1)
 
         if processes is None:
             processes = self.config.get("processes", default=1)
@@ -1125,6 +1603,12 @@ class Linter:
             self.config,
             processes=processes,
             allow_process_parallelism=self.allow_process_parallelism,
+            retain_trees=retain_trees,
+            line_ranges=(
+                {os.path.realpath(fname): lines for fname, lines in line_ranges.items()}
+                if line_ranges is not None
+                else None
+            ),
         )
 
         if self.formatter and effective_processes != 1:
@@ -1140,7 +1624,7 @@ class Linter:
         )
 
         for i, linted_file in enumerate(runner.run(fnames, fix), start=1):
-            linted_path.add(linted_file)
+            dirs_by_fname[linted_file.path].popleft().add(linted_file)
             # If any fatal errors, then stop iteration.
             if any(v.fatal for v in linted_file.violations):  # pragma: no cover
                 linter_logger.error("Fatal linting error. Halting further linting.")
@@ -1156,7 +1640,7 @@ class Linter:
                     f"file {os.path.basename(fnames[i])}"
                 )
 
-        return linted_path
+        return linted_dirs, runner.worker_busy_time
 
     def lint_paths(
         self,
@@ -1165,38 +1649,47 @@ class Linter:
         ignore_non_existent_files: bool = False,
         ignore_files: bool = True,
         processes: Optional[int] = None,
+        retain_trees: bool = False,
+        retain_files: bool = True,
+        only_files: Optional[Collection[str]] = None,
+        line_ranges: Optional[Dict[str, Optional[List[Tuple[int, int]]]]] = None,
     ) -> LintingResult:
-        """Lint an iterable of paths."""
-        paths_count = len(paths)
-
+        """Lint an iterable of paths.
+
+        When linting in parallel, the parse tree of each file is only
+        returned if `retain_trees` is set. If `retain_files` is not set,
+        each file is released once linted (and dispatched to the formatter)
+        and the result only keeps running totals, for the stats and
+        summaries.
+
+        If `only_files` is given, only those of the files found in the
+        paths are linted. If `line_ranges` is given, the linting violations
+        of each file in it are only reported within its (inclusive) ranges
+        of line numbers, unless it maps to None.
+        """
         # If no paths specified - assume local
-        if not paths_count:  # pragma: no cover
+        if not paths:  # pragma: no cover
             paths = (os.getcwd(),)
         # Set up the result to hold what we get back
         result = LintingResult()
 
-        progress_bar_paths = tqdm(
-            total=paths_count,
-            desc="path",
-            leave=False,
-            disable=paths_count <= 1 or progress_bar_configuration.disable_progress_bar,
+        linted_dirs, result.worker_busy_time = self._lint_dirs(
+            paths,
+            fix=fix,
+            ignore_non_existent_files=ignore_non_existent_files,
+            ignore_files=ignore_files,
+            processes=processes,
+            retain_trees=retain_trees,
+            retain_files=retain_files,
+            only_files=only_files,
+            line_ranges=line_ranges,
         )
-        for path in paths:
-            progress_bar_paths.set_description(f"path {path}")
+        for linted_dir in linted_dirs:
+            result.add(linted_dir)
 
-            # Iterate through files recursively in the specified directory (if it's a
-            # directory) or read the file directly if it's not
-            result.add(
-                self.lint_path(
-                    path,
-                    fix=fix,
-                    ignore_non_existent_files=ignore_non_existent_files,
-                    ignore_files=ignore_files,
-                    processes=processes,
-                )
-            )
-
-            progress_bar_paths.update(1)
+        # Keep the lint cache within its configured size.
+        if self.cache:
+            self.cache.prune()
 
         result.stop_timer()
         return result
@@ -17,6 +17,7 @@ from sqlfluff.cli import EXIT_FAIL, EXIT_SUCCESS
 
 from sqlfluff.core.errors import (
     CheckTuple,
+    SQLBaseError,
     SQLLintError,
     SQLParseError,
     SQLTemplaterError,
@@ -40,6 +41,8 @@ class LintingResult:
         self.paths: List[LintedDir] = []
         self._start_time: float = time.monotonic()
         self.total_time: float = 0.0
+        # The time each parallel worker spent linting, by worker name.
+        self.worker_busy_time: Dict[str, float] = {}
 
     @staticmethod
     def sum_dicts(d1: Dict[str, Any], d2: Dict[str, Any]) -> Dict[str, Any]:
@@ -146,10 +149,26 @@ class LintingResult:
         """Return a timing summary."""
         timing = TimingSummary()
         for dir in self.paths:
-            for file in dir.files:
-                timing.add(file.time_dict)
+            timing.merge(dir.timing_summary())
         return timing.summary()
 
+    def worker_utilisation(self) -> Dict[str, float]:
+        """Return the proportion of the run each parallel worker was busy."""
+        if not self.total_time:  # pragma: no cover
+            return {}
+        return {
+            worker: busy_time / self.total_time
+            for worker, busy_time in sorted(self.worker_busy_time.items())
+        }
+
+    def parse_statistics_summary(self) -> Dict[str, int]:
+        """Return the parser counters, summed across all files."""
+        totals: Dict[str, int] = {}
+        for dir in self.paths:
+            for key, val in dir.parse_statistics_summary().items():
+                totals[key] = totals.get(key, 0) + val
+        return totals
+
     def persist_timing_records(self, filename):
         """Persist the timing records as a csv to external analysis."""
         meta_fields = [
@@ -159,7 +178,7 @@ class LintingResult:
             "segments",
             "raw_segments",
         ]
-        timing_fields = ["templating", "lexing", "parsing", "linting"]
+        timing_fields = ["rules", "templating", "lexing", "parsing", "linting"]
         with open(filename, "w", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=meta_fields + timing_fields)
 
@@ -194,6 +213,19 @@ class LintingResult:
                         }
                     )
 
+    @staticmethod
+    def as_record(path: str, violations: List[SQLBaseError]) -> dict:
+        """Return the violations for a single file as a dictionary."""
+        return {
+            "filepath": path,
+            "violations": sorted(
+                # Sort violations by line and then position
+                (v.get_info_dict() for v in violations),
+                # The tuple allows sorting by line number, then position, then code
+                key=lambda v: (v["line_no"], v["line_pos"], v["code"]),
+            ),
+        }
+
     def as_records(self) -> List[dict]:
         """Return the result as a list of dictionaries.
 
@@ -202,15 +234,7 @@ class LintingResult:
         types (ints, strs).
         """
         return [
-            {
-                "filepath": path,
-                "violations": sorted(
-                    # Sort violations by line and then position
-                    (v.get_info_dict() for v in violations),
-                    # The tuple allows sorting by line number, then position, then code
-                    key=lambda v: (v["line_no"], v["line_pos"], v["code"]),
-                ),
-            }
+            self.as_record(path, violations)
             for LintedDir in self.paths
             for path, violations in LintedDir.violation_dict().items()
             if violations
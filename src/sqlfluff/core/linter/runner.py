@@ -12,14 +12,20 @@ import functools
 import logging
 import multiprocessing
 import multiprocessing.dummy
+import os
 import signal
 import sys
+import threading
+import time
 import traceback
-from typing import Callable, List, Tuple, Iterator
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Iterator
 
 from sqlfluff.core import FluffConfig, Linter
-from sqlfluff.core.errors import SQLFluffSkipFile
+from sqlfluff.core.errors import SQLFluffSkipFile, SQLLintError
 from sqlfluff.core.linter import LintedFile
+from sqlfluff.core.linter.common import RenderedFile
+from sqlfluff.core.parser.segments.base import BaseSegment
+from sqlfluff.core.rules import BaseRule
 
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
 
@@ -31,19 +37,44 @@ class BaseRunner(ABC):
         self,
         linter,
         config,
+        retain_trees: bool = False,
+        line_ranges: Optional[Dict[str, Optional[List[Tuple[int, int]]]]] = None,
     ):
         self.linter = linter
         self.config = config
+        # Whether results must keep their parse trees, even when that
+        # makes them expensive to return from another process.
+        self.retain_trees = retain_trees
+        # If set, only linting violations within these line ranges are
+        # reported for each file (by real path). Files with no entry, or
+        # with None, have all their violations reported.
+        self.line_ranges = line_ranges
+        # The time each parallel worker spent linting files, by worker name.
+        self.worker_busy_time: Dict[str, float] = {}
+        # Cache keys for files which missed the lint cache, by filename.
+        self._cache_keys: Dict[str, str] = {}
 
     pass_formatter = True
+    # Whether files are rendered by whatever calls the partials
+    # (e.g. a worker process) rather than up front by the runner.
+    render_in_partials = False
 
     def iter_rendered(self, fnames: List[str]) -> Iterator[Tuple]:
         """Iterate through rendered files ready for linting."""
-        for fname in self.linter.templater.sequence_files(
+        for fname, (raw_file, config, encoding) in self._iter_loaded(fnames):
+            yield fname, self.linter.render_string(raw_file, fname, config, encoding)
+
+    def _iter_sequenced(self, fnames: List[str]) -> Iterator[str]:
+        """Iterate through filenames, in the order the templater requires."""
+        return self.linter.templater.sequence_files(
             fnames, config=self.config, formatter=self.linter.formatter
-        ):
+        )
+
+    def _iter_loaded(self, fnames: List[str]) -> Iterator[Tuple]:
+        """Iterate through loaded files and their config, in templater order."""
+        for fname in self._iter_sequenced(fnames):
             try:
-                yield fname, self.linter.render_file(fname, self.config)
+                yield fname, self.linter.load_raw_file_and_config(fname, self.config)
             except SQLFluffSkipFile as s:
                 linter_logger.warning(str(s))
 
@@ -56,9 +87,65 @@ class BaseRunner(ABC):
 
         Generates filenames and objects which return LintedFiles.
         """
-        for fname, rendered in self.iter_rendered(fnames):
-            # Generate a fresh ruleset
-            rule_set = self.linter.get_ruleset(config=rendered.config)
+        # Formatters may or may not be passed. They don't pickle
+        # nicely so aren't appropriate in a multiprocessing world.
+        # Files are only dispatched once they're restricted to any
+        # line ranges, so in that case the runner dispatches them.
+        formatter = (
+            self.linter.formatter
+            if self.pass_formatter and self.line_ranges is None
+            else None
+        )
+        if self.render_in_partials and not self.linter.cache:
+            # Without a cache, there's no need to even load the file here,
+            # so just pass on the filename (still in templater order).
+            for fname in self._iter_sequenced(fnames):
+                yield (
+                    fname,
+                    functools.partial(
+                        self._load_and_lint,
+                        self.linter,
+                        fname,
+                        self.config,
+                        fix,
+                        formatter,
+                    ),
+                )
+            return
+        for fname, (raw_file, config, encoding) in self._iter_loaded(fnames):
+            rule_set, rules_time = self._timed_ruleset(self.linter, config)
+            if self.linter.cache:
+                cache_key = self.linter.cache.make_key(raw_file, config, rule_set)
+                cached = self.linter.cache.load(cache_key, fname, fix=fix)
+                if cached:
+                    yield (
+                        fname,
+                        functools.partial(self._replay_cached, cached, fix, formatter),
+                    )
+                    continue
+                # Remember the key so we can store the result when it's back.
+                self._cache_keys[fname] = cache_key
+            if self.render_in_partials:
+                yield (
+                    fname,
+                    functools.partial(
+                        self._render_and_lint,
+                        self.linter,
+                        raw_file,
+                        fname,
+                        config,
+                        encoding,
+                        rule_set,
+                        rules_time,
+                        fix,
+                        formatter,
+                    ),
+                )
+                continue
+            rendered = self._with_rules_time(
+                self.linter.render_string(raw_file, fname, config, encoding),
+                rules_time,
+            )
             yield (
                 fname,
                 functools.partial(
@@ -66,12 +153,116 @@ class BaseRunner(ABC):
                     rendered,
                     rule_set,
                     fix,
-                    # Formatters may or may not be passed. They don't pickle
-                    # nicely so aren't appropriate in a multiprocessing world.
-                    self.linter.formatter if self.pass_formatter else None,
+                    formatter,
                 ),
             )
 
+    @staticmethod
+    def _load_and_lint(
+        linter: Linter,
+        fname: str,
+        root_config: FluffConfig,
+        fix: bool,
+        formatter: Any = None,
+    ) -> LintedFile:
+        """Load, render and lint a file from its filename alone."""
+        raw_file, config, encoding = linter.load_raw_file_and_config(fname, root_config)
+        rule_set, rules_time = BaseRunner._timed_ruleset(linter, config)
+        return BaseRunner._render_and_lint(
+            linter,
+            raw_file,
+            fname,
+            config,
+            encoding,
+            rule_set,
+            rules_time,
+            fix,
+            formatter,
+        )
+
+    @staticmethod
+    def _render_and_lint(
+        linter: Linter,
+        raw_file: str,
+        fname: str,
+        config: FluffConfig,
+        encoding: str,
+        rule_set: List[BaseRule],
+        rules_time: float,
+        fix: bool,
+        formatter: Any = None,
+    ) -> LintedFile:
+        """Render and lint a loaded file."""
+        rendered = BaseRunner._with_rules_time(
+            linter.render_string(raw_file, fname, config, encoding), rules_time
+        )
+        return linter.lint_rendered(rendered, rule_set, fix, formatter)
+
+    @staticmethod
+    def _timed_ruleset(
+        linter: Linter, config: FluffConfig
+    ) -> Tuple[List[BaseRule], float]:
+        """Get the rule set for a file, and how long it took to get."""
+        t0 = time.monotonic()
+        rule_set = linter.get_ruleset(config=config)
+        return rule_set, time.monotonic() - t0
+
+    @staticmethod
+    def _with_rules_time(rendered: RenderedFile, rules_time: float) -> RenderedFile:
+        """Add the time taken to get the rule set to the file's timings."""
+        return rendered._replace(time_dict={"rules": rules_time, **rendered.time_dict})
+
+    @staticmethod
+    def _replay_cached(
+        linted_file: LintedFile, fix: bool, formatter: Any = None
+    ) -> LintedFile:
+        """Return a cached LintedFile, dispatching it as if freshly linted."""
+        if formatter:
+            formatter.dispatch_file_violations(
+                linted_file.path, linted_file, only_fixable=fix
+            )
+        return linted_file
+
+    def _store_cached(self, linted_file: LintedFile) -> None:
+        """Store a freshly linted file in the cache if we have a key for it."""
+        cache_key = self._cache_keys.pop(linted_file.path, None)
+        if cache_key and self.linter.cache:
+            self.linter.cache.store(cache_key, linted_file)
+
+    def _restrict_to_line_ranges(self, linted_file: LintedFile) -> LintedFile:
+        """Drop linting violations outside the line ranges for a file.
+
+        Other violations (e.g. parsing errors) are kept, as they could be
+        caused by a change anywhere in the file.
+        """
+        if self.line_ranges is None:
+            return linted_file
+        ranges = self.line_ranges.get(os.path.realpath(linted_file.path))
+        if ranges is None:
+            return linted_file
+        return linted_file._replace(
+            violations=[
+                v
+                for v in linted_file.violations
+                if not isinstance(v, SQLLintError)
+                or any(start <= v.line_no <= end for start, end in ranges)
+            ]
+        )
+
+    def _finish(self, linted_file: LintedFile, fix: bool, dispatch: bool):
+        """Cache a linted file, then restrict it to any line ranges.
+
+        The cache holds every violation, so the file is only restricted
+        (and dispatched to the formatter if needed) afterwards.
+        """
+        self._store_cached(linted_file)
+        linted_file = self._restrict_to_line_ranges(linted_file)
+        if dispatch and self.linter.formatter:
+            self.linter.formatter.dispatch_file_violations(
+                linted_file.path, linted_file, only_fixable=fix
+            )
+        return linted_file
+
     def run(self, fnames: List[str], fix: bool):
         """Run linting on the specified list of files."""
         raise NotImplementedError  # pragma: no cover
@@ -87,6 +278,10 @@ class BaseRunner(ABC):
 
     @staticmethod
     def _handle_lint_path_exception(fname, e):
+        if isinstance(e, SQLFluffSkipFile):
+            # Files loaded by a partial may still be skipped.
+            linter_logger.warning(str(e))
+            return
         if isinstance(e, IOError):
             # IOErrors are caught in commands.py, so propagate it
             raise (e)  # pragma: no cover
@@ -105,7 +300,10 @@ class SequentialRunner(BaseRunner):
         """Sequential implementation."""
         for fname, partial in self.iter_partials(fnames, fix=fix):
             try:
-                yield partial()
+                # If the partial didn't dispatch the file, do that here.
+                yield self._finish(
+                    partial(), fix, dispatch=self.line_ranges is not None
+                )
             except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
                 raise
             except Exception as e:
@@ -120,11 +318,62 @@ class ParallelRunner(BaseRunner):
     # Don't pass the formatter in a parallel world, they
     # don't pickle well.
     pass_formatter = False
+    # Render files in the workers, so that templating isn't
+    # limited to the speed of the main process.
+    render_in_partials = True
 
-    def __init__(self, linter, config, processes):
-        super().__init__(linter, config)
+    def __init__(
+        self,
+        linter,
+        config,
+        processes,
+        retain_trees: bool = False,
+        line_ranges: Optional[Dict[str, Optional[List[Tuple[int, int]]]]] = None,
+    ):
+        super().__init__(
+            linter, config, retain_trees=retain_trees, line_ranges=line_ranges
+        )
         self.processes = processes
 
+    @staticmethod
+    def _file_size(fname: str) -> int:
+        try:
+            return os.path.getsize(fname)
+        except OSError:  # pragma: no cover
+            return 0
+
+    @classmethod
+    def _order_largest_first(cls, fnames: List[str]) -> List[str]:
+        """Order files by size, largest first.
+
+        Workers take the next file as soon as they finish one, so
+        starting with the largest files means the run doesn't end
+        with one worker busy on a large file while the others idle.
+        Templaters which need a particular order still apply it
+        afterwards, in `sequence_files`.
+        """
+        return sorted(fnames, key=cls._file_size, reverse=True)
+
+    def iter_partials(
+        self,
+        fnames: List[str],
+        fix: bool = False,
+    ) -> Iterator[Tuple[str, Callable]]:
+        """Iterate through partials for linted files.
+
+        Unless trees are retained, each partial returns a compact LintedFile
+        so that only what the main process needs is passed back to it.
+        """
+        for fname, partial in super().iter_partials(fnames, fix=fix):
+            if not self.retain_trees:
+                partial = functools.partial(self._lint_compact, partial, fix)
+            yield fname, partial
+
+    @staticmethod
+    def _lint_compact(partial: Callable, fix: bool) -> LintedFile:
+        """Call a partial and compact the LintedFile it returns."""
+        return partial().compact(fix=fix)
+
     def run(self, fnames: List[str], fix: bool):
         """Parallel implementation.
 
@@ -142,7 +391,7 @@ class ParallelRunner(BaseRunner):
                 for lint_result in self._map(
                     pool,
                     self._apply,
-                    self.iter_partials(fnames, fix=fix),
+                    self.iter_partials(self._order_largest_first(fnames), fix=fix),
                 ):
                     if isinstance(lint_result, DelayedException):
                         try:
@@ -150,12 +399,13 @@ class ParallelRunner(BaseRunner):
                         except Exception as e:
                             self._handle_lint_path_exception(lint_result.fname, e)
                     else:
-                        # It's a LintedDir.
-                        if self.linter.formatter:
-                            self.linter.formatter.dispatch_file_violations(
-                                lint_result.path, lint_result, only_fixable=fix
-                            )
-                        yield lint_result
+                        # It's a LintedFile, along with who linted it and how long
+                        # that took.
+                        lint_result, worker, busy_time = lint_result
+                        self.worker_busy_time[worker] = (
+                            self.worker_busy_time.get(worker, 0.0) + busy_time
+                        )
+                        yield self._finish(lint_result, fix, dispatch=True)
             except KeyboardInterrupt:  # pragma: no cover
                 # On keyboard interrupt (Ctrl-C), terminate the workers.
                 # Notify the user we've received the signal and are cleaning up,
@@ -163,17 +413,24 @@ class ParallelRunner(BaseRunner):
                 print("Received keyboard interrupt. Cleaning up and shutting down...")
                 pool.terminate()
 
-    @staticmethod
-    def _apply(partial_tuple):
+    @classmethod
+    def _apply(cls, partial_tuple):
         """Shim function used in parallel mode."""
         # Unpack the tuple and ditch the filename in this case.
         fname, partial = partial_tuple
+        t0 = time.monotonic()
         try:
-            return partial()
+            linted_file = partial()
         # Capture any exceptions and return as delayed exception to handle
         # in the main thread.
         except Exception as e:
             return DelayedException(e, fname=fname)
+        return linted_file, cls._worker_name(), time.monotonic() - t0
+
+    @staticmethod
+    def _worker_name() -> str:
+        """The name of the worker running the current task."""
+        raise NotImplementedError  # pragma: no cover
 
     @classmethod
     def _create_pool(cls, *args, **kwargs):
@@ -202,6 +459,10 @@ class MultiProcessRunner(ParallelRunner):
         # https://stackoverflow.com/questions/11312525/catch-ctrlc-sigint-and-exit-multiprocesses-gracefully-in-python
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
+    @staticmethod
+    def _worker_name() -> str:  # pragma: no cover
+        return multiprocessing.current_process().name
+
 
 class MultiThreadRunner(ParallelRunner):
     """Runner that does parallel processing using multiple threads.
@@ -212,6 +473,64 @@ class MultiThreadRunner(ParallelRunner):
     POOL_TYPE = multiprocessing.dummy.Pool
     MAP_FUNCTION_NAME = "imap"
 
+    @staticmethod
+    def _worker_name() -> str:
+        return threading.current_thread().name
+
+
+# The config for statement parsing, in each process of a statement parsing pool.
+_parse_worker_config: Optional[FluffConfig] = None
+
+
+def _init_parse_worker(config: FluffConfig) -> None:  # pragma: no cover
+    """Initialize a process for parsing statements in parallel."""
+    global _parse_worker_config
+    _parse_worker_config = config
+    # As in MultiProcessRunner, let the parent handle keyboard interrupts.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _parse_statements(
+    args: Tuple[Sequence[BaseSegment], bool, Optional[str]]
+) -> Tuple[Optional[Tuple[BaseSegment, ...]], Dict[str, int]]:
+    """Parse a chunk of statements in a statement parsing process.
+
+    Returns the top level segments of the parsed chunk, or None if it
+    didn't parse cleanly, along with the parser statistics.
+    """
+    tokens, recurse, fname = args
+    assert _parse_worker_config
+    parse_statistics: Dict[str, int] = {}
+    parsed, violations = Linter._parse_tokens(
+        tokens,
+        _parse_worker_config,
+        recurse=recurse,
+        fname=fname,
+        parse_statistics=parse_statistics,
+    )
+    if violations or not parsed:
+        return None, parse_statistics
+    return parsed.segments, parse_statistics
+
+
+def parse_statements_in_parallel(
+    chunks: List[Sequence[BaseSegment]],
+    config: FluffConfig,
+    processes: int,
+    recurse: bool = True,
+    fname: Optional[str] = None,
+) -> List[Tuple[Optional[Tuple[BaseSegment, ...]], Dict[str, int]]]:
+    """Parse chunks of statements from a single file in a process pool.
+
+    The config (and with it the dialect) is sent to each process once,
+    and then each chunk of tokens is parsed as if it were a whole file.
+    Results are returned in the same order as the chunks.
+    """
+    with multiprocessing.Pool(processes, _init_parse_worker, (config,)) as pool:
+        return pool.map(
+            _parse_statements, [(chunk, recurse, fname) for chunk in chunks]
+        )
+
 
 class DelayedException(Exception):
     """Multiprocessing process pool uses this to propagate exceptions."""
@@ -219,7 +538,7 @@ class DelayedException(Exception):
     def __init__(self, ee, fname=None):
         self.ee = ee
         __, __, self.tb = sys.exc_info()
-        self.fname = None
+        self.fname = fname
         super().__init__(str(ee))
 
     def reraise(self):
@@ -232,6 +551,8 @@ def get_runner(
     config: FluffConfig,
     processes: int,
     allow_process_parallelism: bool = True,
+    retain_trees: bool = False,
+    line_ranges: Optional[Dict[str, Optional[List[Tuple[int, int]]]]] = None,
 ) -> Tuple[BaseRunner, int]:
     """Generate a runner instance based on parallel and system configuration.
 
@@ -244,6 +565,9 @@ def get_runner(
     0 = all cpus
     1 = 1 cpu
 
+    Results from parallel runners only keep their parse trees if
+    `retain_trees` is set. If `line_ranges` are given, only the linting
+    violations within them are reported.
     """
     if processes <= 0:
         processes = max(multiprocessing.cpu_count() + processes, 1)
@@ -253,8 +577,31 @@ def get_runner(
         # so this flag allows us to fall back to a threaded runner
         # in those cases.
         if allow_process_parallelism:
-            return MultiProcessRunner(linter, config, processes=processes), processes
+            return (
+                MultiProcessRunner(
+                    linter,
+                    config,
+                    processes=processes,
+                    retain_trees=retain_trees,
+                    line_ranges=line_ranges,
+                ),
+                processes,
+            )
         else:
-            return MultiThreadRunner(linter, config, processes=processes), processes
+            return (
+                MultiThreadRunner(
+                    linter,
+                    config,
+                    processes=processes,
+                    retain_trees=retain_trees,
+                    line_ranges=line_ranges,
+                ),
+                processes,
+            )
     else:
-        return SequentialRunner(linter, config), processes
+        return (
+            SequentialRunner(
+                linter, config, retain_trees=retain_trees, line_ranges=line_ranges
+            ),
+            processes,
+        )
@@ -10,9 +10,15 @@ and match depth of the current operation.
 
 import logging
 import uuid
+from bisect import bisect_left
+from collections import defaultdict
 
 # Get the parser logger
-from typing import Dict
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.parser.match_result import MatchResult
+    from sqlfluff.core.parser.segments import BaseSegment
 
 parser_logger = logging.getLogger("sqlfluff.parser")
 
@@ -36,8 +42,8 @@ class RootParseContext:
         # the intended indentation of certain features. Specifically it is
         # used in the Conditional grammar.
         self.indentation_config = indentation_config or {}
-        # Initialise the denylist
-        self.denylist = ParseDenylist()
+        # Initialise the memo of match results
+        self.memo = ParseMemo()
         # This is the logger that child objects will latch onto.
         self.logger = parser_logger
         # A uuid for this parse context to enable cache invalidation
@@ -173,36 +179,129 @@ class ParseContext:
         return ctx
 
 
-class ParseDenylist:
-    """Acts as a cache to stop unnecessary matching."""
+class ParseMemo:
+    """A packrat style memo of match results to stop unnecessary matching.
 
-    def __init__(self):
-        self._denylist_struct = {}
+    Results are keyed by the name of the element being matched and the
+    identity of the segments it was matched against. Both successful and
+    unsuccessful matches are stored. We rely on segments not being
+    mutated within a given match cycle, so that the same objects will
+    always give the same result. The memo holds a reference to the
+    segments of each entry so that their ids can't be reused while the
+    entry is alive.
 
-    def _hashed_version(self):  # pragma: no cover TODO?
-        return {
-            k: {hash(e) for e in self._denylist_struct[k]}
-            for k in self._denylist_struct
-        }
+    It also holds the :obj:`FirstTokenIndex` for each buffer of segments
+    which we look ahead through, so that they can be shared between the
+    many look ahead calls on (parts of) the same buffer.
 
-    def check(self, seg_name, seg_tuple):
-        """Check this seg_tuple against this seg_name.
+    The memo is cleared at the start of each call to `.parse()`, but the
+    hit and miss counters are kept for the whole parse.
+    """
 
-        Has this seg_tuple already been matched
-        unsuccessfully against this segment name.
+    def __init__(self):
+        self._memo_struct: Dict[
+            tuple, Tuple[Tuple["BaseSegment", ...], "MatchResult"]
+        ] = {}
+        # The index each segment was last indexed in, and its position there.
+        self._index_locations: Dict[int, Tuple[FirstTokenIndex, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(seg_name: str, segments: Tuple["BaseSegment", ...]) -> tuple:
+        # Keying on the ends and length (rather than the ids of every
+        # segment) keeps the key cheap to build. The rest is validated
+        # on lookup.
+        if not segments:
+            return (seg_name, 0)
+        return (seg_name, len(segments), id(segments[0]), id(segments[-1]))
+
+    def check(
+        self, seg_name: str, segments: Tuple["BaseSegment", ...]
+    ) -> Optional["MatchResult"]:
+        """Fetch the result of a previous match of these segments, if any."""
+        entry = self._memo_struct.get(self._key(seg_name, segments))
+        if entry is not None:
+            memo_segments, match = entry
+            if memo_segments is segments or all(
+                a is b for a, b in zip(memo_segments, segments)
+            ):
+                self.hits += 1
+                return match
+        self.misses += 1
+        return None
+
+    def mark(
+        self,
+        seg_name: str,
+        segments: Tuple["BaseSegment", ...],
+        match: "MatchResult",
+    ) -> None:
+        """Store the result of matching these segments against seg_name."""
+        self._memo_struct[self._key(seg_name, segments)] = (tuple(segments), match)
+
+    def first_token_index(
+        self, segments: Tuple["BaseSegment", ...]
+    ) -> Tuple["FirstTokenIndex", int]:
+        """Fetch an index covering these segments, and their offset within it.
+
+        If these segments are a contiguous part of a buffer which has
+        already been indexed, then we reuse that index, otherwise we build
+        a new one.
+
+        NOTE: As with the memo itself, this assumes that segments aren't
+        mutated within a parse cycle, so we only check the first and last
+        segments rather than the whole range, to keep this constant time.
         """
-        if seg_name in self._denylist_struct:  # pragma: no cover TODO?
-            if seg_tuple in self._denylist_struct[seg_name]:
-                return True
-        return False
-
-    def mark(self, seg_name, seg_tuple):
-        """Mark this seg_tuple as not a match with this seg_name."""
-        if seg_name in self._denylist_struct:
-            self._denylist_struct[seg_name].add(seg_tuple)
-        else:
-            self._denylist_struct[seg_name] = {seg_tuple}
+        if segments:
+            location = self._index_locations.get(id(segments[0]))
+            if location is not None:
+                index, offset = location
+                stop = offset + len(segments)
+                if (
+                    stop <= len(index.segments)
+                    and index.segments[offset] is segments[0]
+                    and index.segments[stop - 1] is segments[-1]
+                ):
+                    return index, offset
+        index = FirstTokenIndex(tuple(segments))
+        for idx, seg in enumerate(index.segments):
+            self._index_locations[id(seg)] = (index, idx)
+        return index, 0
 
     def clear(self):
-        """Clear the denylist struct."""
-        self._denylist_struct = {}
+        """Clear the memo struct."""
+        self._memo_struct = {}
+        self._index_locations = {}
+
+
+class FirstTokenIndex:
+    """An index of the upper case first token of each segment in a buffer.
+
+    This allows finding all the positions at which simple matchers
+    could match with a dictionary lookup rather than a scan.
+    """
+
+    def __init__(self, segments: Tuple["BaseSegment", ...]):
+        self.segments = segments
+        positions: Dict[str, List[int]] = defaultdict(list)
+        # For existing compound segments, we should assume that within
+        # that segment, things are internally consistent, that means
+        # rather than enumerating all the individual segments of a longer
+        # one we just use the whole segment, but splitting off the
+        # first element separated by whitespace. This is a) faster and
+        # also b) prevents some really horrible bugs with bracket matching.
+        # See https://github.com/sqlfluff/sqlfluff/issues/433
+        for idx, seg in enumerate(segments):
+            tokens = seg.raw_upper.split(maxsplit=1)
+            positions[tokens[0] if tokens else ""].append(idx)
+        self._positions = dict(positions)
+
+    def positions(self, token: str, start: int, stop: int) -> List[int]:
+        """Return the sorted positions of token, between start and stop."""
+        token_positions = self._positions.get(token)
+        if not token_positions:
+            return []
+        return token_positions[
+            bisect_left(token_positions, start) : bisect_left(token_positions, stop)
+        ]
@@ -8,7 +8,7 @@ from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.string_helpers import curtail_string
 
 from sqlfluff.core.parser.segments import BaseSegment, BracketedSegment, allow_ephemeral
-from sqlfluff.core.parser.helpers import trim_non_code_segments, iter_indices
+from sqlfluff.core.parser.helpers import trim_non_code_segments
 from sqlfluff.core.parser.match_result import MatchResult
 from sqlfluff.core.parser.match_logging import (
     parse_match_logging,
@@ -330,36 +330,24 @@ class BaseGrammar(Matchable):
         best_simple_match = None
         if simple_matchers:
             # If they're all simple we can use a hash match to identify the first one.
-            # Build a buffer of all the upper case raw segments ahead of us.
-            str_buff = []
-            # For existing compound segments, we should assume that within
-            # that segment, things are internally consistent, that means
-            # rather than enumerating all the individual segments of a longer
-            # one we just dump out the whole segment, but splitting off the
-            # first element separated by whitespace. This is a) faster and
-            # also b) prevents some really horrible bugs with bracket matching.
-            # See https://github.com/sqlfluff/sqlfluff/issues/433
-
-            def _trim_elem(seg):
-                s = seg.raw_upper.split(maxsplit=1)
-                return s[0] if s else ""
-
-            str_buff = [_trim_elem(seg) for seg in segments]
+            # Fetch an index of the upper case first token of each segment ahead
+            # of us. This is shared between look ahead calls on the same buffer.
+            index, offset = parse_context.memo.first_token_index(segments)
+            stop = offset + len(segments)
             match_queue = []
 
             for matcher, simple in simple_matchers:
                 # Simple will be a tuple of options
                 assert simple
                 for simple_option in simple:
-                    # NOTE: We use iter_indices to make sure we capture
-                    # all instances of potential matches if there are many.
-                    # This is important for bracket counting.
-                    for buff_pos in iter_indices(str_buff, simple_option):
-                        match_queue.append((matcher, buff_pos, simple_option))
+                    # NOTE: We capture all instances of potential matches if
+                    # there are many. This is important for bracket counting.
+                    for buff_pos in index.positions(simple_option, offset, stop):
+                        match_queue.append((matcher, buff_pos - offset, simple_option))
 
-            # Sort the match queue. First to process AT THE END.
-            # That means we pop from the end.
-            match_queue = sorted(match_queue, key=lambda x: x[1])
+            # Sort the match queue. First to process AT THE START. The sort is
+            # stable, so for matches at the same position, the first matcher wins.
+            match_queue.sort(key=lambda x: x[1])
 
             parse_match_logging(
                 cls.__name__,
@@ -368,13 +356,9 @@ class BaseGrammar(Matchable):
                 parse_context=parse_context,
                 v_level=4,
                 mq=match_queue,
-                sb=str_buff,
             )
 
-            while match_queue:
-                # We've managed to match. We can shortcut home.
-                # NB: We may still need to deal with whitespace.
-                queued_matcher, queued_buff_pos, queued_option = match_queue.pop()
+            for queued_matcher, queued_buff_pos, queued_option in match_queue:
                 # Here we do the actual transform to the new segment.
                 match = queued_matcher.match(segments[queued_buff_pos:], parse_context)
                 if not match:
@@ -390,7 +374,9 @@ class BaseGrammar(Matchable):
                     )
                     continue
                 # Ok we have a match. Because we sorted the list, we'll take it!
+                # NB: We may still need to deal with whitespace.
                 best_simple_match = (segments[:queued_buff_pos], match, queued_matcher)
+                break
 
         if not non_simple_matchers:
             # There are no other matchers, we can just shortcut now.
@@ -876,7 +862,7 @@ class Ref(BaseGrammar):
         on the underlying class.
 
         The match element of Ref, also implements the caching
-        using the parse_context `denylist` methods.
+        using the parse_context `memo` methods.
         """
         elem = self._get_elem(dialect=parse_context.dialect)
 
@@ -891,26 +877,25 @@ class Ref(BaseGrammar):
         # We rely on segments not being mutated within a given
         # match cycle and so the ids should continue to refer to unchanged
         # objects.
-        seg_tuple = (id(seg) for seg in segments)
         self_name = self._get_ref()
-        if parse_context.denylist.check(self_name, seg_tuple):  # pragma: no cover TODO?
+        resp = parse_context.memo.check(self_name, segments)
+        if resp is not None:
             # This has been tried before.
             parse_match_logging(
                 self.__class__.__name__,
                 "match",
-                "SKIP",
+                "MEMO",
                 parse_context=parse_context,
                 v_level=3,
                 self_name=self_name,
             )
-            return MatchResult.from_unmatched(segments)
+            return resp
 
         # Match against that. NB We're not incrementing the match_depth here.
         # References shouldn't really count as a depth of match.
-        with parse_context.matching_segment(self._get_ref()) as ctx:
+        with parse_context.matching_segment(self_name) as ctx:
             resp = elem.match(segments=segments, parse_context=ctx)
-        if not resp:
-            parse_context.denylist.mark(self_name, seg_tuple)
+        parse_context.memo.mark(self_name, segments, resp)
         return resp
 
     @classmethod
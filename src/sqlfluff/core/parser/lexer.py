@@ -1,7 +1,8 @@
 """The code for the Lexer."""
 
 import logging
-from typing import Optional, List, Tuple, Union, NamedTuple
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple, Union, NamedTuple
 from uuid import UUID, uuid4
 import regex
 
@@ -256,6 +257,126 @@ class RegexLexer(StringLexer):
         return None
 
 
+# Constructs which depend on text before the position being matched, refer to
+# other groups by number, recurse into the pattern or set global flags. A
+# pattern including any of them can't be safely matched from the middle of the
+# string, or combined with other patterns. This is deliberately cautious, any
+# false positives just mean that pattern is matched on its own.
+_POSITION_SENSITIVE_REGEX = regex.compile(
+    r"\\[0-9AGbBZ]|\(\?(?:<[=!]|P=|P>|R\)|&|[0-9+-]|[a-zA-Z]+\))|(?<!\[)\^"
+)
+
+
+class CompiledLexerStep(NamedTuple):
+    """A step in the compiled form of a list of lexer matchers.
+
+    Either a single regex which combines a run of consecutive matchers as
+    named alternatives, or a single matcher to be matched on its own.
+    """
+
+    pattern: Optional["regex.Pattern"]
+    matchers: Tuple[StringLexer, ...]
+    group_index: Dict[str, int]
+
+
+def _is_combinable(matcher: StringLexer) -> bool:
+    """Can this matcher be combined with others in a single regex?"""
+    # Subclasses might override `_match`, so only combine the base classes.
+    if type(matcher) is StringLexer:
+        return True
+    elif type(matcher) is RegexLexer:
+        # A leading DOTALL flag is redundant because we set it anyway.
+        template = matcher.template
+        if template.startswith("(?s)"):
+            template = template[4:]
+        return not _POSITION_SENSITIVE_REGEX.search(template)
+    return False
+
+
+def _matcher_pattern(matcher: StringLexer) -> str:
+    if type(matcher) is RegexLexer:
+        return matcher.template
+    return regex.escape(matcher.template)
+
+
+def compile_lexer_matchers(
+    lexer_matchers: List[StringLexer],
+) -> List[CompiledLexerStep]:
+    """Compile a list of lexer matchers into as few regexes as possible.
+
+    Runs of consecutive matchers which can be combined are compiled into a
+    single alternation, with a named group for each matcher. Regex alternation
+    takes the first alternative which matches, so a single call to that
+    pattern gives the same result as trying each matcher in order. Any other
+    matchers are kept as steps of their own.
+
+    NOTE: The result is cached for each unique tuple of matchers, so the
+    matchers of each expanded dialect are only compiled once.
+    """
+    return list(_compile_lexer_matchers(tuple(lexer_matchers)))
+
+
+@lru_cache(maxsize=64)
+def _compile_lexer_matchers(
+    lexer_matchers: Tuple[StringLexer, ...]
+) -> Tuple[CompiledLexerStep, ...]:
+    steps: List[CompiledLexerStep] = []
+    run: List[StringLexer] = []
+
+    def _flush_run():
+        if not run:
+            return
+        try:
+            pattern = regex.compile(
+                "|".join(
+                    f"(?P<_lex{idx}>{_matcher_pattern(matcher)})"
+                    for idx, matcher in enumerate(run)
+                ),
+                regex.DOTALL,
+            )
+        except regex.error:  # pragma: no cover
+            # e.g. if templates use group names which clash.
+            steps.extend(CompiledLexerStep(None, (m,), {}) for m in run)
+        else:
+            steps.append(
+                CompiledLexerStep(
+                    pattern,
+                    tuple(run),
+                    {f"_lex{idx}": idx for idx in range(len(run))},
+                )
+            )
+        run.clear()
+
+    for matcher in lexer_matchers:
+        if _is_combinable(matcher):
+            run.append(matcher)
+        else:
+            _flush_run()
+            steps.append(CompiledLexerStep(None, (matcher,), {}))
+    _flush_run()
+    return tuple(steps)
+
+
+def _match_combinable_at(
+    matcher: StringLexer, string: str, pos: int
+) -> Optional[LexedElement]:
+    """Match a single combinable matcher at a position in a string."""
+    if type(matcher) is RegexLexer:
+        match = matcher._compiled_regex.match(string, pos)
+        if not match:
+            return None
+        elif match.end() > pos:
+            return LexedElement(match.group(0), matcher)
+        lexer_logger.warning(
+            f"Zero length Lex item returned from {matcher.name!r}. Report this as "
+            "a bug."
+        )
+        return None
+    elif string.startswith(matcher.template, pos):
+        return LexedElement(matcher.template, matcher)
+    return None
+
+
 def _generate_template_loop_segments(
     source_slice: slice,
     last_source_slice: slice,
@@ -510,6 +631,7 @@ class Lexer:
         self.config = FluffConfig.from_kwargs(config=config, dialect=dialect)
         # Store the matchers
         self.lexer_matchers = self.config.get("dialect_obj").get_lexer_matchers()
+        self.lexer_steps = compile_lexer_matchers(self.lexer_matchers)
 
         self.last_resort_lexer = last_resort_lexer or RegexLexer(
             "<unlexable>",
@@ -537,21 +659,22 @@ class Lexer:
 
         # Lex the string to get a tuple of LexedElement
         element_buffer: List[LexedElement] = []
+        pos = 0
         while True:
-            res = self.lex_match(str_buff, self.lexer_matchers)
-            element_buffer += res.elements
-            if res.forward_string:
-                resort_res = self.last_resort_lexer.match(res.forward_string)
+            pos = self.lex_match_from(str_buff, pos, self.lexer_steps, element_buffer)
+            if pos < len(str_buff):
+                forward_string = str_buff[pos:]
+                resort_res = self.last_resort_lexer.match(forward_string)
                 if not resort_res:
                     # If we STILL can't match, then just panic out.
                     raise SQLLexError(
                         f"Fatal. Unable to lex characters: {0!r}".format(
-                            res.forward_string[:10] + "..."
-                            if len(res.forward_string) > 9
-                            else res.forward_string
+                            forward_string[:10] + "..."
+                            if len(forward_string) > 9
+                            else forward_string
                         )
                     )
-                str_buff = resort_res.forward_string
+                pos = len(str_buff) - len(resort_res.forward_string)
                 element_buffer += resort_res.elements
             else:  # pragma: no cover TODO?
                 break
@@ -704,6 +827,64 @@ class Lexer:
                 # We've got so far, but now can't match. Return
                 return LexMatch(forward_string, elem_buff)
 
+    @staticmethod
+    def lex_match_from(
+        string: str,
+        pos: int,
+        lexer_steps: List[CompiledLexerStep],
+        elem_buff: List[LexedElement],
+    ) -> int:
+        """Iteratively match a string from a position using compiled matchers.
+
+        This gives the same result as `lex_match`, but works through the
+        original string by index rather than slicing it at every step.
+
+        Returns:
+            The position we matched up to. Matched elements are added to
+            `elem_buff`.
+        """
+        end = len(string)
+        while pos < end:
+            # We only slice the string if we need it for a matcher which
+            # can't be compiled.
+            forward_string: Optional[str] = None
+            for step in lexer_steps:
+                if step.pattern is None:
+                    if forward_string is None:
+                        forward_string = string[pos:]
+                    res = step.matchers[0].match(forward_string)
+                    if res.elements:
+                        elem_buff += res.elements
+                        pos = end - len(res.forward_string)
+                        break
+                    continue
+
+                match = step.pattern.match(string, pos)
+                if not match:
+                    continue
+                idx = step.group_index[match.lastgroup]
+                matched: Optional[LexedElement]
+                if match.end() > pos:
+                    matched = LexedElement(match.group(0), step.matchers[idx])
+                else:
+                    # A zero length match. Matching individually warns about
+                    # and skips that one, so carry on with the rest of the step.
+                    for matcher in step.matchers[idx:]:
+                        matched = _match_combinable_at(matcher, string, pos)
+                        if matched:
+                            break
+                if matched:
+                    # Handle potential subdivision elsewhere.
+                    elem_buff += matched.matcher._subdivide(matched)
+                    pos += len(matched.raw)
+                    # Cycle back around again and start with the top
+                    # matcher again.
+                    break
+            else:
+                # We've got so far, but now can't match. Return
+                return pos
+        return pos
+
     @staticmethod
     def map_template_slices(
         elements: List[LexedElement], template: TemplatedFile
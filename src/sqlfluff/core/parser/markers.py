@@ -3,14 +3,12 @@
 This class is a construct to keep track of positions within a file.
 """
 
-from dataclasses import dataclass
 from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sqlfluff.core.templaters import TemplatedFile  # pragma: no cover
 
 
-@dataclass(frozen=True)
 class PositionMarker:
     """A reference to a position in a file.
 
@@ -25,25 +23,67 @@ class PositionMarker:
         - Positions within the fixed file are identified with a line number and line
           position, which identify a point.
         - Arithmetic comparisons are on the location in the fixed file.
+        - A marker is created for every segment, so it uses slots to keep
+          them small. Markers should be treated as immutable.
     """
 
-    source_slice: slice
-    templated_slice: slice
-    templated_file: "TemplatedFile"
-    # If not set, these will be initialised in the post init.
-    working_line_no: int = -1
-    working_line_pos: int = -1
-
-    def __post_init__(self):
-        # If the working position has not been explicitly set
-        # then infer it from the position in the templated file.
-        # This is accurate up until the point that any fixes have
-        # been applied.
-        if self.working_line_no == -1 or self.working_line_pos == -1:
-            line_no, line_pos = self.templated_position()
-            # Use the base method because we're working with a frozen class
-            object.__setattr__(self, "working_line_no", line_no)
-            object.__setattr__(self, "working_line_pos", line_pos)
+    __slots__ = (
+        "source_slice",
+        "templated_slice",
+        "templated_file",
+        "_working_line_no",
+        "_working_line_pos",
+    )
+
+    def __init__(
+        self,
+        source_slice: slice,
+        templated_slice: slice,
+        templated_file: "TemplatedFile",
+        # If not set, these will be inferred when first needed.
+        working_line_no: int = -1,
+        working_line_pos: int = -1,
+    ):
+        # In untemplated files the slices are usually the same, so share
+        # one of them to save memory.
+        self.source_slice = (
+            templated_slice if source_slice == templated_slice else source_slice
+        )
+        self.templated_slice = templated_slice
+        self.templated_file = templated_file
+        self._working_line_no = working_line_no
+        self._working_line_pos = working_line_pos
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.source_slice == other.source_slice
+            and self.templated_slice == other.templated_slice
+            and self.templated_file == other.templated_file
+            and self.working_loc == other.working_loc
+        )
+
+    def __hash__(self):
+        return hash(
+            (
+                self.source_slice.start,
+                self.source_slice.stop,
+                self.templated_slice.start,
+                self.templated_slice.stop,
+                self.templated_file,
+                self.working_loc,
+            )
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(source_slice={self.source_slice!r}, "
+            f"templated_slice={self.templated_slice!r}, "
+            f"templated_file={self.templated_file!r}, "
+            f"working_line_no={self.working_line_no!r}, "
+            f"working_line_pos={self.working_line_pos!r})"
+        )
 
     def __str__(self):
         return self.to_source_string()
@@ -62,16 +102,30 @@ class PositionMarker:
 
     @property
     def working_loc(self) -> Tuple[int, int]:
-        """Location tuple for the working position."""
-        return self.working_line_no, self.working_line_pos
+        """Location tuple for the working position.
+
+        If the working position has not been explicitly set then it's
+        inferred from the position in the templated file, the first time
+        it's needed. This is accurate up until the point that any fixes
+        have been applied.
+        """
+        if self._working_line_no == -1 or self._working_line_pos == -1:
+            self._working_line_no, self._working_line_pos = self.templated_position()
+        return self._working_line_no, self._working_line_pos
+
+    @property
+    def working_line_no(self) -> int:
+        """The line number of the working position."""
+        return self.working_loc[0]
+
+    @property
+    def working_line_pos(self) -> int:
+        """The line position of the working position."""
+        return self.working_loc[1]
 
     def working_loc_after(self, raw: str) -> Tuple[int, int]:
         """Location tuple for the working position."""
-        return self.infer_next_position(
-            raw,
-            self.working_line_no,
-            self.working_line_pos,
-        )
+        return self.infer_next_position(raw, *self.working_loc)
 
     @classmethod
     def from_point(
@@ -139,9 +193,10 @@ class PositionMarker:
             self.source_slice.start,
             self.templated_slice.start,
             templated_file=self.templated_file,
-            # Start points also pass on the working position.
-            working_line_no=self.working_line_no,
-            working_line_pos=self.working_line_pos,
+            # Start points also pass on the working position (if it's been
+            # set or inferred yet, otherwise they can infer the same).
+            working_line_no=self._working_line_no,
+            working_line_pos=self._working_line_pos,
         )
 
     def end_point_marker(self) -> "PositionMarker":
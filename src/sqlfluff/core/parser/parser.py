@@ -1,6 +1,6 @@
 """Defines the Parser class."""
 
-from typing import Optional, Sequence, TYPE_CHECKING
+from typing import Dict, Optional, Sequence, TYPE_CHECKING
 
 from sqlfluff.core.parser.context import RootParseContext
 from sqlfluff.core.config import FluffConfig
@@ -24,8 +24,13 @@ class Parser:
         segments: Sequence["BaseSegment"],
         recurse=True,
         fname: Optional[str] = None,
+        parse_statistics: Optional[Dict[str, int]] = None,
     ) -> Optional["BaseSegment"]:
-        """Parse a series of lexed tokens using the current dialect."""
+        """Parse a series of lexed tokens using the current dialect.
+
+        If a `parse_statistics` dict is provided, it is updated with
+        the number of hits and misses on the match memo during the parse.
+        """
         if not segments:  # pragma: no cover
             # This should normally never happen because there will usually
             # be an end_of_file segment. It would probably only happen in
@@ -36,6 +41,11 @@ class Parser:
         # Call .parse() on that segment
 
         with RootParseContext.from_config(config=self.config, recurse=recurse) as ctx:
-            parsed = root_segment.parse(parse_context=ctx)
+            try:
+                parsed = root_segment.parse(parse_context=ctx)
+            finally:
+                if parse_statistics is not None:
+                    parse_statistics["parse memo hits"] = ctx.memo.hits
+                    parse_statistics["parse memo misses"] = ctx.memo.misses
 
         return parsed
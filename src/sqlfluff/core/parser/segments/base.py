@@ -11,9 +11,9 @@ Here we define:
 from collections import defaultdict
 from collections.abc import MutableSet
 from copy import deepcopy, copy
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from io import StringIO
-from itertools import takewhile, chain
+from itertools import count, takewhile, chain
 from typing import (
     Any,
     Callable,
@@ -27,7 +27,8 @@ from typing import (
     TYPE_CHECKING,
 )
 import logging
-from uuid import UUID, uuid4
+import os
+import random
 
 from tqdm import tqdm
 
@@ -59,6 +60,35 @@ if TYPE_CHECKING:
 linter_logger = logging.getLogger("sqlfluff.linter")
 
 
+def _reset_segment_ids() -> None:
+    """Start a new sequence of segment ids for this process.
+
+    Each process starts from a random point (and forked processes start
+    again), so that ids stay unique when segments from several processes
+    are combined, e.g. when parsing the statements of a file in parallel.
+    """
+    global _segment_ids
+    _segment_ids = count(random.getrandbits(64) << 32)
+
+
+_reset_segment_ids()
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_segment_ids)
+
+
+def new_segment_id() -> int:
+    """Get a new id, unique to a segment.
+
+    Segment ids are used to track segments when applying fixes. They are
+    much cheaper than a uuid, which matters as every segment needs one.
+    """
+    return next(_segment_ids)
+
+
+# The (Mersenne prime) modulus of the rolling hash of segment raws.
+RAW_HASH_MODULUS = (1 << 61) - 1
+
+
 @dataclass(frozen=True)
 class SourceFix:
     """A stored reference to a fix in the non-templated file."""
@@ -283,7 +313,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
         self,
         segments,
         pos_marker: Optional[PositionMarker] = None,
-        uuid: Optional[UUID] = None,
+        uuid: Optional[int] = None,
     ):
         # A cache variable for expandable
         self._is_expandable: Optional[bool] = None
@@ -318,7 +348,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
 
         self.pos_marker = pos_marker
         # Tracker for matching when things start moving.
-        self.uuid = uuid or uuid4()
+        self.uuid = uuid if uuid is not None else new_segment_id()
 
         self._recalculate_caches()
 
@@ -418,6 +448,23 @@ class BaseSegment(metaclass=SegmentMetaclass):
         """Make a string from the segments of this segment."""
         return "".join(seg.raw for seg in self.segments)
 
+    @cached_property
+    def raw_hash(self) -> Tuple[int, int]:
+        """A rolling hash of the raw of this segment.
+
+        This is a polynomial hash of the utf-8 bytes of the raw, with the
+        multiplier needed to shift a hash past them. That means it's built
+        from the hashes of the children without making the raw string, and
+        the same raw gives the same hash however it's split into segments.
+        After fixes, only the segments which changed need hashing again.
+        """
+        raw_hash, shift = 0, 1
+        for seg in self.segments:
+            seg_hash, seg_shift = seg.raw_hash
+            raw_hash = (raw_hash * seg_shift + seg_hash) % RAW_HASH_MODULUS
+            shift = (shift * seg_shift) % RAW_HASH_MODULUS
+        return raw_hash, shift
+
     @property
     def class_types(self) -> Set[str]:
         """The set of types for this segment."""
@@ -605,6 +652,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
         cls,
         segments: Tuple["BaseSegment", ...],
         parent_pos: Optional[PositionMarker] = None,
+        edited_uuids: Optional[Set[int]] = None,
     ) -> Tuple["BaseSegment", ...]:
         """Refresh positions of segments within a span.
 
@@ -616,6 +664,11 @@ class BaseSegment(metaclass=SegmentMetaclass):
         New segments are assumed to be metas or insertions
         and so therefore have a zero-length position in the
         source and templated file.
+
+        If `edited_uuids` is given (when applying fixes), any segment
+        which isn't one of them and is already at the right working
+        position must be positioned correctly all the way down, so is
+        reused as it is rather than copied and repositioned.
         """
         # If there are no segments, there's no need to reposition.
         if not segments:
@@ -639,8 +692,20 @@ class BaseSegment(metaclass=SegmentMetaclass):
 
         # Use the index so that we can look forward
         # and backward.
-        segment_buffer: Tuple["BaseSegment", ...] = ()
+        segment_buffer: List["BaseSegment"] = []
         for idx, segment in enumerate(segments):
+            if (
+                edited_uuids is not None
+                and segment.pos_marker
+                and segment.uuid not in edited_uuids
+                and segment.pos_marker.working_loc == (line_no, line_pos)
+            ):
+                line_no, line_pos = segment.pos_marker.infer_next_position(
+                    segment.raw, line_no, line_pos
+                )
+                segment_buffer.append(segment)
+                continue
+
             repositioned_seg = copy(segment)
             # Fill any that don't have a position.
             if not repositioned_seg.pos_marker:
@@ -681,12 +746,14 @@ class BaseSegment(metaclass=SegmentMetaclass):
             # If this segment has children, recurse and reposition them too.
             if repositioned_seg.segments:
                 repositioned_seg.segments = cls._position_segments(
-                    repositioned_seg.segments, parent_pos=repositioned_seg.pos_marker
+                    repositioned_seg.segments,
+                    parent_pos=repositioned_seg.pos_marker,
+                    edited_uuids=edited_uuids,
                 )
 
-            segment_buffer += (repositioned_seg,)
+            segment_buffer.append(repositioned_seg)
 
-        return segment_buffer
+        return tuple(segment_buffer)
 
     # ################ CLASS METHODS
 
@@ -831,6 +898,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
             "is_comment",
             "is_whitespace",
             "raw",
+            "raw_hash",
             "raw_upper",
             "matched_length",
             "raw_segments",
@@ -838,8 +906,8 @@ class BaseSegment(metaclass=SegmentMetaclass):
             "first_non_whitespace_segment_raw_upper",
             "source_fixes",
             "full_type_set",
-            "descendant_type_set ",
-            "direct_descendant_type_set ",
+            "descendant_type_set",
+            "direct_descendant_type_set",
         ]:
             self.__dict__.pop(key, None)
 
@@ -1171,9 +1239,9 @@ class BaseSegment(metaclass=SegmentMetaclass):
         provided which will override any existing parse grammar
         on the segment.
         """
-        # Clear the denylist cache so avoid missteps
+        # Clear the memo cache so avoid missteps
         if parse_context:
-            parse_context.denylist.clear()
+            parse_context.memo.clear()
 
         # the parse_depth and recurse kwargs control how deep we will recurse for
         # testing.
@@ -1303,11 +1371,56 @@ class BaseSegment(metaclass=SegmentMetaclass):
         If anything changes, this should return a new version of the segment
         rather than mutating the original.
 
+        Only the segments on the path down to a fix are rebuilt. Everything
+        else in the tree is reused (along with its cached properties), unless
+        a fix moves it to a different working position.
+
         Note: We need to have fixes to apply AND this must have children. In the case
         of raw segments, they will be replaced or removed by their parent and
         so this function should just return self.
         """
-        if fixes and not self.is_raw():
+        if not fixes or self.is_raw():
+            return self, [], []
+        fix_paths: Set[int] = set()
+        self._find_fix_paths(fixes, fix_paths)
+        # The edits may contain copies of segments from elsewhere in the
+        # tree, whose positions we can't trust. Those copies keep their
+        # uuids, so may also be the anchors of other fixes.
+        edited_uuids = set()
+        for anchor_info in list(fixes.values()):
+            for fix in anchor_info.fixes:
+                edits = [fix.edit] if isinstance(fix.edit, BaseSegment) else fix.edit
+                for edit in edits or ():
+                    edit._find_fix_paths(fixes, fix_paths)
+                    edited_uuids.update(seg.uuid for seg in edit.recursive_crawl_all())
+        return self._apply_fixes(dialect, rule_code, fixes, fix_paths, edited_uuids)
+
+    def _find_fix_paths(self, fixes: Dict, fix_paths: Set[int]) -> bool:
+        """Find the segments which contain the anchor of a fix.
+
+        The uuids of those segments are added to `fix_paths`, and this
+        returns whether this segment is one of them.
+        """
+        found = False
+        for seg in self.segments:
+            if seg.uuid in fixes:
+                found = True
+            if seg.segments and seg._find_fix_paths(fixes, fix_paths):
+                found = True
+        if found:
+            fix_paths.add(self.uuid)
+        return found
+
+    def _apply_fixes(
+        self,
+        dialect,
+        rule_code: str,
+        fixes: Dict,
+        fix_paths: Set[int],
+        edited_uuids: Set[int],
+    ) -> Tuple["BaseSegment", List["BaseSegment"], List["BaseSegment"]]:
+        """Apply fixes to this segment, if it contains any of their anchors."""
+        if fixes and self.uuid in fix_paths:
             # Get a reference to self to start with, but this will rapidly
             # become a working copy.
             r = self
@@ -1382,8 +1495,6 @@ class BaseSegment(metaclass=SegmentMetaclass):
                                 )
                     else:
                         seg_buffer.append(seg)
-                # Invalidate any caches
-                self.invalidate_caches()
 
             # If any fixes applied, do an intermediate reposition. When applying
             # fixes to children and then trying to reposition them, that recursion
@@ -1392,14 +1503,20 @@ class BaseSegment(metaclass=SegmentMetaclass):
             # working positions to work with.
             if fixes_applied:
                 seg_buffer = list(
-                    self._position_segments(tuple(seg_buffer), parent_pos=r.pos_marker)
+                    self._position_segments(
+                        tuple(seg_buffer),
+                        parent_pos=r.pos_marker,
+                        edited_uuids=edited_uuids,
+                    )
                 )
 
             # Then recurse (i.e. deal with the children) (Requeueing)
             seg_queue = seg_buffer
             seg_buffer = []
             for seg in seg_queue:
-                s, before, after = seg.apply_fixes(dialect, rule_code, fixes)
+                s, before, after = seg._apply_fixes(
+                    dialect, rule_code, fixes, fix_paths, edited_uuids
+                )
                 # 'before' and 'after' will usually be empty. Only used when
                 # lower-level fixes left 'seg' with non-code (usually
                 # whitespace) segments as the first or last children. This is
@@ -1453,7 +1570,9 @@ class BaseSegment(metaclass=SegmentMetaclass):
             r = r.__class__(
                 # Realign the segments within
                 segments=self._position_segments(
-                    tuple(seg_buffer), parent_pos=r.pos_marker
+                    tuple(seg_buffer),
+                    parent_pos=r.pos_marker,
+                    edited_uuids=edited_uuids,
                 ),
                 pos_marker=r.pos_marker,
                 # Pass through any additional kwargs
@@ -1491,9 +1610,11 @@ class BaseSegment(metaclass=SegmentMetaclass):
                 # parse() on a "backup copy" of the segment.
                 r_copy = deepcopy(segment)
                 for seg in r_copy.segments:
-                    seg.pos_marker = replace(
-                        seg.pos_marker,
-                        templated_file=self.pos_marker.templated_file,
+                    seg.pos_marker = PositionMarker(
+                        seg.pos_marker.source_slice,
+                        seg.pos_marker.templated_slice,
+                        self.pos_marker.templated_file,
+                        *seg.pos_marker.working_loc,
                     )
                 r_copy.parse(parse_context)
             except ValueError:  # pragma: no cover
@@ -5,9 +5,13 @@ any children, and the output of the lexer.
 """
 
 from typing import List, Optional, Tuple, Set
-from uuid import UUID, uuid4
 
-from sqlfluff.core.parser.segments.base import BaseSegment, SourceFix
+from sqlfluff.core.parser.segments.base import (
+    RAW_HASH_MODULUS,
+    BaseSegment,
+    SourceFix,
+    new_segment_id,
+)
 from sqlfluff.core.parser.markers import PositionMarker
 
 
@@ -21,6 +25,13 @@ class RawSegment(BaseSegment):
     # Classes inheriting from RawSegment may provide a _default_raw
     # to enable simple initialisation.
     _default_raw = ""
+    # Defaults for optional attributes. These are only set on instances
+    # which have a value, as lexing creates a *lot* of raw segments and
+    # each instance attribute takes up memory.
+    _surrogate_type: Optional[str] = None
+    trim_start: Optional[Tuple[str, ...]] = None
+    trim_chars: Optional[Tuple[str, ...]] = None
+    _source_fixes: Optional[List[SourceFix]] = None
 
     def __init__(
         self,
@@ -30,7 +41,7 @@ class RawSegment(BaseSegment):
         trim_start: Optional[Tuple[str, ...]] = None,
         trim_chars: Optional[Tuple[str, ...]] = None,
         source_fixes: Optional[List[SourceFix]] = None,
-        uuid: Optional[UUID] = None,
+        uuid: Optional[int] = None,
     ):
         """Initialise raw segment.
 
@@ -38,26 +49,30 @@ class RawSegment(BaseSegment):
         If pos_marker is not provided, it is assume that this will be
         inserted later as part of a reposition phase.
         """
-        if raw is not None:  # NB, raw *can* be an empty string and be valid
-            self._raw = raw
-        else:
-            self._raw = self._default_raw
-        self._raw_upper = self._raw.upper()
+        if raw is None:  # NB, raw *can* be an empty string and be valid
+            raw = self._default_raw
+        self._raw = raw
+        # Reuse the raw string if it's already uppercase (e.g. whitespace,
+        # symbols and uppercase keywords), rather than holding a copy.
+        raw_upper = raw.upper()
+        self._raw_upper = raw if raw_upper == raw else raw_upper
         # pos marker is required here. We ignore the typing initially
         # because it might *initially* be unset, but it will be reset
         # later.
         self.pos_marker: PositionMarker = pos_marker  # type: ignore
+        # Id for matching
+        self.uuid = uuid if uuid is not None else new_segment_id()
         # if a surrogate type is provided, store it for later.
-        self._surrogate_type = type
+        if type is not None:
+            self._surrogate_type = type
         # What should we trim off the ends to get to content
-        self.trim_start = trim_start
-        self.trim_chars = trim_chars
-        # A cache variable for expandable
-        self._is_expandable = None
+        if trim_start is not None:
+            self.trim_start = trim_start
+        if trim_chars is not None:
+            self.trim_chars = trim_chars
         # Keep track of any source fixes
-        self._source_fixes = source_fixes
-        # UUID for matching
-        self.uuid = uuid or uuid4()
+        if source_fixes:
+            self._source_fixes = source_fixes
 
     def __repr__(self):
         return "<{}: ({}) {!r}>".format(
@@ -100,6 +115,19 @@ class RawSegment(BaseSegment):
         """Returns the raw segment."""
         return self._raw
 
+    @property
+    def raw_hash(self) -> Tuple[int, int]:
+        """A rolling hash of the raw.
+
+        This isn't cached (to save memory), as it's cheap to compute and
+        parents cache their own.
+        """
+        raw_bytes = self._raw.encode("utf-8")
+        return (
+            int.from_bytes(raw_bytes, "big") % RAW_HASH_MODULUS,
+            pow(256, len(raw_bytes), RAW_HASH_MODULUS),
+        )
+
     @property
     def raw_upper(self):
         """Returns the raw segment in uppercase."""
@@ -110,6 +138,26 @@ class RawSegment(BaseSegment):
         """Returns self to be compatible with calls to its superclass."""
         return [self]
 
+    @property
+    def raw_segments_with_ancestors(self):
+        """Raw segments have no children, so there are none."""
+        return []
+
+    @property
+    def descendant_type_set(self) -> Set[str]:
+        """Raw segments have no children, so there are none."""
+        return set()
+
+    @property
+    def direct_descendant_type_set(self) -> Set[str]:
+        """Raw segments have no children, so there are none."""
+        return set()
+
+    @property
+    def first_non_whitespace_segment_raw_upper(self) -> Optional[str]:
+        """Returns the raw (uppercase), unless it's only whitespace."""
+        return self._raw_upper if self._raw_upper.strip() else None
+
     @property
     def segments(self):
         """Return an empty list of child segments.
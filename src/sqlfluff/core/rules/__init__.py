@@ -10,6 +10,8 @@ from sqlfluff.core.rules.base import (
 )
 from sqlfluff.core.rules.context import RuleContext
 from sqlfluff.core.rules.config_info import STANDARD_CONFIG_INFO_DICT
+from sqlfluff.core.rules.loader import load_rule_manifest
+from sqlfluff.core.plugin import project_name
 from sqlfluff.core.plugin.host import get_plugin_manager
 
 
@@ -20,9 +22,20 @@ def _load_standard_rules():
     are possible.
     """
     std_rule_set = RuleSet(name="standard", config_info=STANDARD_CONFIG_INFO_DICT)
+    plugin_manager = get_plugin_manager()
+    get_rules = plugin_manager.hook.get_rules
+
+    # The rules bundled with sqlfluff are registered from their manifest, so
+    # that each rule is only imported if it's used. Any other plugins
+    # provide their rules as classes.
+    core_plugin = plugin_manager.get_plugin(project_name)
+    if core_plugin:
+        for code, manifest_entry in load_rule_manifest().items():
+            std_rule_set.register_lazy(code, manifest_entry)
+        get_rules = plugin_manager.subset_hook_caller("get_rules", [core_plugin])
 
     # Iterate through the rules list and register each rule with the standard set.
-    for plugin_rules in get_plugin_manager().hook.get_rules():
+    for plugin_rules in get_rules():
         for rule in plugin_rules:
             std_rule_set.register(rule)
 
@@ -22,11 +22,13 @@ import pathlib
 import regex
 from typing import (
     cast,
+    Dict,
     Iterable,
     Optional,
     List,
     Set,
     Tuple,
+    Type,
     Union,
     Any,
 )
@@ -40,7 +42,8 @@ from sqlfluff.core.parser import BaseSegment, PositionMarker, RawSegment
 from sqlfluff.core.dialects import Dialect
 from sqlfluff.core.errors import SQLLintError
 from sqlfluff.core.rules.context import RuleContext
-from sqlfluff.core.rules.crawlers import BaseCrawler
+from sqlfluff.core.rules.crawlers import BaseCrawler, SegmentSeekerCrawler
+from sqlfluff.core.rules.loader import load_rule_class
 from sqlfluff.core.templaters.base import RawFileSlice, TemplatedFile
 
 # The ghost of a rule (mostly used for testing)
@@ -507,77 +510,101 @@ class BaseRule:
         memory: Any = root_context.memory
         context = root_context
         for context in self.crawl_behaviour.crawl(root_context):
-            try:
-                context.memory = memory
-                res = self._eval(context=context)
-            except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
-                raise
-            # Any exception at this point would halt the linter and
-            # cause the user to get no results
-            except Exception as e:
-                self.logger.critical(
-                    f"Applying rule {self.code} threw an Exception: {e}", exc_info=True
-                )
-                assert context.segment.pos_marker
-                exception_line, _ = context.segment.pos_marker.source_position()
-                self._log_critical_errors(e)
-                vs.append(
-                    SQLLintError(
-                        rule=self,
-                        segment=context.segment,
-                        fixes=[],
-                        description=(
-                            f"Unexpected exception: {str(e)};\n"
-                            "Could you open an issue at "
-                            "https://github.com/sqlfluff/sqlfluff/issues ?\n"
-                            "You can ignore this exception for now, by adding "
-                            f"'-- noqa: {self.code}' at the end\n"
-                            f"of line {exception_line}\n"
-                        ),
-                    )
+            memory, crashed = self._eval_context(
+                context, memory, templated_file, ignore_mask, tree, vs, fixes
+            )
+            if crashed:
+                break
+        return vs, context.raw_stack if context else tuple(), fixes, context.memory
+
+    def _eval_context(
+        self,
+        context: RuleContext,
+        memory: Any,
+        templated_file: Optional["TemplatedFile"],
+        ignore_mask: List[NoQaDirective],
+        tree: BaseSegment,
+        vs: List[SQLLintError],
+        fixes: List[LintFix],
+    ) -> Tuple[Any, bool]:
+        """Evaluate the rule on a single context, adding to `vs` and `fixes`.
+
+        Returns:
+            A tuple of (memory, crashed). The memory is for the next
+            evaluation. If `crashed` is True, the rule raised an exception
+            and shouldn't be evaluated any further on this tree.
+        """
+        try:
+            context.memory = memory
+            res = self._eval(context=context)
+        except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
+            raise
+        # Any exception at this point would halt the linter and
+        # cause the user to get no results
+        except Exception as e:
+            self.logger.critical(
+                f"Applying rule {self.code} threw an Exception: {e}", exc_info=True
+            )
+            assert context.segment.pos_marker
+            exception_line, _ = context.segment.pos_marker.source_position()
+            self._log_critical_errors(e)
+            vs.append(
+                SQLLintError(
+                    rule=self,
+                    segment=context.segment,
+                    fixes=[],
+                    description=(
+                        f"Unexpected exception: {str(e)};\n"
+                        "Could you open an issue at "
+                        "https://github.com/sqlfluff/sqlfluff/issues ?\n"
+                        "You can ignore this exception for now, by adding "
+                        f"'-- noqa: {self.code}' at the end\n"
+                        f"of line {exception_line}\n"
+                    ),
                 )
-                return vs, context.raw_stack, fixes, context.memory
-
-            new_lerrs: List[SQLLintError] = []
-            new_fixes: List[LintFix] = []
-
-            if res is None or res == []:
-                # Assume this means no problems (also means no memory)
-                pass
-            elif isinstance(res, LintResult):
-                # Extract any memory
-                memory = res.memory
-                self._adjust_anchors_for_fixes(context, res)
+            )
+            return context.memory, True
+
+        new_lerrs: List[SQLLintError] = []
+        new_fixes: List[LintFix] = []
+
+        if res is None or res == []:
+            # Assume this means no problems (also means no memory)
+            pass
+        elif isinstance(res, LintResult):
+            # Extract any memory
+            memory = res.memory
+            self._adjust_anchors_for_fixes(context, res)
+            self._process_lint_result(
+                res, templated_file, ignore_mask, new_lerrs, new_fixes, tree
+            )
+        elif isinstance(res, list) and all(
+            isinstance(elem, LintResult) for elem in res
+        ):
+            # Extract any memory from the *last* one, assuming
+            # it was the last to be added
+            memory = res[-1].memory
+            for elem in res:
+                self._adjust_anchors_for_fixes(context, elem)
                 self._process_lint_result(
-                    res, templated_file, ignore_mask, new_lerrs, new_fixes, tree
+                    elem, templated_file, ignore_mask, new_lerrs, new_fixes, tree
                 )
-            elif isinstance(res, list) and all(
-                isinstance(elem, LintResult) for elem in res
-            ):
-                # Extract any memory from the *last* one, assuming
-                # it was the last to be added
-                memory = res[-1].memory
-                for elem in res:
-                    self._adjust_anchors_for_fixes(context, elem)
-                    self._process_lint_result(
-                        elem, templated_file, ignore_mask, new_lerrs, new_fixes, tree
-                    )
-            else:  # pragma: no cover
-                raise TypeError(
-                    "Got unexpected result [{!r}] back from linting rule: {!r}".format(
-                        res, self.code
-                    )
+        else:  # pragma: no cover
+            raise TypeError(
+                "Got unexpected result [{!r}] back from linting rule: {!r}".format(
+                    res, self.code
                 )
+            )
 
-            for lerr in new_lerrs:
-                self.logger.info("!! Violation Found: %r", lerr.description)
-            for lfix in new_fixes:
-                self.logger.info("!! Fix Proposed: %r", lfix)
+        for lerr in new_lerrs:
+            self.logger.info("!! Violation Found: %r", lerr.description)
+        for lfix in new_fixes:
+            self.logger.info("!! Fix Proposed: %r", lfix)
 
-            # Consume the new results
-            vs += new_lerrs
-            fixes += new_fixes
-        return vs, context.raw_stack if context else tuple(), fixes, context.memory
+        # Consume the new results
+        vs += new_lerrs
+        fixes += new_fixes
+        return memory, False
 
     # HELPER METHODS --------
     @staticmethod
@@ -850,6 +877,152 @@ class BaseRule:
         return [s.strip() for s in raw_str.split(",") if s.strip()]
 
 
+class _RuleCrawlState:
+    """The state of one rule, while crawling a tree with `crawl_rules`."""
+
+    def __init__(self, rule: BaseRule, context: RuleContext):
+        self.rule = rule
+        self.crawler = cast(SegmentSeekerCrawler, rule.crawl_behaviour)
+        self.context = context
+        self.memory: Any = context.memory
+        self.vs: List[SQLLintError] = []
+        self.fixes: List[LintFix] = []
+        self.crashed = False
+
+
+def crawl_rules(
+    rules: List[BaseRule],
+    tree: BaseSegment,
+    dialect: Dialect,
+    fix: bool,
+    templated_file: Optional["TemplatedFile"],
+    ignore_mask: List[NoQaDirective],
+    fname: Optional[str],
+    config: FluffConfig,
+) -> List[Tuple[List[SQLLintError], List[LintFix]]]:
+    """Run several rules on a given tree, walking the tree only once.
+
+    This gives the same results as calling :meth:`BaseRule.crawl` for each
+    rule in turn, but rules which use a :class:`SegmentSeekerCrawler` are
+    all evaluated during a single walk of the tree. An index of segment
+    types to rules finds the rules to evaluate on each segment, and each
+    rule keeps its own context and memory, so it sees the segments in the
+    same order as if it crawled the tree itself. Other rules (e.g. with a
+    :class:`RootOnlyCrawler`) crawl the tree themselves.
+
+    NOTE: This relies on the tree not changing between rules, so it's only
+    suitable when the fixes from one rule aren't applied before the next.
+
+    Returns:
+        A list of (vs, fixes) for each rule, in the same order as `rules`.
+    """
+    results: List[Optional[Tuple[List[SQLLintError], List[LintFix]]]] = []
+    states: List[_RuleCrawlState] = []
+    state_idxs: List[int] = []
+    for rule in rules:
+        if (
+            type(rule.crawl_behaviour) is SegmentSeekerCrawler
+            and type(rule).crawl is BaseRule.crawl
+        ):
+            state_idxs.append(len(results))
+            results.append(None)
+            states.append(
+                _RuleCrawlState(
+                    rule,
+                    RuleContext(
+                        dialect=dialect,
+                        fix=fix,
+                        templated_file=templated_file,
+                        path=pathlib.Path(fname) if fname else None,
+                        segment=tree,
+                        config=config,
+                    ),
+                )
+            )
+        else:
+            vs, _, fixes, _ = rule.crawl(
+                tree,
+                dialect=dialect,
+                fix=fix,
+                templated_file=templated_file,
+                ignore_mask=ignore_mask,
+                fname=fname,
+                config=config,
+            )
+            results.append((vs, fixes))
+
+    # Index the rules (by their position in `states`) by the types they seek.
+    type_index: Dict[str, List[int]] = {}
+    for idx, state in enumerate(states):
+        for seg_type in state.crawler.types:
+            type_index.setdefault(seg_type, []).append(idx)
+    # All of the raw segments so far in the file.
+    raw_stack: Tuple[RawSegment, ...] = ()
+
+    def _crawl(
+        segment: BaseSegment,
+        parent_stack: Tuple[BaseSegment, ...],
+        segment_idx: int,
+        active: List[int],
+    ) -> None:
+        nonlocal raw_stack
+        # Which rules consider this segment (and its children) at all?
+        if segment.is_type("unparsable"):
+            active = [idx for idx in active if states[idx].crawler.works_on_unparsable]
+
+        # Evaluate the rules which match the segment itself, in order.
+        if active:
+            matched = {
+                idx
+                for seg_type in segment.class_types
+                for idx in type_index.get(seg_type, ())
+            }
+            for idx in active:
+                state = states[idx]
+                if idx not in matched or state.crashed:
+                    continue
+                context = state.context
+                context.segment = segment
+                context.parent_stack = parent_stack
+                context.segment_idx = segment_idx
+                if state.crawler.provide_raw_stack:
+                    context.raw_stack = raw_stack
+                state.memory, state.crashed = state.rule._eval_context(
+                    context,
+                    state.memory,
+                    templated_file,
+                    ignore_mask,
+                    tree,
+                    state.vs,
+                    state.fixes,
+                )
+
+        if not segment.segments:
+            raw_stack += (cast(RawSegment, segment),)
+            return
+
+        # Only look further for the rules which seek types within this segment.
+        active = [
+            idx
+            for idx in active
+            if not states[idx].crashed
+            and states[idx].crawler.types & segment.descendant_type_set
+        ]
+        if not active:
+            raw_stack += tuple(segment.raw_segments)
+            return
+
+        new_parent_stack = parent_stack + (segment,)
+        for idx, child in enumerate(segment.segments):
+            _crawl(child, new_parent_stack, idx, active)
+
+    if states:
+        _crawl(tree, (), 0, list(range(len(states))))
+    for idx, state in zip(state_idxs, states):
+        results[idx] = (state.vs, state.fixes)
+    return cast(List[Tuple[List[SQLLintError], List[LintFix]]], results)
+
+
 class RuleSet:
     """Class to define a ruleset.
 
@@ -988,6 +1161,37 @@ class RuleSet:
         # Make sure we actually return the original class
         return cls
 
+    def register_lazy(self, code: str, manifest_entry: Dict[str, Any]):
+        """Register a rule from its manifest entry, without importing it.
+
+        The manifest entry (see
+        :func:`~sqlfluff.core.rules.loader.get_rule_manifest_from_path`)
+        provides everything needed for filtering, and the rule class
+        itself is only imported if the rule is selected by
+        :meth:`get_rulelist`.
+        """
+        if code in self._register:  # pragma: no cover
+            raise ValueError(
+                "Rule {!r} has already been registered on RuleSet {!r}!".format(
+                    code, self.name
+                )
+            )
+        self._register[code] = dict(
+            code=code,
+            description=manifest_entry["description"],
+            groups=tuple(manifest_entry["groups"]),
+            cls=None,
+            module=manifest_entry["module"],
+            name=manifest_entry["name"],
+        )
+
+    def _get_rule_class(self, code: str) -> Type[BaseRule]:
+        """Get the class of a registered rule, importing it if necessary."""
+        rule_dict = self._register[code]
+        if rule_dict["cls"] is None:
+            rule_dict["cls"] = load_rule_class(rule_dict["module"], rule_dict["name"])
+        return rule_dict["cls"]
+
     def _expand_config_rule_group_list(
         self, rule_list: List[str], valid_groups: Set[str]
     ) -> List[str]:
@@ -1105,7 +1309,7 @@ class RuleSet:
             rule_kwargs[k] = kwargs
 
         # Instantiate in the final step
-        return [self._register[k]["cls"](**rule_kwargs[k]) for k in keylist]
+        return [self._get_rule_class(k)(**rule_kwargs[k]) for k in keylist]
 
     def copy(self):
         """Return a copy of self with a separate register."""
@@ -1,8 +1,13 @@
 """Methods to load rules."""
 
+import json
 import os
 from importlib import import_module
 from glob import glob
+from typing import Any, Dict, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.rules.base import BaseRule
 
 
 def get_rules_from_path(
@@ -37,3 +42,51 @@ def get_rules_from_path(
         rules.append(rule_class)
 
     return rules
+
+
+# The manifest of the standard rules, which is generated from the rules
+# themselves by `python test/generate_rule_manifest.py`.
+STANDARD_RULE_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "manifest.json")
+
+
+def get_rule_manifest_from_path(**kwargs) -> Dict[str, Dict[str, Any]]:
+    """Build a manifest of the Rule classes in a path.
+
+    The manifest holds the code, module, class name, description, groups
+    and config keywords of each rule, which is everything needed to
+    register them without importing them. Any kwargs are passed to
+    :func:`get_rules_from_path`.
+    """
+    # NB: Import here to avoid a circular import.
+    from sqlfluff.core.rules.base import RuleSet
+
+    # Registering the rules validates them, and derives their codes and
+    # descriptions in the same way as when they're registered for use.
+    rule_set = RuleSet(name="manifest", config_info={})
+    for rule_class in get_rules_from_path(**kwargs):
+        rule_set.register(rule_class)
+
+    manifest = {}
+    for code, rule_dict in rule_set._register.items():
+        rule_class = rule_dict["cls"]
+        manifest[code] = {
+            "module": rule_class.__module__,
+            "name": rule_class.__name__,
+            "description": rule_dict["description"],
+            "groups": list(rule_dict["groups"]),
+            "config_keywords": list(getattr(rule_class, "config_keywords", [])),
+        }
+    return manifest
+
+
+def load_rule_manifest(
+    manifest_path: str = STANDARD_RULE_MANIFEST_PATH,
+) -> Dict[str, Dict[str, Any]]:
+    """Load a manifest of rules written by :func:`get_rule_manifest_from_path`."""
+    with open(manifest_path, encoding="utf8") as manifest_file:
+        return json.load(manifest_file)
+
+
+def load_rule_class(module: str, name: str) -> Type["BaseRule"]:
+    """Import a single Rule class, given its module and class name."""
+    return getattr(import_module(module), name)
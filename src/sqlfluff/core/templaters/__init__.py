@@ -1,18 +1,53 @@
-"""Templater Code."""
+"""Templater Code.
+
+Note that the jinja, python and placeholder templaters are only imported
+as needed at runtime, because jinja in particular is slow to import and
+isn't needed by the raw templater. They can still be imported from here
+as before, and are loaded on first access.
+"""
+
+from importlib import import_module
+from typing import Any, Iterator, Type
 
 from sqlfluff.core.templaters.base import TemplatedFile
 
 # Although these shouldn't usually be instantiated from here
 # we import them to make sure they get registered.
 from sqlfluff.core.templaters.base import RawTemplater, RawFileSlice
-from sqlfluff.core.templaters.jinja import JinjaTemplater
-from sqlfluff.core.templaters.python import PythonTemplater
-from sqlfluff.core.templaters.placeholder import PlaceholderTemplater
+
+_templater_lookup = {
+    "raw": ("base", "RawTemplater"),
+    "jinja": ("jinja", "JinjaTemplater"),
+    "python": ("python", "PythonTemplater"),
+    "placeholder": ("placeholder", "PlaceholderTemplater"),
+}
+
+
+def load_core_templater(name: str) -> Type[RawTemplater]:
+    """Dynamically load a core templater by name."""
+    module_name, class_name = _templater_lookup[name]
+    module = import_module(f"sqlfluff.core.templaters.{module_name}")
+    return getattr(module, class_name)
 
 
-def core_templaters():
+def core_templater_names() -> Iterator[str]:
+    """Returns the names of the core templaters, without loading them."""
+    yield from _templater_lookup
+
+
+def core_templaters() -> Iterator[Type[RawTemplater]]:
     """Returns the templater tuples for the core templaters."""
-    yield from [RawTemplater, JinjaTemplater, PythonTemplater, PlaceholderTemplater]
+    yield from (load_core_templater(name) for name in _templater_lookup)
+
+
+def __getattr__(name: str) -> Any:
+    """Load the core templaters on first access."""
+    for module_name, class_name in _templater_lookup.values():
+        if name == class_name:
+            return getattr(
+                import_module(f"sqlfluff.core.templaters.{module_name}"), class_name
+            )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = (
@@ -1,7 +1,7 @@
 """Defines the templaters."""
 
 import logging
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
 from typing import Dict, Iterator, List, Tuple, Optional, NamedTuple, Iterable
 from sqlfluff.core.config import FluffConfig
 
@@ -145,6 +145,16 @@ class TemplatedFile:
         # Precalculate newlines, character positions.
         self._source_newlines = list(iter_indices_of_newlines(self.source_str))
         self._templated_newlines = list(iter_indices_of_newlines(self.templated_str))
+        # Precalculate the positions of each slice, so that they can be
+        # looked up by bisection. Slices are contiguous, so each of these
+        # lists is sorted.
+        self._templated_slice_starts = [
+            tfs.templated_slice.start for tfs in self.sliced_file
+        ]
+        self._templated_slice_stops = [
+            tfs.templated_slice.stop for tfs in self.sliced_file
+        ]
+        self._raw_slice_source_idxs = [rfs.source_idx for rfs in self.raw_sliced]
 
         # NOTE: The "check_consistency" flag should always be True when using
         # SQLFluff in real life. This flag was only added because some legacy
@@ -245,23 +255,16 @@ class TemplatedFile:
 
         NB: the last_idx is exclusive, as the intent is to use this as a slice.
         """
-        start_idx = start_idx or 0
-        first_idx = None
-        last_idx = start_idx
-        for idx, elem in enumerate(self.sliced_file[start_idx:]):
-            last_idx = idx + start_idx
-            if elem[2].stop >= templated_pos:
-                if first_idx is None:
-                    first_idx = idx + start_idx
-                if elem[2].start > templated_pos:
-                    break
-                elif not inclusive and elem[2].start >= templated_pos:
-                    break
-        # If we got to the end add another index
-        else:
-            last_idx += 1
-        if first_idx is None:  # pragma: no cover
+        # The first slice which stops at or after the position.
+        first_idx = bisect_left(
+            self._templated_slice_stops, templated_pos, start_idx or 0
+        )
+        if first_idx >= len(self.sliced_file):  # pragma: no cover
             raise ValueError("Position Not Found")
+        # The first slice (from there) which starts after the position,
+        # or at it if we're not inclusive.
+        bisect = bisect_right if inclusive else bisect_left
+        last_idx = bisect(self._templated_slice_starts, templated_pos, first_idx)
         return first_idx, last_idx
 
     def raw_slices_spanning_source_slice(
@@ -272,24 +275,18 @@ class TemplatedFile:
         last_raw_slice = self.raw_sliced[-1]
         if source_slice.start >= last_raw_slice.source_idx + len(last_raw_slice.raw):
             return []
-        # First find the start index
-        raw_slice_idx = 0
-        # Move the raw pointer forward to the start of this patch
-        while (
-            raw_slice_idx + 1 < len(self.raw_sliced)
-            and self.raw_sliced[raw_slice_idx + 1].source_idx <= source_slice.start
-        ):
-            raw_slice_idx += 1
-        # Find slice index of the end of this patch.
-        slice_span = 1
-        while (
-            raw_slice_idx + slice_span < len(self.raw_sliced)
-            and self.raw_sliced[raw_slice_idx + slice_span].source_idx
-            < source_slice.stop
-        ):
-            slice_span += 1
+        # First find the start index, the last slice starting at or before
+        # the start of this patch.
+        raw_slice_idx = max(
+            bisect_right(self._raw_slice_source_idxs, source_slice.start) - 1, 0
+        )
+        # Find slice index of the end of this patch, the first slice (after
+        # the start) which starts at or after its end.
+        stop_idx = bisect_left(
+            self._raw_slice_source_idxs, source_slice.stop, raw_slice_idx + 1
+        )
         # Return the raw slices:
-        return self.raw_sliced[raw_slice_idx : raw_slice_idx + slice_span]
+        return self.raw_sliced[raw_slice_idx : max(stop_idx, raw_slice_idx + 1)]
 
     def templated_slice_to_source_slice(
         self,
@@ -349,11 +346,11 @@ class TemplatedFile:
 
         # Update starting position based on insertion point:
         if insertion_point >= 0:
-            for elem in self.sliced_file[ts_start_sf_start:]:
-                if elem[1].start != insertion_point:
-                    ts_start_sf_start += 1
-                else:
-                    break
+            while (
+                ts_start_sf_start < len(self.sliced_file)
+                and self.sliced_file[ts_start_sf_start][1].start != insertion_point
+            ):
+                ts_start_sf_start += 1
 
         subslices = self.sliced_file[
             # Very inclusive slice
@@ -416,20 +413,16 @@ class TemplatedFile:
         # Zero length slice. It's a literal, because it's definitely not templated.
         if source_slice.start == source_slice.stop:
             return True
-        is_literal = True
-        for raw_slice in self.raw_sliced:
-            # Reset if we find a literal and we're up to the start
-            # otherwise set false.
-            if raw_slice.source_idx <= source_slice.start:
-                is_literal = raw_slice.slice_type == "literal"
-            elif raw_slice.source_idx >= source_slice.stop:
-                # We've gone past the end. Break and Return.
-                break
-            else:
-                # We're in the middle. Check type
-                if raw_slice.slice_type != "literal":
-                    is_literal = False
-        return is_literal
+        # It's literal if the raw slice it starts in is, and so are any
+        # others which start within it.
+        start_idx = bisect_right(self._raw_slice_source_idxs, source_slice.start)
+        stop_idx = bisect_left(
+            self._raw_slice_source_idxs, source_slice.stop, start_idx
+        )
+        return all(
+            raw_slice.slice_type == "literal"
+            for raw_slice in self.raw_sliced[max(start_idx - 1, 0) : stop_idx]
+        )
 
     def source_only_slices(self) -> List[RawFileSlice]:
         """Return a list a slices which reference the parts only in the source.
@@ -2,12 +2,16 @@
 import logging
 import os.path
 import pkgutil
+import weakref
 from functools import reduce
-from typing import Callable, Dict, Generator, List, Optional, Tuple
+from types import CodeType
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
+import appdirs
 import jinja2.nodes
 from jinja2 import (
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     TemplateError,
     TemplateSyntaxError,
@@ -32,6 +36,20 @@ from sqlfluff.core.templaters.slicers.tracer import JinjaAnalyzer
 # Instantiate the templater logger
 templater_logger = logging.getLogger("sqlfluff.templater")
 
+# Jinja environments, keyed by the config which affects them. Environments
+# are safe to share, and sharing them means templates loaded from the macro
+# path are only compiled once per process.
+_jinja_env_cache: Dict[Tuple, Environment] = {}
+# Compiled macro code for each environment, keyed by the path, modification
+# time and size of each macro file (or by the source of macros defined in
+# config), so that a library of macros is only compiled once per process.
+_macro_code_cache: "weakref.WeakKeyDictionary[Environment, Dict[Any, CodeType]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Loaded library modules, keyed by the library path and the modification
+# times and sizes of its python files.
+_library_cache: Dict[Tuple, Dict[str, Any]] = {}
+
 
 class JinjaTemplater(PythonTemplater):
     """A templater using the jinja2 library.
@@ -47,16 +65,64 @@ class JinjaTemplater(PythonTemplater):
         pass
 
     @staticmethod
-    def _extract_macros_from_template(template, env, ctx):
+    def _compile_macros(
+        env: Environment,
+        key: Any,
+        get_source: Callable[[], str],
+        name: str,
+        filename: Optional[str] = None,
+    ) -> CodeType:
+        """Compile a template of macros, reusing any previous compilation.
+
+        Code is cached in memory under `key`, which must change whenever
+        the source does. If the environment has a bytecode cache (i.e.
+        caching is enabled in config), that is checked before compiling,
+        so unchanged macros are also reused between runs.
+        """
+        code_cache = _macro_code_cache.setdefault(env, {})
+        code = code_cache.get(key)
+        if code is None:
+            source = get_source()
+            bucket = None
+            if env.bytecode_cache:
+                bucket = env.bytecode_cache.get_bucket(env, name, filename, source)
+                code = bucket.code
+            if code is None:
+                code = env.compile(source, filename=filename)
+                if bucket:
+                    bucket.code = code
+                    env.bytecode_cache.set_bucket(bucket)
+            code_cache[key] = code
+        return code
+
+    @classmethod
+    def _extract_macros_from_template(
+        cls, template, env, ctx, key=None, name="<macros>", filename=None
+    ):
         """Take a template string and extract any macros from it.
 
         Lovingly inspired by http://codyaray.com/2015/05/auto-load-jinja2-macros
+
+        The template may be a callable which returns the string, so that it
+        is only read if it hasn't already been compiled under `key`.
         """
         from jinja2.runtime import Macro  # noqa
 
-        # Iterate through keys exported from the loaded template string
+        get_source = template if callable(template) else lambda: template
+        code = cls._compile_macros(
+            env,
+            key if key is not None else get_source(),
+            get_source,
+            name=name,
+            filename=filename,
+        )
+        # Iterate through keys exported from the loaded template string.
+        # NB: The template is instantiated for each file, as the macros
+        # hold a reference to the context they were loaded with.
         context = {}
-        macro_template = env.from_string(template, globals=ctx)
+        macro_template = env.template_class.from_code(
+            env, code, env.make_globals(ctx), None
+        )
         # This is kind of low level and hacky but it works
         try:
             for k in macro_template.module.__dict__:
@@ -82,13 +148,26 @@ class JinjaTemplater(PythonTemplater):
                 raise ValueError(f"Path does not exist: {path_entry}")
 
             if os.path.isfile(path_entry):
-                # It's a file. Extract macros from it.
-                with open(path_entry) as opened_file:
-                    template = opened_file.read()
+                # It's a file. Extract macros from it, only reading it if
+                # it's changed since it was last compiled.
+                stat = os.stat(path_entry)
+                abs_path = os.path.abspath(path_entry)
+
+                def read_template(path_entry=path_entry):
+                    with open(path_entry) as opened_file:
+                        return opened_file.read()
+
                 # Update the context with macros from the file.
                 try:
                     macro_ctx.update(
-                        cls._extract_macros_from_template(template, env=env, ctx=ctx)
+                        cls._extract_macros_from_template(
+                            read_template,
+                            env=env,
+                            ctx=ctx,
+                            key=(abs_path, stat.st_mtime_ns, stat.st_size),
+                            name=abs_path,
+                            filename=abs_path,
+                        )
                     )
                 except TemplateSyntaxError as err:
                     raise SQLTemplaterError(
@@ -121,12 +200,27 @@ class JinjaTemplater(PythonTemplater):
 
         # Iterate to load macros
         macro_ctx = {}
-        for value in loaded_context.values():
+        for name, value in loaded_context.items():
             macro_ctx.update(
-                self._extract_macros_from_template(value, env=env, ctx=ctx)
+                self._extract_macros_from_template(
+                    value, env=env, ctx=ctx, name=f"<config macro {name}>"
+                )
             )
         return macro_ctx
 
+    @staticmethod
+    def _library_stamp(library_path: str) -> Tuple:
+        """The modification times and sizes of the python files in a library."""
+        stamp = []
+        for dirpath, _, files in os.walk(library_path):
+            for fname in files:
+                if fname.endswith(".py"):
+                    file_stat = os.stat(os.path.join(dirpath, fname))
+                    stamp.append(
+                        (dirpath, fname, file_stat.st_mtime_ns, file_stat.st_size)
+                    )
+        return tuple(sorted(stamp))
+
     def _extract_libraries_from_config(self, config):
         library_path = config.get_section(
             (self.templater_selector, self.name, "library_path")
@@ -134,6 +228,14 @@ class JinjaTemplater(PythonTemplater):
         if not library_path:
             return {}
 
+        # Only load the library again if it has changed.
+        cache_key = (
+            os.path.abspath(library_path),
+            self._library_stamp(library_path),
+        )
+        if cache_key in _library_cache:
+            return dict(_library_cache[cache_key])
+
         libraries = JinjaTemplater.Libraries()
 
         # If library_path has __init__.py we parse it as one module, else we parse it
@@ -174,7 +276,9 @@ class JinjaTemplater(PythonTemplater):
             libraries = getattr(libraries, library_module_name)
 
         # remove magic methods from result
-        return {k: v for k, v in libraries.__dict__.items() if not k.startswith("__")}
+        result = {k: v for k, v in libraries.__dict__.items() if not k.startswith("__")}
+        _library_cache[cache_key] = result
+        return dict(result)
 
     @staticmethod
     def _generate_dbt_builtins():
@@ -231,11 +335,46 @@ class JinjaTemplater(PythonTemplater):
                 line_pos=pos,
             )
 
+    @staticmethod
+    def _get_bytecode_cache_dir(config) -> Optional[str]:
+        """Where to persist compiled templates, if caching is enabled."""
+        if not config or not config.get("cache"):
+            return None
+        cache_dir = config.get("cache_dir")
+        if cache_dir:
+            return os.path.join(cache_dir, "jinja")
+        return os.path.join(appdirs.user_cache_dir("sqlfluff", "sqlfluff"), "jinja")
+
     def _get_jinja_env(self, config=None):
-        """Get a properly configured jinja environment."""
-        # We explicitly want to preserve newlines.
+        """Get a properly configured jinja environment.
+
+        Environments are reused for any config with the same macro path,
+        templating ignores and cache directory.
+        """
         macros_path = self._get_macros_path(config)
-        ignore_templating = config and "templating" in config.get("ignore")
+        ignore_templating = bool(config and "templating" in config.get("ignore"))
+        bytecode_cache_dir = self._get_bytecode_cache_dir(config)
+        cache_key = (
+            type(self),
+            tuple(macros_path or ()),
+            ignore_templating,
+            bytecode_cache_dir,
+        )
+        env = _jinja_env_cache.get(cache_key)
+        if env is None:
+            env = self._make_jinja_env(
+                macros_path, ignore_templating, bytecode_cache_dir
+            )
+            _jinja_env_cache[cache_key] = env
+        return env
+
+    @staticmethod
+    def _make_jinja_env(
+        macros_path: Optional[List[str]],
+        ignore_templating: bool,
+        bytecode_cache_dir: Optional[str],
+    ) -> Environment:
+        """Create a jinja environment."""
         if ignore_templating:
 
             class SafeFileSystemLoader(FileSystemLoader):
@@ -260,12 +399,26 @@ class JinjaTemplater(PythonTemplater):
         else:
             loader = FileSystemLoader(macros_path) if macros_path else None
 
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            try:
+                os.makedirs(bytecode_cache_dir, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+            except OSError as err:  # pragma: no cover
+                templater_logger.warning(
+                    "Unable to use jinja bytecode cache %s: %s",
+                    bytecode_cache_dir,
+                    err,
+                )
+
         return SandboxedEnvironment(
+            # We explicitly want to preserve newlines.
             keep_trailing_newline=True,
             # The do extension allows the "do" directive
             autoescape=False,
             extensions=["jinja2.ext.do"],
             loader=loader,
+            bytecode_cache=bytecode_cache,
         )
 
     def _get_macros_path(self, config: FluffConfig) -> Optional[List[str]]:
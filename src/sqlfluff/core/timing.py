@@ -1,40 +1,63 @@
 """Timing summary class."""
 
 from typing import Optional, List, Dict
-from collections import defaultdict
 
 
 class TimingSummary:
-    """An object for tracking the timing of similar steps across many files."""
+    """An object for tracking the timing of similar steps across many files.
+
+    Only running totals are kept for each step, rather than every
+    timing, so the memory used doesn't grow with the number of files.
+    """
 
     def __init__(self, steps: Optional[List[str]] = None):
         self.steps = steps
-        self._timings: List[Dict[str, float]] = []
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def _add_totals(self, step: str, totals: Dict[str, float]):
+        """Combine the totals for a step with any existing ones."""
+        existing = self._totals.get(step)
+        if not existing:
+            self._totals[step] = dict(totals)
+            return
+        existing["cnt"] += totals["cnt"]
+        existing["sum"] += totals["sum"]
+        existing["min"] = min(existing["min"], totals["min"])
+        existing["max"] = max(existing["max"], totals["max"])
 
     def add(self, timing_dict: Dict[str, float]):
         """Add a timing dictionary to the summary."""
-        self._timings.append(timing_dict)
         if not self.steps:
             self.steps = list(timing_dict.keys())
+        for step in self.steps:
+            if step in timing_dict:
+                val = timing_dict[step]
+                self._add_totals(step, {"cnt": 1, "sum": val, "min": val, "max": val})
+
+    def merge(self, other: "TimingSummary"):
+        """Add the timings from another summary to this one."""
+        if not other.steps:
+            return
+        if not self.steps:
+            self.steps = list(other.steps)
+        for step in self.steps:
+            if step in other._totals:
+                self._add_totals(step, other._totals[step])
 
     def summary(self) -> Dict[str, Dict[str, float]]:
         """Generate a summary for display."""
-        vals: Dict[str, List[float]] = defaultdict(list)
         if not self.steps:  # pragma: no cover
             return {}
 
-        for timing_dict in self._timings:
-            for step in self.steps:
-                if step in timing_dict:
-                    vals[step].append(timing_dict[step])
         summary = {}
         for step in self.steps:
-            if vals[step]:
+            if step in self._totals:
+                totals = self._totals[step]
                 summary[step] = {
-                    "cnt": len(vals[step]),
-                    "sum": sum(vals[step]),
-                    "min": min(vals[step]),
-                    "max": max(vals[step]),
-                    "avg": sum(vals[step]) / len(vals[step]),
+                    "cnt": totals["cnt"],
+                    "sum": totals["sum"],
+                    "min": totals["min"],
+                    "max": totals["max"],
+                    "avg": totals["sum"] / totals["cnt"],
                 }
         return summary
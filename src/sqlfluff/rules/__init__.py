@@ -1,20 +1,40 @@
 """Standard Rules packaged with sqlfluff."""
 
+from typing import Any, Dict, Optional
 
 from sqlfluff.core.plugin.host import get_plugin_manager
 
-# Sphinx effectively runs an import * from this module in rules.rst, so initialise
-# __all__ with an empty list before we populate it with the rule names.
-__all__ = []
-
-# Iterate through the rules list and register each rule as a global for documentation
-for plugin_rules in get_plugin_manager().hook.get_rules():
-    for rule in plugin_rules:
-        # Add the Rule classes to the module namespace with globals() so that they can
-        # be found by Sphinx automodule documentation in rules.rst
-        # The result is the same as declaring the classes in this file.
-        # Rules coming from the "Example" plugin are excluded from the
-        # documentation.
-        globals()[rule.__name__] = rule
-        # Add the rule class names to __all__ for Sphinx automodule discovery
-        __all__.append(rule.__name__)
+_rule_classes: Optional[Dict[str, Any]] = None
+
+
+def _get_rule_classes() -> Dict[str, Any]:
+    """Fetch the rule classes from all plugins, loading them on first use.
+
+    NOTE: This isn't done on import, because each rule module is a
+    submodule of this package, so importing any one of them would
+    otherwise import all of them.
+    """
+    global _rule_classes
+    if _rule_classes is None:
+        _rule_classes = {
+            rule.__name__: rule
+            for plugin_rules in get_plugin_manager().hook.get_rules()
+            for rule in plugin_rules
+        }
+    return _rule_classes
+
+
+def __getattr__(name: str) -> Any:
+    """Expose the Rule classes in the module namespace.
+
+    This allows them to be found by Sphinx automodule documentation in
+    rules.rst, which effectively runs an import * from this module. The
+    result is the same as declaring the classes in this file, with
+    `__all__` holding the rule class names.
+    """
+    if name == "__all__":
+        return list(_get_rule_classes())
+    try:
+        return _get_rule_classes()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -537,6 +537,28 @@ def test__cli__command_lint_skip_ignore_files():
     assert "L009" in result.output.strip()
 
 
+def test__cli__command_lint_cache(tmpdir):
+    """Check a cached lint run gives the same output as an uncached one."""
+    args = [
+        lint,
+        [
+            "--disable-progress-bar",
+            "--cache-dir",
+            str(tmpdir),
+            "test/fixtures/linter/indentation_error_simple.sql",
+        ],
+    ]
+    first = invoke_assert_code(ret_code=1, args=args)
+    assert tmpdir.listdir()
+    second = invoke_assert_code(ret_code=1, args=args)
+    assert second.output == first.output
+    assert first.output.replace("\\", "/").startswith(expected_output)
+    # With the cache disabled we shouldn't touch it.
+    tmpdir.remove()
+    invoke_assert_code(ret_code=1, args=[lint, args[1] + ["--no-cache"]])
+    assert not tmpdir.exists()
+
+
 def test__cli__command_lint_ignore_local_config():
     """Test that --ignore-local_config ignores .sqlfluff file as expected."""
     runner = CliRunner()
@@ -631,6 +653,16 @@ def test__cli__command_dialects():
     invoke_assert_code(args=[dialects])
 
 
+def test__cli__command_dialects_warm(tmp_path):
+    """Check dialects --warm stores a snapshot for each dialect."""
+    with patch(
+        "sqlfluff.core.dialects.dialect_snapshot_dir", return_value=str(tmp_path)
+    ):
+        result = invoke_assert_code(args=[dialects, ["--warm"]])
+    assert f"Stored dialect snapshot: {tmp_path / 'ansi.pickle'}" in result.output
+    assert "tsql.pickle" in os.listdir(tmp_path)
+
+
 def generic_roundtrip_test(
     source_file,
     rulestring,
@@ -1479,6 +1511,41 @@ def test__cli__command_lint_serialize_github_annotation_native():
     )
 
 
+@pytest.mark.parametrize("serialize", ["json-lines", "github-annotation-native"])
+def test__cli__command_lint_stream(serialize):
+    """Streamed output matches the output written at the end."""
+    cmd_args = (
+        "test/fixtures/linter/multiple_files",
+        "test/fixtures/linter/identifier_capitalisation.sql",
+        "--format",
+        serialize,
+        "--disable-progress-bar",
+    )
+    batch = invoke_assert_code(args=[lint, cmd_args], ret_code=1)
+    stream = invoke_assert_code(args=[lint, cmd_args + ("--stream",)], ret_code=1)
+    batch_lines = [line for line in batch.output.split("\n") if line]
+    stream_lines = [line for line in stream.output.split("\n") if line]
+    assert sorted(stream_lines) == sorted(batch_lines)
+    if serialize == "json-lines":
+        # Only files with violations produce a record.
+        records = [json.loads(line) for line in stream_lines]
+        assert [record["filepath"] for record in records] == [
+            os.path.normpath("test/fixtures/linter/identifier_capitalisation.sql")
+        ]
+
+
+def test__cli__command_lint_stream_unsupported_format():
+    """Formats which need every result at the end can't be streamed."""
+    result = invoke_assert_code(
+        args=[
+            lint,
+            ("test/fixtures/linter/comma_errors.sql", "--format", "json", "--stream"),
+        ],
+        ret_code=2,
+    )
+    assert "--stream is only supported" in result.output
+
+
 @pytest.mark.parametrize("serialize", ["github-annotation", "github-annotation-native"])
 def test__cli__command_lint_serialize_annotation_level_error_failure_equivalent(
     serialize,
@@ -0,0 +1,99 @@
+"""Tests for finding the files changed in a git repository."""
+
+import json
+import os
+import subprocess
+
+import pytest
+
+from sqlfluff.cli.commands import lint
+from sqlfluff.cli.git import changed_line_ranges
+from sqlfluff.core import SQLFluffUserError
+from sqlfluff.utils.testing.cli import invoke_assert_code
+
+
+def _git(*args):
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            *args,
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """A git repo with a committed, a modified and an untracked file."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".sqlfluff").write_text("[sqlfluff]\ndialect = ansi\n")
+    (tmp_path / "unchanged.sql").write_text("select a from b\n")
+    (tmp_path / "modified.sql").write_text("SELECT a\nFROM b\nWHERE c\n")
+    _git("init", "-q")
+    _git("add", ".")
+    _git("commit", "-q", "-m", "Initial commit")
+    _git("branch", "base")
+    # Change the first line, and add a new last one.
+    (tmp_path / "modified.sql").write_text("select a\nFROM b\nWHERE c\nAND d\n")
+    (tmp_path / "untracked.sql").write_text("SELECT a from b\n")
+    return tmp_path
+
+
+def test__cli__git__changed_line_ranges(git_repo):
+    """Modified files have their changed lines, untracked ones are all new."""
+    changed = changed_line_ranges("base")
+    assert changed == {
+        os.path.normpath(str(git_repo.resolve() / "modified.sql")): [
+            (1, 1),
+            (4, 4),
+        ],
+        os.path.normpath(str(git_repo.resolve() / "untracked.sql")): None,
+    }
+
+
+def test__cli__git__changed_line_ranges_bad_ref(git_repo):
+    """An unknown ref is a user error."""
+    with pytest.raises(SQLFluffUserError, match="merge-base"):
+        changed_line_ranges("not-a-ref")
+
+
+def test__cli__command_lint_changed_since(git_repo):
+    """Only the changed files, or lines, are linted."""
+    args = [".", "--rules", "L010", "--format", "json"]
+    result = invoke_assert_code(
+        args=[lint, args + ["--changed-since", "base"]], ret_code=1
+    )
+    files = {
+        os.path.basename(record["filepath"]): [
+            violation["line_no"] for violation in record["violations"]
+        ]
+        for record in json.loads(result.output)
+    }
+    assert files == {"modified.sql": [2, 3, 4], "untracked.sql": [1]}
+
+    result = invoke_assert_code(
+        args=[lint, args + ["--changed-since", "base", "--changed-lines-only"]],
+        ret_code=1,
+    )
+    files = {
+        os.path.basename(record["filepath"]): [
+            violation["line_no"] for violation in record["violations"]
+        ]
+        for record in json.loads(result.output)
+    }
+    assert files == {"modified.sql": [4], "untracked.sql": [1]}
+
+
+def test__cli__command_lint_changed_lines_only_requires_ref():
+    """--changed-lines-only does nothing without --changed-since."""
+    result = invoke_assert_code(
+        args=[lint, ["test/fixtures/linter/comma_errors.sql", "--changed-lines-only"]],
+        ret_code=2,
+    )
+    assert "--changed-lines-only requires --changed-since" in result.output
@@ -0,0 +1,90 @@
+"""Tests for the persistent lint server and its client."""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from sqlfluff.cli import EXIT_SUCCESS, EXIT_ERROR, EXIT_FAIL
+from sqlfluff.cli.client import main as client_main, send_request
+from sqlfluff.cli.server import LintServer
+from sqlfluff.core import FluffConfig, Linter
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Requires unix domain sockets."
+)
+
+
+@pytest.fixture
+def lint_server(tmp_path):
+    """Run a lint server in a thread, for the duration of a test."""
+    # NOTE: Unix socket paths have a short maximum length, so
+    # avoid deeply nested temporary directories.
+    socket_path = os.path.join(str(tmp_path), "s.sock")
+    server = LintServer(socket_path=socket_path, overrides={"dialect": "ansi"})
+    cwd = os.getcwd()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.05)
+    yield server
+    send_request({"command": "stop"}, socket_path)
+    thread.join(timeout=10)
+    # Handling requests changes directory, so change back.
+    os.chdir(cwd)
+
+
+def test__cli__server__lint_matches_linter(lint_server):
+    """The server returns the same records as linting directly."""
+    path = "test/fixtures/linter/indentation_errors.sql"
+    response = send_request(
+        {"command": "lint", "paths": [path], "cwd": os.getcwd()},
+        lint_server.socket_path,
+    )
+    expected = Linter(config=FluffConfig(overrides={"dialect": "ansi"})).lint_paths(
+        (path,)
+    )
+    assert response["records"] == expected.as_records()
+    assert response["exit_code"] == EXIT_FAIL
+
+
+def test__cli__server__config_invalidation(lint_server, tmp_path):
+    """Changes to config files are picked up by later requests."""
+    sql_path = tmp_path / "query.sql"
+    sql_path.write_text("SELECT a  +  b FROM tbl\n")
+    request = {"command": "lint", "paths": ["query.sql"], "cwd": str(tmp_path)}
+    response = send_request(request, lint_server.socket_path)
+    assert response["exit_code"] == EXIT_FAIL
+
+    (tmp_path / ".sqlfluff").write_text("[sqlfluff]\nexclude_rules = L006,L039\n")
+    response = send_request(request, lint_server.socket_path)
+    assert response["records"] == []
+    assert response["exit_code"] == EXIT_SUCCESS
+
+
+def test__cli__client(lint_server, capsys):
+    """The client prints violations and returns the exit code."""
+    ret = client_main(
+        [
+            "--socket",
+            lint_server.socket_path,
+            "--rules",
+            "L001",
+            "test/fixtures/linter/indentation_errors.sql",
+        ]
+    )
+    assert ret == EXIT_FAIL
+    out = capsys.readouterr().out
+    assert "== [test/fixtures/linter/indentation_errors.sql] FAIL" in out
+    assert "L:   4 | P:  24 | L001 |" in out
+
+
+def test__cli__client_no_server(tmp_path, capsys):
+    """The client explains how to start a server if none is running."""
+    ret = client_main(["--socket", str(tmp_path / "missing.sock"), "a.sql"])
+    assert ret == EXIT_ERROR
+    assert "sqlfluff serve" in capsys.readouterr().err
@@ -1,6 +1,7 @@
 """Tests for the configuration routines."""
 
 import os
+import pickle
 import sys
 
 from sqlfluff.core import config, Linter, FluffConfig
@@ -439,3 +440,39 @@ def test__config__validate_configs_precedence_same_file():
     assert len(res) == 1
     # Check that the old key isn't there.
     assert not any(k == old_key for k, _ in res)
+
+
+def test__config__pickle_and_make_child():
+    """Test that an unpickled config can still make child configs.
+
+    This is what happens when files are loaded in a worker process.
+    """
+    cfg = pickle.loads(pickle.dumps(FluffConfig(overrides={"dialect": "ansi"})))
+    child = cfg.make_child_from_path(os.path.join("test", "fixtures", "config"))
+    assert child.get("dialect") == "ansi"
+
+
+def test__config__make_child_cached(tmp_path):
+    """Child configs are shared by a directory until its config files change."""
+    (tmp_path / ".sqlfluff").write_text("[sqlfluff]\ndialect = bigquery\n")
+    cfg = FluffConfig(require_dialect=False)
+    child_a = cfg.make_child_from_path(str(tmp_path / "a.sql"))
+    child_b = cfg.make_child_from_path(str(tmp_path / "b.sql"))
+    assert child_a is child_b
+    assert child_a.get("dialect") == "bigquery"
+
+    # Copies can be changed without changing the shared child.
+    child_copy = child_a.copy()
+    child_copy.process_inline_config(
+        "-- sqlfluff:rules:L010:capitalisation_policy:lower"
+    )
+    assert child_copy.get("dialect_obj") is child_a.get("dialect_obj")
+    assert child_a.get("capitalisation_policy", ("rules", "L010")) != "lower"
+
+    # Changing a config file invalidates the cached child.
+    (tmp_path / ".sqlfluff").write_text("[sqlfluff]\ndialect = postgres\n")
+    stat = os.stat(tmp_path / ".sqlfluff")
+    os.utime(tmp_path / ".sqlfluff", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    child_c = cfg.make_child_from_path(str(tmp_path / "a.sql"))
+    assert child_c is not child_a
+    assert child_c.get("dialect") == "postgres"
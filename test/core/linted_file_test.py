@@ -3,6 +3,7 @@
 import pytest
 import logging
 
+from sqlfluff.core import Linter
 from sqlfluff.core.linter import LintedFile
 from sqlfluff.core.parser.markers import PositionMarker
 from sqlfluff.core.parser.segments import (
@@ -366,3 +367,29 @@ def test__linted_file__generate_source_patches(
     with caplog.at_level(logging.DEBUG, logger="sqlfluff.linter"):
         result = LintedFile._generate_source_patches(tree, templated_file)
     assert result == expected_result
+
+
+@pytest.mark.parametrize("fix", [False, True])
+def test__linted_file__compact(fix):
+    """Test that a compact LintedFile keeps what the linter needs."""
+    linted_file = (
+        Linter(dialect="ansi")
+        .lint_paths(("test/fixtures/linter/indentation_errors.sql",), fix=fix)
+        .paths[0]
+        .files[0]
+    )
+    compacted = linted_file.compact(fix=fix)
+    assert compacted.tree is None
+    assert all(
+        getattr(violation, "segment", None) is None
+        for violation in compacted.violations
+    )
+    assert compacted.check_tuples() == linted_file.check_tuples()
+    assert compacted.num_violations(fixable=True) == (
+        linted_file.num_violations(fixable=True) if fix else 0
+    )
+    if fix:
+        # Fixes can still be applied without the tree.
+        assert compacted.fix_string() == linted_file.fix_string()
+    else:
+        assert compacted.templated_file is None
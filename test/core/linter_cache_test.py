@@ -0,0 +1,118 @@
+"""Tests for the persistent lint result cache."""
+
+import os
+import time
+
+import pytest
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.errors import SQLLintError, SQLParseError
+from sqlfluff.core.linter.cache import LintCache
+
+
+@pytest.fixture
+def cache_linter(tmp_path):
+    """A linter with the cache enabled in a temporary directory."""
+    return Linter(
+        config=FluffConfig(
+            overrides={
+                "dialect": "ansi",
+                "cache": True,
+                "cache_dir": str(tmp_path / "cache"),
+            }
+        )
+    )
+
+
+def test__linter__cache_disabled_by_default():
+    """The cache should only be created if enabled in config."""
+    assert Linter(dialect="ansi").cache is None
+
+
+def test__linter__cache_key(cache_linter):
+    """Keys change with the content, config and rules."""
+    cache = cache_linter.cache
+    config = cache_linter.config
+    rules = cache_linter.get_ruleset()
+    key = cache.make_key("select 1\n", config, rules)
+    assert key == cache.make_key("select 1\n", config, rules)
+    assert key != cache.make_key("select 2\n", config, rules)
+    assert key != cache.make_key("select 1\n", config, rules[:1])
+    other_config = FluffConfig(
+        overrides={"dialect": "ansi", "cache": True, "max_line_length": 10}
+    )
+    assert key != cache.make_key("select 1\n", other_config, rules)
+    # Config which only changes the output doesn't change the key.
+    verbose_config = FluffConfig(
+        overrides={"dialect": "ansi", "cache": True, "verbose": 3}
+    )
+    assert key == cache.make_key(
+        "select 1\n", verbose_config, cache_linter.get_ruleset(verbose_config)
+    )
+    # Upgrading a plugin changes the key, even if the rule codes don't.
+    cache._plugin_versions += ",sqlfluff-plugin-example==2.0.0"
+    assert key != cache.make_key("select 1\n", config, rules)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test__linter__cache_roundtrip(cache_linter, processes):
+    """A second run should produce identical results from the cache."""
+    paths = ("test/fixtures/linter/indentation_errors.sql",)
+    # NB: Retain trees so that fresh results can be told apart from cached ones.
+    first = cache_linter.lint_paths(paths, processes=processes, retain_trees=True)
+    assert first.paths[0].files[0].tree is not None
+    second = cache_linter.lint_paths(paths, processes=processes, retain_trees=True)
+    linted_file = second.paths[0].files[0]
+    # The cached result has no tree, because we didn't parse it.
+    assert linted_file.tree is None
+    assert second.check_tuples() == first.check_tuples()
+    assert second.as_records() == first.as_records()
+    assert all(isinstance(v, SQLLintError) for v in linted_file.violations)
+
+
+def test__linter__cache_roundtrip_noqa_and_parse_errors(cache_linter, tmp_path):
+    """Noqa masks and non-linting errors should survive the cache."""
+    fpath = tmp_path / "test.sql"
+    fpath.write_text("select a from b -- noqa\nselect from where\n")
+    first = cache_linter.lint_paths((str(fpath),))
+    second = cache_linter.lint_paths((str(fpath),))
+    assert second.paths[0].files[0].tree is None
+    assert second.as_records() == first.as_records()
+    assert second.num_violations(types=SQLParseError) > 0
+    assert second.num_violations(types=SQLParseError) == first.num_violations(
+        types=SQLParseError
+    )
+    assert second.num_violations(
+        types=SQLParseError, filter_ignore=False
+    ) == first.num_violations(types=SQLParseError, filter_ignore=False)
+
+
+def test__linter__cache_fix_skips_fixable(cache_linter, tmp_path):
+    """When fixing, cached entries with fixable violations are not used."""
+    fpath = tmp_path / "test.sql"
+    fpath.write_text("SELECT a  FROM b\n")
+    cache_linter.lint_paths((str(fpath),))
+    result = cache_linter.lint_paths((str(fpath),), fix=True)
+    linted_file = result.paths[0].files[0]
+    assert linted_file.tree is not None
+    assert linted_file.num_violations(fixable=True) > 0
+
+
+def test__linter__cache_prune(tmp_path):
+    """Pruning should evict the least recently used entries."""
+    config = FluffConfig(overrides={"dialect": "ansi"})
+    linter = Linter(config=config)
+    cache = LintCache(str(tmp_path), max_entries=2)
+    linted = linter.lint_string("select 1\n")
+    keys = [cache.make_key(f"select {i}\n", config, []) for i in range(3)]
+    for idx, key in enumerate(keys):
+        cache.store(key, linted)
+        # Make sure modification times are distinct.
+        past = time.time() - 10 + idx
+        os.utime(cache._entry_path(key), (past, past))
+    # Reading the first key makes it the most recently used.
+    assert cache.load(keys[0], "<string>")
+    assert cache.prune() == 1
+    assert cache.load(keys[0], "<string>")
+    assert cache.load(keys[1], "<string>") is None
+    assert cache.load(keys[2], "<string>")
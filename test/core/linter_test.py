@@ -1,5 +1,6 @@
 """The Test file for the linter class."""
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import logging
 from typing import List
@@ -193,6 +194,36 @@ def test__linter__path_from_paths__ignore(path):
     }
 
 
+@pytest.mark.parametrize(
+    "ignore,walked,expected",
+    [
+        # Ignored directories aren't walked.
+        ("target/\n", {"models"}, {"models/a.sql"}),
+        # Unless a pattern could re-include files within them.
+        ("target/\n!target/keep.sql\n", {"models", "target"}, {"models/a.sql"}),
+    ],
+)
+def test__linter__path_from_paths__prune_ignored(tmp_path, ignore, walked, expected):
+    """Directories which are ignored entirely are skipped."""
+    for fpath in ("models/a.sql", "target/b.sql"):
+        (tmp_path / fpath).parent.mkdir(exist_ok=True)
+        (tmp_path / fpath).write_text("select 1\n")
+    (tmp_path / ".sqlfluffignore").write_text(ignore)
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(os.path.relpath(path, tmp_path))
+        return scandir(path)
+
+    with patch("os.scandir", recording_scandir):
+        paths = Linter().iter_paths_from_path(str(tmp_path), working_path=str(tmp_path))
+        assert {
+            os.path.relpath(fpath, tmp_path).replace(os.sep, "/") for fpath in paths
+        } == expected
+    assert set(scanned) == {"."} | walked
+
+
 @pytest.mark.parametrize(
     "path",
     [
@@ -221,6 +252,30 @@ def test__linter__get_violations_filter_rules(rules, num_violations):
     assert len(lint_result.get_violations(rules=rules)) == num_violations
 
 
+def test__linter__get_ruleset_reused():
+    """Rule sets are reused for configs which configure rules the same way."""
+    lntr = Linter(dialect="ansi")
+    rule_set = lntr.get_ruleset(
+        config=FluffConfig(overrides={"dialect": "ansi", "rules": "L010"})
+    )
+    same_rules = lntr.get_ruleset(
+        config=FluffConfig(overrides={"dialect": "bigquery", "rules": "L010"})
+    )
+    other_rules = lntr.get_ruleset(
+        config=FluffConfig(overrides={"dialect": "ansi", "rules": "L014"})
+    )
+    assert [rule.code for rule in rule_set] == ["L010"]
+    assert all(a is b for a, b in zip(rule_set, same_rules))
+    assert [rule.code for rule in other_rules] == ["L014"]
+    # Each thread gets its own rule instances.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        thread_rules = executor.submit(
+            lntr.get_ruleset,
+            FluffConfig(overrides={"dialect": "ansi", "rules": "L010"}),
+        ).result()
+    assert thread_rules[0] is not rule_set[0]
+
+
 def test__linter__linting_result__sum_dicts():
     """Test the summing of dictionaries in the linter."""
     lr = LintingResult()
@@ -335,6 +390,127 @@ def test_lint_path_parallel_wrapper_exception(patched_lint):
             result.reraise()
 
 
+def test__linter__parallel_renders_in_workers():
+    """Parallel runners leave loading and rendering to the workers."""
+    lint_runner = runner.MultiThreadRunner(
+        Linter(dialect="ansi"), FluffConfig(overrides={"dialect": "ansi"}), processes=1
+    )
+    fnames = [
+        "test/fixtures/linter/passing.sql",
+        "test/fixtures/linter/comma_errors.sql",
+    ]
+    with patch.object(Linter, "render_string") as patched_render:
+        partials = list(lint_runner.iter_partials(fnames))
+    patched_render.assert_not_called()
+    assert [fname for fname, _ in partials] == fnames
+    # Once called, each partial does the whole job.
+    linted_file = partials[1][1]()
+    assert linted_file.path == fnames[1]
+    assert linted_file.get_violations()
+
+
+@pytest.mark.parametrize("retain_trees", [False, True])
+def test__linter__parallel_retain_trees(retain_trees, monkeypatch):
+    """Parallel results only keep their trees when asked to."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    result = Linter(dialect="ansi").lint_paths(
+        ("test/fixtures/linter/comma_errors.sql",),
+        processes=2,
+        retain_trees=retain_trees,
+    )
+    assert (result.tree is not None) == retain_trees
+    assert (
+        result.check_tuples()
+        == Linter(dialect="ansi")
+        .lint_paths(("test/fixtures/linter/comma_errors.sql",))
+        .check_tuples()
+    )
+
+
+def test__linter__lint_paths_single_runner(monkeypatch):
+    """All the paths are linted by one runner, and grouped by path."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    paths = (
+        "test/fixtures/linter/multiple_files",
+        "test/fixtures/linter/comma_errors.sql",
+        "test/fixtures/linter/multiple_files/passing.1.sql",
+    )
+    with patch.object(
+        runner, "get_runner", wraps=runner.get_runner
+    ) as patched_get_runner:
+        result = Linter(dialect="ansi").lint_paths(paths, processes=2)
+    assert patched_get_runner.call_count == 1
+    assert [linted_dir.path for linted_dir in result.paths] == list(paths)
+    assert [
+        sorted(os.path.basename(file.path) for file in linted_dir.files)
+        for linted_dir in result.paths
+    ] == [
+        ["passing.1.sql", "passing.2.sql", "passing.3.sql"],
+        ["comma_errors.sql"],
+        ["passing.1.sql"],
+    ]
+
+
+def test__linter__parallel_largest_first():
+    """Parallel runners start with the largest files."""
+    fnames = [
+        "test/fixtures/linter/passing.sql",
+        "test/fixtures/linter/indentation_errors.sql",
+        "test/fixtures/linter/comma_errors.sql",
+    ]
+    ordered = runner.ParallelRunner._order_largest_first(fnames)
+    assert sorted(ordered) == sorted(fnames)
+    sizes = [os.path.getsize(fname) for fname in ordered]
+    assert sizes == sorted(sizes, reverse=True)
+
+
+def test__linter__parallel_worker_utilisation(monkeypatch):
+    """The time each worker is busy is recorded in the result."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    result = Linter(dialect="ansi").lint_paths(
+        ("test/fixtures/linter/multiple_files",), processes=2
+    )
+    utilisation = result.worker_utilisation()
+    assert utilisation
+    assert all(0 < value <= 1 for value in utilisation.values())
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test__linter__lint_paths_without_retaining_files(processes):
+    """Without retaining files, the summaries match those of a normal lint."""
+    paths = (
+        "test/fixtures/linter/multiple_files",
+        "test/fixtures/linter/comma_errors.sql",
+    )
+    lntr = Linter(dialect="ansi")
+    expected = lntr.lint_paths(paths, processes=processes)
+    result = lntr.lint_paths(paths, processes=processes, retain_files=False)
+    assert all(linted_dir.files == [] for linted_dir in result.paths)
+    assert result.stats() == expected.stats()
+    assert result.num_violations() == expected.num_violations()
+    assert set(result.timing_summary()) == set(expected.timing_summary())
+    assert (
+        result.timing_summary()["parsing"]["cnt"]
+        == expected.timing_summary()["parsing"]["cnt"]
+    )
+    assert result.parse_statistics_summary() == expected.parse_statistics_summary()
+
+
+def test__linter__parallel_skip_large_file(caplog):
+    """Files skipped within a worker are logged rather than reported as errors."""
+    config = FluffConfig(
+        overrides={"dialect": "ansi", "large_file_skip_byte_limit": 10}
+    )
+    lint_runner = runner.MultiThreadRunner(Linter(config=config), config, processes=1)
+    with caplog.at_level(logging.WARNING, logger="sqlfluff.linter"):
+        results = list(
+            lint_runner.run(["test/fixtures/linter/comma_errors.sql"], fix=False)
+        )
+    assert results == []
+    assert "Skipping to avoid parser lock" in caplog.text
+    assert "internal error" not in caplog.text
+
+
 @pytest.mark.parametrize(
     "mock_cpu,in_processes,exp_processes",
     [
@@ -400,6 +576,125 @@ def test__linter__empty_file():
     assert not parsed.violations
 
 
+def test__linter__parse_memo_statistics():
+    """Test the match memo counters are reported separately from timings."""
+    lntr = Linter(dialect="ansi")
+    parsed = lntr.parse_string("select a, b from c join d using (e)\n")
+    assert parsed.parse_statistics["parse memo hits"] > 0
+    assert parsed.parse_statistics["parse memo misses"] > 0
+    assert "parse memo hits" not in parsed.time_dict
+    result = lntr.lint_paths(
+        (
+            "test/fixtures/linter/indentation_errors.sql",
+            "test/fixtures/cli/passing_a.sql",
+        )
+    )
+    statistics = result.parse_statistics_summary()
+    files = [file for dir in result.paths for file in dir.files]
+    assert statistics["parse memo hits"] == sum(
+        file.parse_statistics["parse memo hits"] for file in files
+    )
+    assert "parse memo hits" not in result.timing_summary()
+
+
+REPARSE_SQL = "SELECT a, b FROM c;\nSELECT d + 1 FROM e\nWHERE f;\n\nSELECT g FROM h;\n"
+
+
+@pytest.mark.parametrize(
+    "edited_sql",
+    [
+        # Edit within a statement.
+        REPARSE_SQL.replace("d + 1", "d + 12"),
+        # Edit the first and last statements.
+        REPARSE_SQL.replace("SELECT a,", "SELECT z, a,"),
+        REPARSE_SQL.replace("g FROM h", "g FROM h AS i"),
+        # Add and remove statements.
+        REPARSE_SQL + "SELECT j\n",
+        REPARSE_SQL.replace("SELECT d + 1 FROM e\nWHERE f;\n", ""),
+        # Remove a delimiter, which merges two statements.
+        REPARSE_SQL.replace("FROM c;", "FROM c"),
+        # Edits which can't be parsed.
+        REPARSE_SQL.replace("d + 1", "d +"),
+        REPARSE_SQL.replace("d + 1", "(d + 1"),
+    ],
+)
+def test__linter__reparse_string(edited_sql):
+    """Test reparsing an edited string gives the same result as parsing it."""
+    lntr = Linter(dialect="ansi")
+    previous = lntr.parse_string(REPARSE_SQL)
+    reparsed = lntr.reparse_string(previous, edited_sql)
+    parsed = lntr.parse_string(edited_sql)
+
+    def _positions(tree):
+        return [
+            (
+                seg.get_type(),
+                seg.raw,
+                seg.pos_marker.source_slice,
+                seg.pos_marker.templated_slice,
+                seg.pos_marker.working_loc,
+            )
+            for seg in tree.recursive_crawl_all()
+        ]
+
+    if parsed.tree:
+        assert _positions(reparsed.tree) == _positions(parsed.tree)
+    else:
+        assert reparsed.tree is None
+    assert [str(v) for v in reparsed.violations] == [str(v) for v in parsed.violations]
+
+
+@pytest.mark.parametrize(
+    "sql,log_message",
+    [
+        (REPARSE_SQL * 3, "chunks of statements with 2 processes"),
+        # Chunks which can't be parsed separately.
+        (REPARSE_SQL * 3 + "SELECT (a;\n", "Unable to parse statements separately"),
+        # Templated blocks may span statements.
+        ("{% if true %}" + REPARSE_SQL * 3 + "{% endif %}", None),
+    ],
+)
+def test__linter__parse_processes(sql, log_message, caplog):
+    """Test parsing statements in parallel gives the same result as in series."""
+
+    def _parse(processes):
+        lntr = Linter(
+            config=FluffConfig(
+                overrides={"dialect": "ansi", "parse_processes": processes}
+            )
+        )
+        return lntr.parse_string(sql)
+
+    parsed = _parse(1)
+    with caplog.at_level(logging.INFO, logger="sqlfluff.linter"):
+        parsed_in_parallel = _parse(2)
+    if log_message:
+        assert log_message in caplog.text
+    else:
+        assert "chunks of statements" not in caplog.text
+    assert [str(v) for v in parsed_in_parallel.violations] == [
+        str(v) for v in parsed.violations
+    ]
+    if parsed.tree:
+        assert parsed_in_parallel.tree.stringify() == parsed.tree.stringify()
+
+
+def test__linter__reparse_string_reuses_statements():
+    """Test reparsing only parses the edited statement."""
+    lntr = Linter(dialect="ansi")
+    previous = lntr.parse_string(REPARSE_SQL)
+    reparsed = lntr.reparse_string(previous, REPARSE_SQL.replace("d + 1", "d + 12"))
+    assert (
+        reparsed.parse_statistics["parse memo misses"]
+        < previous.parse_statistics["parse memo misses"]
+    )
+    # Unchanged statements are copies from the previous tree.
+    old_statement = previous.tree.get_children("statement")[0]
+    new_statement = reparsed.tree.get_children("statement")[0]
+    assert new_statement is not old_statement
+    assert new_statement.uuid == old_statement.uuid
+
+
 @pytest.mark.parametrize(
     "ignore_templated_areas,check_tuples",
     [
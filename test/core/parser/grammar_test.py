@@ -160,6 +160,26 @@ def test__parser__grammar__base__look_ahead_match(
     assert result_match.matched_segments == expected_result
 
 
+def test__parser__grammar__base__look_ahead_index(generate_test_segments):
+    """Test look ahead matching shares the index of the buffer."""
+    seg_list = generate_test_segments(["bar", " ", "foo", " ", "bar", " ", "foo"])
+    matchers = [StringParser("foo", KeywordSegment)]
+    with RootParseContext(dialect=None) as ctx:
+        index, offset = ctx.memo.first_token_index(seg_list)
+        assert offset == 0
+        assert index.positions("FOO", 0, 7) == [2, 6]
+        assert index.positions("FOO", 3, 7) == [6]
+        assert index.positions("BAZ", 0, 7) == []
+        # Look ahead on part of the buffer reuses the same index.
+        assert ctx.memo.first_token_index(seg_list[3:6]) == (index, 3)
+        pre, match, _ = BaseGrammar._look_ahead_match(seg_list[3:], matchers, ctx)
+        assert pre == seg_list[3:6]
+        assert match.matched_segments[0].raw == "foo"
+        # But a different buffer gets a new one.
+        other_list = generate_test_segments(["foo"])
+        assert ctx.memo.first_token_index(other_list)[0] is not index
+
+
 def test__parser__grammar__base__ephemeral_segment(seg_list):
     """Test the ephemeral features on BaseGrammar.
 
@@ -340,6 +360,31 @@ def test__parser__grammar_ref_exclude(generate_test_segments, fresh_ansi_dialect
         assert ni.match([ts[1]], parse_context=ctx)
 
 
+def test__parser__grammar_ref_memo(generate_test_segments, fresh_ansi_dialect):
+    """Test the Ref grammar reuses previous match results."""
+    ni = Ref("NakedIdentifierSegment")
+    ts = tuple(generate_test_segments(["foo", "SELECT"]))
+    with RootParseContext(dialect=fresh_ansi_dialect) as ctx:
+        first = ni.match(ts[:1], parse_context=ctx)
+        assert first
+        assert (ctx.memo.hits, ctx.memo.misses) == (0, 1)
+        # The same segments should give back the same result.
+        assert ni.match(ts[:1], parse_context=ctx) is first
+        assert (ctx.memo.hits, ctx.memo.misses) == (1, 1)
+        # Failures are remembered too.
+        assert not ni.match(ts[1:], parse_context=ctx)
+        assert not ni.match(ts[1:], parse_context=ctx)
+        assert (ctx.memo.hits, ctx.memo.misses) == (2, 2)
+        # Different segment objects, even with the same content, are a miss.
+        other = tuple(generate_test_segments(["foo"]))
+        assert ni.match(other, parse_context=ctx) is not first
+        assert (ctx.memo.hits, ctx.memo.misses) == (2, 3)
+        # Clearing the memo resets the results but not the counters.
+        ctx.memo.clear()
+        assert ni.match(ts[:1], parse_context=ctx) is not first
+        assert (ctx.memo.hits, ctx.memo.misses) == (2, 4)
+
+
 def test__parser__grammar__oneof__copy():
     """Test grammar copying."""
     bs = StringParser("bar", KeywordSegment)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from sqlfluff.core.parser.helpers import trim_non_code_segments, iter_indices
+from sqlfluff.core.parser.helpers import trim_non_code_segments
 
 
 @pytest.mark.parametrize(
@@ -30,18 +30,3 @@ def test__parser__helper_trim_non_code_segments(
     assert [elem.raw for elem in pre] == list(token_list[:pre_len])
     assert [elem.raw for elem in mid] == list(token_list[pre_len : pre_len + mid_len])
     assert [elem.raw for elem in post] == list(token_list[len(seg_list) - post_len :])
-
-
-@pytest.mark.parametrize(
-    "seq,val,indices",
-    [
-        ([], 1, []),
-        ([0, 1, 0], 2, []),
-        ([0, 1, 0], 1, [1]),
-        ([0, 1, 0], 0, [0, 2]),
-    ],
-)
-def test__parser__helper_iter_indices(seq, val, indices):
-    """Test iter_indices."""
-    res = list(iter_indices(seq, val))
-    assert res == indices
@@ -1,5 +1,6 @@
 """The Test file for The New Parser (Lexing steps)."""
 
+import glob
 import pytest
 import logging
 
@@ -8,8 +9,10 @@ from sqlfluff.core.parser.lexer import (
     StringLexer,
     LexMatch,
     RegexLexer,
+    compile_lexer_matchers,
 )
 from sqlfluff.core import SQLLexError, FluffConfig
+from sqlfluff.core.dialects import dialect_readout
 
 
 def assert_matches(instring, matcher, matchstring):
@@ -122,6 +125,47 @@ def test__parser__lexer_lex_match(caplog):
         assert res.elements[2].raw == "#..#"
 
 
+def test__parser__lexer_compile_lexer_matchers(caplog):
+    """Test compiling matchers into combined regexes."""
+    matchers = [
+        StringLexer("dot", ".", CodeSegment),
+        RegexLexer("test", r"#[^#]*#", CodeSegment),
+        # This can match zero length, which should be skipped.
+        RegexLexer("empty", r"x*", CodeSegment),
+        # This uses a backreference, so can't be combined.
+        RegexLexer("dollar_quote", r"\$(\w*)\$[^\1]*?\$\1\$", CodeSegment),
+        StringLexer("hash", "#", CodeSegment),
+        RegexLexer("code", r"[a-z$]+", CodeSegment),
+    ]
+    steps = compile_lexer_matchers(matchers)
+    assert [len(step.matchers) for step in steps] == [3, 1, 2]
+    assert [step.pattern is None for step in steps] == [False, True, False]
+
+    raw = "..#..#x$a$.$a$#a$$"
+    expected = Lexer.lex_match(raw, matchers)
+    elem_buff = []
+    with caplog.at_level(logging.WARNING, logger="sqlfluff.lexer"):
+        pos = Lexer.lex_match_from(raw, 0, steps, elem_buff)
+    assert "Zero length Lex item returned from 'empty'" in caplog.text
+    assert raw[pos:] == expected.forward_string
+    assert elem_buff == expected.elements
+    assert [e.raw for e in elem_buff] == [".", ".", "#..#", "x", "$a$.$a$", "#", "a$$"]
+
+
+@pytest.mark.parametrize("dialect", [d.label for d in dialect_readout()])
+def test__parser__lexer_compiled_matches_lex_match(dialect):
+    """Test the compiled matchers lex each dialect the same as lex_match."""
+    lexer = Lexer(config=FluffConfig(overrides={"dialect": dialect}))
+    for fname in sorted(glob.glob(f"test/fixtures/dialects/{dialect}/*.sql"))[:10]:
+        with open(fname, encoding="utf8") as f:
+            raw = f.read()
+        expected = Lexer.lex_match(raw, lexer.lexer_matchers)
+        elem_buff = []
+        pos = Lexer.lex_match_from(raw, 0, lexer.lexer_steps, elem_buff)
+        assert raw[pos:] == expected.forward_string
+        assert elem_buff == expected.elements
+
+
 def test__parser__lexer_fail():
     """Test the how the lexer fails and reports errors."""
     lex = Lexer(config=FluffConfig(overrides={"dialect": "ansi"}))
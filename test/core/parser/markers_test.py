@@ -1,5 +1,7 @@
 """Tests for PositionMarker."""
 
+from unittest.mock import patch
+
 import pytest
 
 from sqlfluff.core.templaters import TemplatedFile
@@ -41,3 +43,23 @@ def test_markers__setting_position_working():
     pos = PositionMarker(slice(2, 5), slice(2, 5), templ, 4, 4)
     # Can we NOT infer when we're told.
     assert pos.working_loc == (4, 4)
+
+
+def test_markers__working_position_lazy():
+    """The working position is only inferred when it's needed."""
+    templ = TemplatedFile.from_string("foo\nbar")
+    with patch.object(
+        TemplatedFile,
+        "get_line_pos_of_char_pos",
+        autospec=True,
+        side_effect=TemplatedFile.get_line_pos_of_char_pos,
+    ) as get_line_pos:
+        pos = PositionMarker(slice(4, 7), slice(4, 7), templ)
+        parent = PositionMarker.from_child_markers(pos)
+        assert get_line_pos.call_count == 0
+        assert parent.working_loc == (2, 1)
+        assert (parent.working_line_no, parent.working_line_pos) == (2, 1)
+        assert get_line_pos.call_count == 1
+    # Markers still compare by value, including the working position.
+    assert parent == pos
+    assert parent != PositionMarker(slice(4, 7), slice(4, 7), templ, 3, 1)
@@ -1,5 +1,7 @@
 """The Test file for The New Parser (Base Segment Classes)."""
 
+import multiprocessing
+
 import pytest
 
 from sqlfluff.core.parser import (
@@ -9,6 +11,8 @@ from sqlfluff.core.parser import (
     BaseFileSegment,
 )
 from sqlfluff.core.parser.segments.base import PathStep
+from sqlfluff.core.linter import Linter
+from sqlfluff.core.rules import LintFix
 from sqlfluff.core.templaters import TemplatedFile
 from sqlfluff.core.parser.context import RootParseContext
 
@@ -174,6 +178,48 @@ def test__parser__base_segments_base_compare():
     assert ds1 != dsa2
 
 
+def test__parser__raw_segments_compact():
+    """Raw segments only hold the state they need."""
+    template = TemplatedFile.from_string("foobar")
+    marker = PositionMarker(slice(0, 6), slice(0, 6), template)
+    # The source and templated slices are the same, so are shared.
+    assert marker.source_slice is marker.templated_slice
+    rs1 = RawSegment("FOO", marker)
+    rs2 = RawSegment("foo", marker, type="bar", trim_chars=("f",))
+    # Uppercase content doesn't need a copy.
+    assert rs1.raw_upper is rs1.raw
+    assert rs2.raw_upper == "FOO"
+    # Optional attributes are only set on instances where they're given.
+    assert set(vars(rs1)) == {"_raw", "_raw_upper", "pos_marker", "uuid"}
+    assert (rs1.get_type(), rs1.trim_chars, rs1.source_fixes) == ("raw", None, [])
+    assert (rs2.get_type(), rs2.raw_trimmed()) == ("bar", "oo")
+    # Properties of segments with children are still valid.
+    assert rs1.descendant_type_set == rs1.direct_descendant_type_set == set()
+    assert rs1.raw_segments_with_ancestors == []
+    assert rs1.first_non_whitespace_segment_raw_upper == "FOO"
+    assert RawSegment(" ", marker).first_non_whitespace_segment_raw_upper is None
+
+
+def _segment_id_in_process(_):
+    return RawSegment("foobar").uuid
+
+
+def test__parser__base_segments_uuid():
+    """Segment ids are unique, including between processes."""
+    template = TemplatedFile.from_string("foobar")
+    rs1 = RawSegment("foobar", PositionMarker(slice(0, 6), slice(0, 6), template))
+    rs2 = RawSegment("foobar", PositionMarker(slice(0, 6), slice(0, 6), template))
+    assert rs1.uuid != rs2.uuid
+    assert DummySegment([rs1]).uuid != DummySegment([rs1]).uuid
+    # An id can be passed through explicitly.
+    assert RawSegment("foobar", uuid=rs1.uuid).uuid == rs1.uuid
+    # Segments from different worker processes can be combined (e.g. when
+    # parsing statements in parallel), so their ids mustn't collide.
+    with multiprocessing.Pool(2) as pool:
+        ids = pool.map(_segment_id_in_process, range(4), chunksize=1)
+    assert len(set(ids + [rs1.uuid, rs2.uuid])) == 6
+
+
 def test__parser__base_segments_file(raw_seg_list):
     """Test BaseFileSegment to behave as expected."""
     base_seg = BaseFileSegment(raw_seg_list, fname="/some/dir/file.sql")
@@ -203,3 +249,33 @@ def test__parser__raw_segments_with_ancestors(raw_seg_list):
         ),
         (raw_seg_list[1], [PathStep(test_seg, 1, 2)]),
     ]
+
+
+def test__parser__base_segments_raw_hash(raw_seg_list):
+    """The hash of a segment only depends on its raw."""
+    test_seg = DummySegment([DummyAuxSegment(raw_seg_list[:1]), raw_seg_list[1]])
+    assert test_seg.raw_hash == RawSegment("foobar.barfoo").raw_hash
+    assert test_seg.raw_hash != DummySegment(raw_seg_list[::-1]).raw_hash
+    assert RawSegment("").raw_hash != RawSegment("\0").raw_hash
+
+
+def test__parser__base_segments_apply_fixes_reuses_unchanged(fresh_ansi_dialect):
+    """Applying fixes only rebuilds the parts of the tree which change."""
+    tree = (
+        Linter(dialect="ansi").parse_string("select a from b;\nselect c from d;\n").tree
+    )
+    first, second = tree.recursive_crawl("statement")
+    column = next(first.recursive_crawl("naked_identifier"))
+    fixes = BaseSegment.compute_anchor_edit_info(
+        [LintFix.replace(column, [column.edit("aa")])]
+    )
+    new_tree, _, _ = tree.apply_fixes(fresh_ansi_dialect, "L000", fixes)
+    assert new_tree.raw == "select aa from b;\nselect c from d;\n"
+    assert new_tree.raw_hash == RawSegment(new_tree.raw).raw_hash
+    new_first, new_second = new_tree.recursive_crawl("statement")
+    # The second statement hasn't moved, so is reused as it is...
+    assert new_second is second
+    # ...but what follows the fix on the same line is repositioned.
+    assert new_first is not first
+    from_keyword = [seg for seg in new_first.raw_segments if seg.raw == "from"][0]
+    assert from_keyword.pos_marker.working_loc == (1, 11)
@@ -4,6 +4,7 @@ import pytest
 from sqlfluff.core.config import FluffConfig
 
 from sqlfluff.core.linter.linter import Linter
+from sqlfluff.core.rules.base import crawl_rules
 from sqlfluff.core.rules.context import RuleContext
 from sqlfluff.core.rules.crawlers import (
     ParentOfSegmentCrawler,
@@ -51,3 +52,36 @@ def test_rules_crawlers(CrawlerType, crawler_kwargs, raw_sql_in, target_raws_out
     result_raws = [context.segment.raw for context in crawler.crawl(root_context)]
 
     assert result_raws == target_raws_out
+
+
+@pytest.mark.parametrize(
+    "raw_sql_in",
+    [
+        "SELECT a+b, c FROM tbl AS t\nWHERE   d\n",
+        "select a from b;\nselect c frm d e;\n",
+    ],
+)
+def test_rules_crawl_rules(raw_sql_in):
+    """Test crawling all rules at once matches crawling them one at a time."""
+    cfg = FluffConfig(overrides={"dialect": "ansi"})
+    linter = Linter(config=cfg)
+    root = linter.parse_string(raw_sql_in).tree
+    rules = linter.get_ruleset()
+    kwargs = dict(
+        dialect=cfg.get("dialect_obj"),
+        fix=False,
+        templated_file=TemplatedFile(raw_sql_in, "<test-case>"),
+        ignore_mask=[],
+        fname=None,
+        config=cfg,
+    )
+
+    results = crawl_rules(rules, root, **kwargs)
+
+    assert len(results) == len(rules)
+    for rule, (vs, fixes) in zip(rules, results):
+        expected_vs, _, expected_fixes, _ = rule.crawl(root, **kwargs)
+        assert [v.get_info_dict() for v in vs] == [
+            v.get_info_dict() for v in expected_vs
+        ]
+        assert [repr(f) for f in fixes] == [repr(f) for f in expected_fixes]
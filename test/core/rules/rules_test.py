@@ -3,7 +3,7 @@ import pytest
 
 from sqlfluff.core import Linter
 from sqlfluff.core.parser.markers import PositionMarker
-from sqlfluff.core.rules import BaseRule, LintResult, LintFix
+from sqlfluff.core.rules import BaseRule, LintResult, LintFix, RuleSet
 from sqlfluff.core.rules import get_ruleset
 from sqlfluff.core.rules.crawlers import RootOnlyCrawler, SegmentSeekerCrawler
 from sqlfluff.core.rules.doc_decorators import (
@@ -18,7 +18,11 @@ from sqlfluff.utils.testing.rules import get_rule_from_set
 
 from test.fixtures.rules.custom.L000 import Rule_L000
 from test.fixtures.rules.custom.S000 import Rule_S000
-from sqlfluff.core.rules.loader import get_rules_from_path
+from sqlfluff.core.rules.loader import (
+    get_rule_manifest_from_path,
+    get_rules_from_path,
+    load_rule_manifest,
+)
 
 
 class Rule_T042(BaseRule):
@@ -215,6 +219,28 @@ def test_std_rule_import_fail_bad_naming():
     e.match("Rule classes must be named in the format of")
 
 
+def test_rule_manifest_up_to_date():
+    """Check the committed manifest of standard rules matches the rules."""
+    assert load_rule_manifest() == get_rule_manifest_from_path(), (
+        "The rule manifest is out of date. Please run "
+        "'python test/generate_rule_manifest.py' to update it."
+    )
+
+
+def test_rule_set_lazy_registration():
+    """Check rules registered from a manifest are only loaded when selected."""
+    rule_set = RuleSet(name="lazy", config_info={})
+    for code, manifest_entry in load_rule_manifest().items():
+        rule_set.register_lazy(code, manifest_entry)
+    assert all(rule["cls"] is None for rule in rule_set._register.values())
+    cfg = FluffConfig(overrides={"dialect": "ansi", "rules": "L001"})
+    rules = rule_set.get_rulelist(config=cfg)
+    assert [rule.code for rule in rules] == ["L001"]
+    assert [code for code, rule in rule_set._register.items() if rule["cls"]] == [
+        "L001"
+    ]
+
+
 def test_rule_set_return_informative_error_when_rule_not_registered():
     """Assert that a rule that throws an exception returns it as a validation."""
     cfg = FluffConfig(overrides={"dialect": "ansi"})
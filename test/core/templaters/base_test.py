@@ -295,6 +295,37 @@ def test__templated_file_templated_slice_to_source_slice(
     assert (is_literal, source_slice) == (literal_test, out_slice)
 
 
+@pytest.mark.parametrize(
+    "source_slice,raw_slice_idxs",
+    [
+        # Within a slice.
+        (slice(2, 5), [0]),
+        # Zero length, at the start of a slice.
+        (slice(10, 10), [1]),
+        # Ending at the boundary of the next slice.
+        (slice(5, 10), [0]),
+        # Spanning slices.
+        (slice(5, 11), [0, 1]),
+        (slice(5, 20), [0, 1, 2]),
+        (slice(10, 25), [1, 2]),
+        # At the end of the file.
+        (slice(25, 25), []),
+    ],
+)
+def test__templated_file_raw_slices_spanning_source_slice(source_slice, raw_slice_idxs):
+    """Test TemplatedFile.raw_slices_spanning_source_slice."""
+    file = TemplatedFile(
+        source_str="x" * 25,
+        templated_str="x" * 20,
+        sliced_file=SIMPLE_SLICED_FILE,
+        raw_sliced=SIMPLE_RAW_SLICED_FILE,
+        fname="test",
+    )
+    assert file.raw_slices_spanning_source_slice(source_slice) == [
+        SIMPLE_RAW_SLICED_FILE[idx] for idx in raw_slice_idxs
+    ]
+
+
 @pytest.mark.parametrize(
     "file,expected_result",
     [
@@ -8,15 +8,23 @@ loops and placeholders.
 
 from collections import defaultdict
 import logging
+import os
 from typing import List, NamedTuple
+from unittest.mock import patch
 
 import pytest
+from jinja2 import Environment
 from jinja2.exceptions import UndefinedError
 
 from sqlfluff.core.errors import SQLFluffSkipFile, SQLTemplaterError
 from sqlfluff.core.templaters import JinjaTemplater
 from sqlfluff.core.templaters.base import RawFileSlice, TemplatedFile
-from sqlfluff.core.templaters.jinja import DummyUndefined, JinjaAnalyzer
+from sqlfluff.core.templaters.jinja import (
+    DummyUndefined,
+    JinjaAnalyzer,
+    _jinja_env_cache,
+    _macro_code_cache,
+)
 from sqlfluff.core import Linter, FluffConfig
 
 
@@ -1291,6 +1299,60 @@ def test__templater_jinja_large_file_check():
     assert "Length of file" in str(excinfo.value)
 
 
+def _macro_config(macro_path, **overrides):
+    return FluffConfig(
+        configs={
+            "templater": {"jinja": {"load_macros_from_path": str(macro_path)}},
+        },
+        overrides={"dialect": "ansi", **overrides},
+    )
+
+
+def _count_macro_compiles(templater, config, in_str="SELECT {{ col() }}"):
+    """Process a string, returning the output and times macros were compiled."""
+    with patch.object(
+        Environment, "compile", autospec=True, side_effect=Environment.compile
+    ) as compile_:
+        templated_file, violations = templater.process(
+            in_str=in_str, fname="<string>", config=config
+        )
+    assert not violations
+    compiles = [c for c in compile_.call_args_list if "macro" in c.args[1]]
+    return str(templated_file), len(compiles)
+
+
+def test__templater_jinja_macros_cached(tmp_path):
+    """Macro files are only compiled again when they change."""
+    macro_file = tmp_path / "macros.sql"
+    macro_file.write_text("{% macro col() %}a{% endmacro %}")
+    config = _macro_config(macro_file)
+    templater = JinjaTemplater()
+    assert _count_macro_compiles(templater, config) == ("SELECT a", 1)
+    # Other files (and configs) reuse the compiled macros.
+    assert _count_macro_compiles(JinjaTemplater(), _macro_config(macro_file)) == (
+        "SELECT a",
+        0,
+    )
+    # Changing the file is picked up.
+    macro_file.write_text("{% macro col() %}bb{% endmacro %}")
+    stat = macro_file.stat()
+    os.utime(macro_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _count_macro_compiles(templater, config) == ("SELECT bb", 1)
+
+
+def test__templater_jinja_macros_bytecode_cache(tmp_path):
+    """With caching enabled, compiled macros are reused between runs."""
+    macro_file = tmp_path / "macros.sql"
+    macro_file.write_text("{% macro col() %}a{% endmacro %}")
+    config = _macro_config(macro_file, cache=True, cache_dir=str(tmp_path / "cache"))
+    assert _count_macro_compiles(JinjaTemplater(), config) == ("SELECT a", 1)
+    assert os.listdir(tmp_path / "cache" / "jinja")
+    # Simulate a new run, which only has the bytecode cache.
+    _jinja_env_cache.clear()
+    _macro_code_cache.clear()
+    assert _count_macro_compiles(JinjaTemplater(), config) == ("SELECT a", 0)
+
+
 @pytest.mark.parametrize(
     "ignore, expected_violation",
     [
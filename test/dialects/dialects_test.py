@@ -4,11 +4,13 @@ Any files in the test/fixtures/dialects/ directory will be picked up
 and automatically tested against the appropriate dialect.
 """
 import logging
+import os
 from typing import Any, Dict, Optional
 import pytest
 
 from sqlfluff.core.parser import Parser, Lexer
 from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core import dialects
 from sqlfluff.core.parser.segments.base import BaseSegment
 
 from ..conftest import (
@@ -115,3 +117,27 @@ def test__dialect__base_parse_struct(
         "'python test/generate_parse_fixture_yml.py' to create YAML files "
         "in test/fixtures/dialects."
     )
+
+
+def test__dialect__snapshot(tmp_path, monkeypatch):
+    """Test that dialect snapshots are stored and loaded."""
+    monkeypatch.setattr(dialects, "dialect_snapshot_dir", lambda: str(tmp_path))
+    # Without a snapshot, we don't load one.
+    assert dialects.load_dialect_snapshot("ansi") is None
+    paths = dialects.warm_dialect_snapshots(["ansi", "postgres"])
+    assert sorted(os.listdir(tmp_path)) == ["ansi.pickle", "postgres.pickle"]
+    assert paths == [str(tmp_path / "ansi.pickle"), str(tmp_path / "postgres.pickle")]
+    # The selector now loads the snapshot, which should be equivalent to
+    # expanding the dialect.
+    dialect = dialects.dialect_selector("postgres")
+    expanded = dialects.load_raw_dialect("postgres").expand()
+    assert dialect.expanded
+    assert dialect.name == expanded.name
+    assert sorted(dialect._library) == sorted(expanded._library)
+    # And can be used to parse.
+    config = FluffConfig(overrides={"dialect": "postgres"})
+    tokens, _ = Lexer(config=config).lex("select a::int from b")
+    parsed = Parser(config=config).parse(tokens)
+    assert "unparsable" not in parsed.descendant_type_set
+    # Dialects without snapshots are still expanded as normal.
+    assert dialects.dialect_selector("mysql").expanded
@@ -0,0 +1,25 @@
+"""Utility to generate the manifest of the standard rules.
+
+The manifest allows the standard rules to be registered without importing
+them, so it must be regenerated whenever a rule is added, or its groups,
+description or config keywords change.
+"""
+import json
+
+from sqlfluff.core.rules.loader import (
+    STANDARD_RULE_MANIFEST_PATH,
+    get_rule_manifest_from_path,
+)
+
+
+def main():
+    """Write the manifest of the standard rules."""
+    manifest = get_rule_manifest_from_path()
+    with open(STANDARD_RULE_MANIFEST_PATH, "w", encoding="utf8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        manifest_file.write("\n")
+    print(f"Wrote {len(manifest)} rules to {STANDARD_RULE_MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()